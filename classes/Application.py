@@ -11,8 +11,8 @@
 #															#
 ############################################################
 
-import os, json, re, time, builtins
-from classes import Cli, DepListBuilder, General
+import os, json, re, time, builtins, concurrent.futures
+from classes import Cli, CrawlCache, DepListBuilder, DepManifest, FileFingerprints, General, IgnoreRules, IncludeScanner, RuleTemplate, StatCache, TreeSnapshot, TreeWalker, Watcher
 
 class Application :
 	"""This is the application's main class."""
@@ -34,7 +34,40 @@ class Application :
 	# class variable with the basename of the file that has the project specific cnfiguration
 	project_config_basename_ = "dependency_config.json"
 
-	def __init__(self) :
+	# class variable with the basename of the file, in the project's root directory, with the project specific ignore rules
+	ignore_file_basename_ = "dependency_ignore.txt"
+
+	# class variable with the basename of the file with the project's crawl cache
+	# NOTE: stored in the same directory as the project's configuration file
+	crawl_cache_basename_ = "dependency_cache.db"
+
+	# class variable with the basename of the file with the record of the dependency files generated for the project
+	# NOTE: stored in the same directory as the project's configuration file
+	manifest_basename_ = "dependency_manifest.json"
+
+	# class variable with the basename of the aggregated dependency files, used by the "single" and "directory" output modes
+	aggregate_basename_ = "deps.mk"
+
+	# class variable with the method that writes a source file's dependency file in each output format
+	# each method receives the source file's basename and its dependency list, and returns 1 if the file was written,
+	# 0 if it already had the content or -1 if it failed
+	output_backends_ = {"template" : "generateDepFile", "ninja" : "generateNinjaDepFile"}
+
+	# class variable with the method that finds the dependency list in an existing dependency file in each output format
+	# each method receives the source file's basename and the dependency file's content, and returns a list() with the
+	# dependent files' paths or None if it couldn't be found
+	# NOTE: these methods can run in several threads at the same time
+	input_backends_ = {"template" : "parseTemplateDepFile", "ninja" : "parseNinjaDepFile"}
+
+	# class variable with the configurations a dependency file's content depends on, besides the rule template, which
+	# are recorded in the manifest
+	emitted_config_keys_ = ["dependency_paths", "include_source", "output_format", "ninja_target"]
+
+	# class variable with the regex matching each dependent file in a Ninja depfile, where spaces are escaped by a "\"
+	ninja_item_regex_ = re.compile("(?:\\\\.|[^\\s\\\\])+")
+
+	# "interactive" should be False if the program runs without the interactive prompt (ex: the "--once" mode)
+	def __init__(self, interactive = True) :
 		# create and store the General class' JSON decoder
 		General.General.json_decoder_ = json.JSONDecoder()
 
@@ -51,9 +84,95 @@ class Application :
 		# NOTE: populated in scanSrcFiles()
 		self.files = dict()
 
+		# instance variable to store the cache of the modify time and size of the files checked, shared with the DepListBuilder class
+		# used to avoid accessing the file system again for files already checked in the current scan cycle
+		# NOTE: cleared in populateFiles() and invalidated file by file in waitForChanges()
+		self.stat_cache = StatCache.StatCache()
+
+		# instance variable to store the fingerprints of the files' content, shared with the DepListBuilder class
+		# used to ignore the modifications that don't change a file's content (ex: switching git branches back and forth)
+		# NOTE: only used if the "content_hash" configuration is True
+		self.file_fingerprints = FileFingerprints.FileFingerprints(self.stat_cache)
+
 		# instance variable to store the configuration in effect
 		self.config = dict()
 
+		# instance variable to store the modify time of each dependent file that has been checked for each source file
+		# this will be used to prevent the rebuild of a file's dependency list every cycle
+		# in the cases where the file was modified after the dependency file was generated,
+		# but the change didn't affect it's dependent files
+		# format: [src_file_basename][file's absolute path] = mtime of last check
+		self.checked_mtimes = dict()
+
+		# instance variable to store the basenames of the source files whose entries in self.checked_mtimes may have
+		# changed since they were last saved in the crawl cache
+		self.dirty_checked_mtimes = set()
+
+		# instance variable to store the persistent cache of the information obtained by crawling files
+		# NOTE: only used if the "persistent_cache" configuration is True
+		self.crawl_cache = None
+
+		# instance variable to store the record of the dependency files generated for the project, with the dependency
+		# list and configuration each one was written with
+		# used to find the dependency lists of the existing dependency files without parsing them
+		# NOTE: created once the configuration is loaded
+		self.manifest = None
+
+		# instance variable to store the reverse index of the dependency lists, which maps each dependent file to the
+		# dependency files whose lists contain it
+		# used to only check the source files affected by the files that changed since the last cycle
+		# format: [dependent file abs path, or basename for lists deduced from the dependency files] = set(dependency file basenames)
+		# NOTE: populated in scanSrcFiles(), through indexDependencyList()
+		self.dependents_index = dict()
+
+		# instance variable to store the modify time and size of each tracked file (source, dependency, rule template
+		# and dependent files) as of the last cycle in which the changes weren't reported by the watcher
+		# used to find the files that changed since then by checking each file only once
+		# format: [file abs path] = tuple(modify time, size) or None if the path wasn't a file
+		self.tracked_stats = dict()
+
+		# instance variable to store the dependent files that couldn't be found for each source file, as last reported
+		# used to only report these errors once, instead of every time the source file's dependency list is built
+		# format: [src_file_basename] = dict() with the same format as the failed files returned by DepListBuilder.buildDependencyList()
+		self.reported_failures = dict()
+
+		# instance variable to store the compiled Makefile rule template, used to build the dependency files and to
+		# find the dependent files in the existing ones
+		# NOTE: compiled again whenever the dependency_template.txt file changes
+		self.rule_template = RuleTemplate.RuleTemplate(self.stat_cache)
+
+		# instance variable to store the dependency lists used to generate the existing dependency files that haven't
+		# been collected yet, and the workers finding them in parallel (if any)
+		# format: [dep_file_basename] = list() with the list from the manifest, concurrent.futures.Future with the list,
+		# or tuple(src_file_basename, dep file abs path)
+		# NOTE: populated in startDeducingLists() and collected by takeDeducedList()
+		self.deduced_lists = dict()
+		self.deduce_executor = None
+
+		# instance variable to store the configuration each existing dependency file was written with, as recorded in
+		# the manifest, for the dependency lists deduced in the current scan cycle
+		# format: [dep_file_basename] = dict() with format: [config key] = value
+		# NOTE: populated in startDeducingLists()
+		self.emitted_configs = dict()
+
+		# instance variable to store the rule of each source file written, or to be written, to an aggregated dependency file
+		# NOTE: only used if the "output_mode" configuration is "single" or "directory"
+		# format: [src_file_basename] = tuple(aggregated dependency file abs path, rule)
+		self.aggregate_rules = dict()
+
+		# instance variable to store the content of each aggregated dependency file, as last written or confirmed
+		# format: [aggregated dependency file abs path] = content
+		self.aggregate_contents = dict()
+
+		# instance variable to store the source files whose rules were generated in the current scan cycle and are waiting
+		# for their aggregated dependency files to be written
+		# format: [src_file_basename] = the source file's previous rule, or None if it isn't known
+		self.pending_rules = dict()
+
+		# instance variable to store the event driven watcher of the project's directory tree
+		# NOTE: only used if the "watch_mode" configuration is "inotify" and while the scan is running
+		self.watcher = None
+
 		# build a set() with all the relevant files' basenames
 		self.relevant_basenames = set(["*.h"])
 		self.relevant_basenames.add("*." + Application.dep_extension_)
@@ -61,11 +180,20 @@ class Application :
 		for src_extension in Application.src_extensions_ :
 			self.relevant_basenames.add("*." + src_extension)
 
-		# show the welcome message
-		self.cli_obj.printMsg(1, "# # # # # # # # # # # # # # # # # # # # # # # # #\n\nWelcome to the C/C++ Dependency Generator.\n\nType \"help\" for a list of valid commands.\n\n# # # # # # # # # # # # # # # # # # # # # # # # #", False)
+		# instance variable to store the patterns used to build the ignore rules currently in effect
+		# NOTE: populated in updateIgnoreRules()
+		self.ignore_patterns = None
+
+		# instance variable to store the snapshot of the relevant files in the project's directory tree
+		# used to only list the directories that changed since the previous search of the tree
+		self.tree_snapshot = TreeSnapshot.TreeSnapshot(self.project_root, self.relevant_basenames)
+
+		# show the welcome message, unless the program isn't interactive
+		if (interactive) :
+			self.cli_obj.printMsg(1, "# # # # # # # # # # # # # # # # # # # # # # # # #\n\nWelcome to the C/C++ Dependency Generator.\n\nType \"help\" for a list of valid commands.\n\n# # # # # # # # # # # # # # # # # # # # # # # # #", False)
 
 		# check if the program's configuration validation file exists
-		config_val_path = os.path.abspath(self.program_root + "\\data\\config_validation.json")
+		config_val_path = os.path.abspath(os.path.join(self.program_root, "data", "config_validation.json"))
 		if (not os.path.isfile(config_val_path)) :
 			# the file doesn't exist
 			# print error message
@@ -88,11 +216,21 @@ class Application :
 			raise KeyboardInterrupt
 
 		# create an instance of the DepListBuilder class
-		self.dep_list_builder_obj = DepListBuilder.DepListBuilder(self.project_root, self.config.copy())
+		self.dep_list_builder_obj = DepListBuilder.DepListBuilder(self.project_root, self.config.copy(), self.stat_cache, self.file_fingerprints)
 
 		# build the DepListBuilder's search paths
 		self.dep_list_builder_obj.buildSearchPaths()
 
+		# load the compilation database with the include directories of each source file, if one is used
+		self.updateCompileCommands("compile_commands")
+
+		# load the information obtained by crawling files in previous runs of the program, if it was stored
+		self.openCrawlCache()
+
+		# create the record of the dependency files generated for the project
+		# NOTE: the record is read at the start of each scan
+		self.manifest = DepManifest.DepManifest(self.buildManifestPath())
+
 	# executes the program's core task
 	def run(self) :
 		# controls the main loop
@@ -125,6 +263,65 @@ class Application :
 		# at this point the program will terminate, so print the outro message
 		self.outroMsg()
 
+	# runs a single pass of the scan of the source files, without the interactive prompt, and prints a summary
+	# "src_names" is a list() with the paths or basenames of the source files to check, or an empty list() to check all of them
+	# NOTE: the project's directory tree is searched only once and no watcher is started
+	# returns the program's exit status: 0 if every dependency file checked is up-to-date, 1 if any source file couldn't be
+	# found or any dependency file couldn't be generated and 2 if the scan couldn't run
+	def runOnce(self, src_names) :
+		# check if the configuration is available
+		if (len(self.config) == 0) :
+			# it isn't
+			return(2)
+
+		try :
+			# find all the relevant files and store them in self.files
+			self.populateFiles()
+
+			# check if the Makefile rule template was found
+			if (self.files["dependency_template"] == "") :
+				# it wasn't
+				# print error message
+				self.cli_obj.printMsg(0, "Couldn't find the file with name \"" + Application.dependency_template_basename_ + "\", containing the Makefile rule template used to build the dependency files.", True)
+
+				return(2)
+
+			# find the source files to check
+			src_basenames = None
+			missing_count = 0
+			if (len(src_names) > 0) :
+				# only the named source files will be checked
+				src_basenames = set()
+				for src_name in src_names :
+					# check if this source file is in the project
+					src_basename = os.path.basename(General.General.standardizePath(src_name))
+					if (src_basename in self.files["source"]) :
+						# it is
+						src_basenames.add(src_basename)
+					else :
+						# it isn't
+						self.cli_obj.printMsg(0, "The source file \"" + src_name + "\" couldn't be found in the project.", True)
+						missing_count += 1
+
+			# check the source files and (re)generate their dependency files, as needed
+			results = self.runScanCycle(dict(), set(), True, src_basenames)
+		finally :
+			# stop finding any pending dependency lists
+			self.stopDeducingLists()
+
+			# store the information obtained in the crawl cache
+			self.saveCrawlCache()
+
+		# print the summary
+		self.cli_obj.printMsg(1, "Checked " + str(len(results["updated"]) + len(results["unchanged"]) + len(results["failed"])) + " source files: " + str(len(results["updated"])) + " dependency files updated, " + str(len(results["unchanged"])) + " up-to-date and " + str(len(results["failed"])) + " failed.", True)
+
+		# check if anything failed
+		if (missing_count > 0 or len(results["failed"]) > 0) :
+			# it did
+			return(1)
+
+		return(0)
+
 	# called when the program terminates to print the outro message
 	def outroMsg(self) :
 		# check if the outro message has been printed already
@@ -137,41 +334,86 @@ class Application :
 			self.cli_obj.outro_msg_printed = True
 
 	# searches for all the relevant files and stores their paths in self.files
+	# NOTE: only the directories modified since the previous search are listed and self.files is updated in place
 	def populateFiles(self) :
-		# NOTE: the program assumes there aren't multiple source, header and dependency files with the same
-		# 		basename but different paths in the same project
-		self.files = dict(source=dict(), relevant=dict(), dependency=dict(), dependency_template="")
-
-		# find all the relevant files
-		found_files = General.General.findFiles(self.relevant_basenames.copy(), self.project_root)
-
-		# add the files found to self.files sorted by designation
-		for found_file_basename in found_files :
-			# get these files' extension
-			aux_pos = found_file_basename.rfind(".")
-			if (aux_pos == -1) :
-				# they don't have an explicit extension
-				found_file_extension = ""
-			else :
-				found_file_extension = found_file_basename[aux_pos + 1:]
+		# the files might have changed in any way since the last search, so discard what is known about them
+		self.stat_cache.clear()
 
-			# check if this extension belongs to the source files
-			if (found_file_extension in Application.src_extensions_) :
-				# it does
-				self.files["source"][found_file_basename] = found_files[found_file_basename]
-			# check if this extension belongs to the relevant files
-			elif (found_file_extension in Application.relevant_extensions_) :
-				# it does
-				self.files["relevant"][found_file_basename] = found_files[found_file_basename]
-			# check if this extension belongs to the dependency files
-			elif (found_file_extension == Application.dep_extension_) :
+		# bring the snapshot of the project's directory tree up-to-date
+		changes = self.tree_snapshot.refresh()
+
+		# check if self.files needs to be (re)built
+		if (len(self.files) == 0) :
+			# it does
+			# NOTE: the program assumes there aren't multiple source, header and dependency files with the same
+			# 		basename but different paths in the same project
+			self.files = dict(source=dict(), relevant=dict(), dependency=dict(), dependency_template="")
+
+			# all the files in the snapshot need to be added
+			added_paths = self.tree_snapshot.getFilePaths()
+		else :
+			# only the new files need to be added
+			added_paths = sorted(changes["added"])
+
+		# remove the files that are no longer in the project's directory tree
+		for file_path in changes["removed"] :
+			self.removeFromFiles(file_path)
+
+		# add the new files to self.files sorted by designation
+		for file_path in added_paths :
+			self.addToFiles(os.path.basename(file_path), file_path)
+
+		# store the information obtained while listing the modified directories
+		# NOTE: the files in the directories that weren't listed again might have been modified, so their
+		# 		information will be obtained from the file system when needed
+		for file_record in changes["listed"].values() :
+			self.stat_cache.seed(file_record)
+
+	# adds a file to the relevant key of self.files, based on its extension
+	# files that aren't relevant are ignored
+	def addToFiles(self, file_basename, file_path) :
+		# get this file's extension
+		aux_pos = file_basename.rfind(".")
+		if (aux_pos == -1) :
+			# it doesn't have an explicit extension
+			file_extension = ""
+		else :
+			file_extension = file_basename[aux_pos + 1:]
+
+		# check if this extension belongs to the source files
+		if (file_extension in Application.src_extensions_) :
+			# it does
+			self.files["source"][file_basename] = file_path
+		# check if this extension belongs to the relevant files
+		elif (file_extension in Application.relevant_extensions_) :
+			# it does
+			self.files["relevant"][file_basename] = file_path
+		# check if this extension belongs to the dependency files
+		elif (file_extension == Application.dep_extension_) :
+			# it does
+			self.files["dependency"][file_basename] = file_path
+		else :
+			# check if this file matches the rule template
+			if (file_basename == Application.dependency_template_basename_) :
 				# it does
-				self.files["dependency"][found_file_basename] = found_files[found_file_basename]
-			else :
-				# check if these files match the rule template
-				if (found_file_basename == Application.dependency_template_basename_) :
-					# they do
-					self.files["dependency_template"] = found_files[found_file_basename]
+				self.files["dependency_template"] = file_path
+
+	# removes a file from self.files, if it's stored there with the provided path
+	def removeFromFiles(self, file_path) :
+		# get this file's basename
+		file_basename = os.path.basename(file_path)
+
+		# loop through the keys of self.files that store files by basename
+		for files_key in ["source", "relevant", "dependency"] :
+			# check if this file is stored in this key
+			if (self.files[files_key].get(file_basename) == file_path) :
+				# it is
+				del self.files[files_key][file_basename]
+
+		# check if this file is the rule template
+		if (self.files["dependency_template"] == file_path) :
+			# it is
+			self.files["dependency_template"] = ""
 
 	# main method that will periodicaly scan the source files and generate
 	# the dependency files as needed
@@ -181,22 +423,46 @@ class Application :
 			# NOTE: all paths will use \ as the directory separator
 			dependency_list = dict()
 
-			# stores the modify time of each dependent file that has been checked for each source file
-			# this will be used to prevent the rebuild of a file's dependency list every cycle
-			# in the cases where the file was modified after the dependency file was generated,
-			# but the change didn't affect it's dependent files
-			# format: [src_file_basename][file's absolute path] = mtime of last check
-			checked_mtimes = dict()
-
 			# used to know whether the loop is in the first iteration or not
 			first_iteration = True
 
+			# stores the absolute paths of the files changed since the last cycle, as reported by the watcher
+			# None means the changes are unknown, so the project's directory tree will be searched
+			# and the tracked files will be checked to find the ones that changed
+			changed_paths = None
+
+			# start with an empty reverse index of the dependency lists
+			self.dependents_index.clear()
+			self.tracked_stats.clear()
+			self.reported_failures.clear()
+
 			# print message
 			self.cli_obj.printMsg(1, "=> Started the scan of the source files.\n=> Press CTRL-C to end the scan.", False)
 
+			# reload the ignore rules, in case the project's ignore file changed
+			self.updateIgnoreRules("ignore_patterns")
+
+			# stores the number of entries excluded by the ignore rules before the first search of this scan
+			skipped_before = TreeWalker.TreeWalker.skipped_
+
+			# start the event driven watcher, if one is configured
+			self.startWatcher()
+
 			while True :
-				# find all the relevant files and store them in self.files
-				self.populateFiles()
+				# check if the changes since the last cycle are unknown
+				if (changed_paths == None) :
+					# they are
+					# find all the relevant files and store them in self.files
+					self.populateFiles()
+
+					# find the files that changed since the last cycle
+					changed_paths = self.findChangedFiles()
+
+				# check if this is the first search of the project's directory tree in this scan
+				if (first_iteration and TreeWalker.TreeWalker.skipped_ > skipped_before) :
+					# it is and entries were excluded by the ignore rules
+					# print message
+					self.cli_obj.printMsg(1, "The search of the project's directory tree skipped " + str(TreeWalker.TreeWalker.skipped_ - skipped_before) + " files and directories matching the ignore rules.", True)
 
 				# check if the Makefile rule template was found
 				if (self.files["dependency_template"] == "") :
@@ -210,234 +476,525 @@ class Application :
 				# check if any source files were found
 				if (len(self.files["source"]) == 0) :
 					# there are no source files
-					# sleep before next cycle
-					self.startSleep(self.config["sleep_timer"])
+					# wait for changes before next cycle
+					changed_paths = self.waitForChanges()
 
 					# move to next cycle
 					continue
 
-				# cross-reference the source and dependency files found and remove any dependency files that
-				# no longer have a matching source file
-				removed_files = self.checkFiles()
+				# check the source files and (re)generate their dependency files, as needed
+				self.runScanCycle(dependency_list, changed_paths, first_iteration)
 
-				# remove from dependency_list any files that are no longer relevant
-				for removed_file_basename in removed_files:
-					if (removed_file_basename in dependency_list) :
-						del dependency_list[removed_file_basename]
+				# no longer in the first iteration of the loop
+				first_iteration = False
 
-				# check if the dependency_list is empty but there are already dependency files generated
-				if (len(dependency_list) == 0 and len(self.files["dependency"]) > 0) :
-					# there are, so this must be the first iteration of this loop
-					# search the existing dependency files and build the dependency lists used to generate them
-					dependency_list = self.deduceDependencyLists()
+				# store the dependent files checked in this cycle in the crawl cache
+				self.saveCrawlCache()
 
-				# loop through each source file
-				for src_file_basename in self.files["source"] :
-					# grab this source file's name and extension
-					aux_pos = src_file_basename.rfind(".")
-					src_file_name = src_file_basename[:aux_pos]
-					src_file_ext = src_file_basename[aux_pos + 1:]
+				# wait for changes before starting the next cycle
+				changed_paths = self.waitForChanges()
+		except (KeyboardInterrupt, SystemExit) :
+			# the user pressed CTRL-C to stop the scan task
+			# clear any files found in the last iteration of the scan loop
+			self.files.clear()
+		finally :
+			# stop the watcher, if one was started
+			self.stopWatcher()
+
+			# stop finding any pending dependency lists
+			self.stopDeducingLists()
+
+			# store anything left in the crawl cache
+			self.saveCrawlCache()
+
+	# runs one cycle of the scan of the source files, checking each relevant source file and (re)generating its
+	# dependency file, as needed
+	# "dependency_list" is the dependency list of each source file, as of the previous cycles, and is updated in place
+	# "changed_paths" is the set() with the absolute paths of the files changed since the previous cycle
+	# "src_basenames" is a set() with the basenames of the only source files to check, or None to check all of them
+	# NOTE: on the first iteration of a scan every relevant source file is checked, otherwise only the ones affected by
+	# 		the changed files are
+	# returns a dict() with the basenames of the source files checked, with format:
+	# 	[updated | unchanged | failed] = list() with the basenames of the source files whose dependency file was
+	# 	(re)generated, was already up-to-date or couldn't be generated
+	def runScanCycle(self, dependency_list, changed_paths, first_iteration, src_basenames = None) :
+		# stores the final data
+		results = dict(updated=list(), unchanged=list(), failed=list())
+
+		# cross-reference the source and dependency files found and remove any dependency files that
+		# no longer have a matching source file
+		removed_files = self.checkFiles()
+
+		# remove from dependency_list any files that are no longer relevant
+		for removed_file_basename in removed_files:
+			if (removed_file_basename in dependency_list) :
+				self.unindexDependencyList(removed_file_basename, dependency_list[removed_file_basename])
+				del dependency_list[removed_file_basename]
+
+		# check if the rules are in aggregated dependency files and only some source files are to be checked
+		if (self.isAggregated() and src_basenames != None) :
+			# they are
+			# each aggregated dependency file is written with the rules of all its source files, so the source files
+			# sharing an aggregated dependency file with the ones to check are also checked
+			aggregate_paths = set([self.buildAggregatePath(src_file_basename) for src_file_basename in src_basenames])
+			src_basenames = set([src_file_basename for src_file_basename in self.files["source"] if self.buildAggregatePath(src_file_basename) in aggregate_paths])
+
+		# check if the dependency_list is empty but there are already dependency files generated
+		# NOTE: the rules in aggregated dependency files are always generated again on the first iteration
+		if (len(dependency_list) == 0 and len(self.files["dependency"]) > 0 and not self.isAggregated()) :
+			# there are, so this must be the first iteration of this loop
+			# start finding the dependency lists used to generate the existing dependency files
+			# NOTE: each list is collected when its source file is checked, so the checks don't wait for all of them
+			self.startDeducingLists(src_basenames)
+
+		# find the source files affected by the changes since the last cycle
+		# NOTE: on the first iteration every source file is checked
+		affected_sources = src_basenames
+		if (not first_iteration) :
+			affected_sources = self.findAffectedSources(dependency_list, changed_paths)
+			if (src_basenames != None) :
+				affected_sources = set([src_file_basename for src_file_basename in affected_sources if src_file_basename in src_basenames])
+		else :
+			# every source file's dependency list will be built, so scan all the files they reach at once
+			# NOTE: only done if the "crawl_workers" configuration allows the files to be scanned in parallel
+			self.dep_list_builder_obj.files = self.files.copy()
+			self.dep_list_builder_obj.prescanFiles([self.files["source"][src_file_basename] for src_file_basename in self.files["source"] if affected_sources == None or src_file_basename in affected_sources])
+
+		# loop through each source file
+		for src_file_basename in self.files["source"] :
+			# check if this source file is affected by the changes
+			if (affected_sources != None and src_file_basename not in affected_sources) :
+				# it isn't, so there is nothing to check
+				continue
 
-					# stores the time of last modification of the dependency file
-					dependency_file_mtime = -1
+			# grab this source file's name and extension
+			aux_pos = src_file_basename.rfind(".")
+			src_file_name = src_file_basename[:aux_pos]
+			src_file_ext = src_file_basename[aux_pos + 1:]
 
-					# stores this source file's corresponding dependency file basename
-					dep_file_basename = src_file_name + "." + Application.dep_extension_
+			# stores the time of last modification of the dependency file
+			dependency_file_mtime = -1
 
-					# controls whether this source file's dependency list needs to be (re)generated
-					build_dep_list = False
+			# stores this source file's corresponding dependency file basename
+			dep_file_basename = src_file_name + "." + Application.dep_extension_
 
-					# controls whether this source file's dependency file needs to be (re)generated
-					generate = False
+			# collect the dependency list used to generate the existing dependency file, if it's pending
+			self.collectDeducedList(dependency_list, dep_file_basename)
 
-					# check if a corresponding dependency file already exists
-					if (dep_file_basename not in self.files["dependency"]) :
-						# it doesn't, so the dependency file will need to be generated
-						generate = True
-					else :
-						# get the time of last modification of the dependency file
-						dependency_file_mtime = os.path.getmtime(self.files["dependency"][dep_file_basename])
+			# controls whether this source file's dependency list needs to be (re)generated
+			build_dep_list = False
 
-						# check if the rule template was changed after the dependency file was generated
-						if (os.path.getmtime(self.files["dependency_template"]) > dependency_file_mtime) :
-							# it was, so the dependency file will need to be regenerated
-							generate = True
+			# controls whether this source file's dependency file needs to be (re)generated
+			generate = False
 
-					# check if the list of dependent files for this source file has already been built
-					if (dep_file_basename not in dependency_list) :
-						# it hasn't, so built it
-						build_dep_list = True
-					elif (first_iteration) :
-						# it has and it's the first iteration of the loop
-						# always build the dependency list on the first iteration
-						# it will be compared to the list used to generate the dependency file below
-						build_dep_list = True
+			# find the dependency file with this source file's rule
+			dep_file_path = self.findDepFilePath(src_file_basename, dep_file_basename)
 
-						# determine if the items in the dependency list have absolute paths
-						items_have_paths = "/" in dependency_list[dep_file_basename][0] or "\\" in dependency_list[dep_file_basename][0]
+			# check if a corresponding dependency file already exists
+			if (dep_file_path == None) :
+				# it doesn't, so the dependency file will need to be generated
+				generate = True
+			else :
+				# get the time of last modification of the dependency file
+				dependency_file_mtime = self.stat_cache.getMtime(dep_file_path)
+
+				# check if the rule template was changed after the dependency file was generated
+				# NOTE: a dependency file whose content didn't change isn't written, so the rule template's modify time
+				# 		when the dependency file was last generated is also checked
+				template_mtime = self.file_fingerprints.getMtime(self.files["dependency_template"])
+				if (template_mtime > dependency_file_mtime and template_mtime > self.checked_mtimes.get(src_file_basename, dict()).get(self.files["dependency_template"], -1)) :
+					# it was, so the dependency file will need to be regenerated
+					generate = True
+
+			# check if the list of dependent files for this source file has already been built
+			if (dep_file_basename not in dependency_list) :
+				# it hasn't, so built it
+				build_dep_list = True
+			elif (first_iteration) :
+				# it has and it's the first iteration of the loop
+				# always build the dependency list on the first iteration
+				# it will be compared to the list used to generate the dependency file below
+				build_dep_list = True
+
+				# determine if the items in the dependency list have absolute paths
+				items_have_paths = "/" in dependency_list[dep_file_basename][0] or "\\" in dependency_list[dep_file_basename][0]
+
+				# get the configuration the dependency file was written with
+				# NOTE: if the manifest doesn't have it, it's deduced from the items in the dependency list having or not
+				# 		the absolute paths
+				emitted_config = self.emitted_configs.pop(dep_file_basename, dict(dependency_paths=items_have_paths))
+
+				# check if it matches the current config
+				for config_key in emitted_config :
+					if (emitted_config[config_key] != self.config.get(config_key)) :
+						# it doesn't
+						# regenerate the dependency file
+						generate = True
 
-						# check if its items having or not the absolute paths matches the current config
-						if (items_have_paths != self.config["dependency_paths"]) :
-							# it doesn't
-							# regenerate the dependency file
-							generate = True
+			# if the dependency list hasn't been flagged to be built
+			# check if the source file was modified after the dependency file was generated
+			aux_mtime = self.file_fingerprints.getMtime(self.files["source"][src_file_basename])
+			if (not build_dep_list and aux_mtime > dependency_file_mtime) :
+				# it was
+				# check if that change has been validated in previous cycles
+				if (src_file_basename not in self.checked_mtimes or self.files["source"][src_file_basename] not in self.checked_mtimes[src_file_basename] or aux_mtime > self.checked_mtimes[src_file_basename][self.files["source"][src_file_basename]]) :
+					# it hasn't
+					# check if the change affected the source file's #include directives
+					if (self.isSignatureChanged(self.files["source"][src_file_basename], self.files["source"][src_file_basename], max(dependency_file_mtime, self.checked_mtimes.get(src_file_basename, dict()).get(self.files["source"][src_file_basename], -1)))) :
+						# it did, so build it
+						build_dep_list = True
 
-					# if the dependency list hasn't been flagged to be built
-					# check if the source file was modified after the dependency file was generated
-					aux_mtime = os.path.getmtime(self.files["source"][src_file_basename])
-					if (not build_dep_list and aux_mtime > dependency_file_mtime) :
-						# it was
-						# check if that change has been validated in previous cycles
-						if (src_file_basename not in checked_mtimes or self.files["source"][src_file_basename] not in checked_mtimes[src_file_basename] or aux_mtime > checked_mtimes[src_file_basename][self.files["source"][src_file_basename]]) :
-							# it hasn't, so build it
-							build_dep_list = True
-
-					# check if this source file is present in checked_mtimes
-					if (src_file_basename not in checked_mtimes) :
-						# it isn't, so add it
-						checked_mtimes[src_file_basename] = dict()
+			# check if this source file is present in checked_mtimes
+			if (src_file_basename not in self.checked_mtimes) :
+				# it isn't, so add it
+				self.checked_mtimes[src_file_basename] = dict()
+			self.dirty_checked_mtimes.add(src_file_basename)
+
+			# keep a record that this file has been checked
+			# regardless of whether the dependency file will be (re)generated or not
+			self.checked_mtimes[src_file_basename][self.files["source"][src_file_basename]] = aux_mtime
+
+			# if the dependency list hasn't been flagged to be built
+			if (not build_dep_list) :
+				# loop through each dependent file
+				for dep_file_path in dependency_list[dep_file_basename] :
+					# check if this file no longer exists
+					if (not self.stat_cache.isFile(dep_file_path)) :
+						# it doesn't, so build it
+						build_dep_list = True
+					else :
+						# get this file's modify time
+						aux_mtime = self.file_fingerprints.getMtime(dep_file_path)
+
+						# check if this file was modified after the dependency file was generated
+						if (aux_mtime > dependency_file_mtime) :
+							# it was
+							# check if that change has been validated in previous cycles
+							if (dep_file_path not in self.checked_mtimes[src_file_basename] or aux_mtime > self.checked_mtimes[src_file_basename][dep_file_path]) :
+								# it hasn't
+								# check if the change affected this file's #include directives
+								if (self.isSignatureChanged(self.files["source"][src_file_basename], dep_file_path, max(dependency_file_mtime, self.checked_mtimes[src_file_basename].get(dep_file_path, -1)))) :
+									# it did, so build it
+									build_dep_list = True
+
+					# check if the dependent list has been flagged for build
+					if (build_dep_list) :
+						# it has
+						# no need to continue checking the rest of the dependent files
+						break
 
 					# keep a record that this file has been checked
 					# regardless of whether the dependency file will be (re)generated or not
-					checked_mtimes[src_file_basename][self.files["source"][src_file_basename]] = aux_mtime
-
-					# if the dependency list hasn't been flagged to be built
-					if (not build_dep_list) :
-						# loop through each dependent file
-						for dep_file_path in dependency_list[dep_file_basename] :
-							# check if this file no longer exists
-							if (not os.path.isfile(dep_file_path)) :
-								# it doesn't, so build it
-								build_dep_list = True
-							else :
-								# get this file's modify time
-								aux_mtime = os.path.getmtime(dep_file_path)
-
-								# check if this file was modified after the dependency file was generated
-								if (aux_mtime > dependency_file_mtime) :
-									# it was
-									# check if that change has been validated in previous cycles
-									if (dep_file_path not in checked_mtimes[src_file_basename] or aux_mtime > checked_mtimes[src_file_basename][dep_file_path]) :
-										# it hasn't, so build it
-										build_dep_list = True
-
-							# check if the dependent list has been flagged for build
-							if (build_dep_list) :
-								# it has
-								# no need to continue checking the rest of the dependent files
-								break
-
-							# keep a record that this file has been checked
-							# regardless of whether the dependency file will be (re)generated or not
-							checked_mtimes[src_file_basename][dep_file_path] = aux_mtime
-
-					# check if the dependency list needs to be (re)built
-					if (build_dep_list) :
-						# it does
-						new_dependency_list = self.buildDependencyList(src_file_basename)
+					self.checked_mtimes[src_file_basename][dep_file_path] = aux_mtime
 
-						# make sure the dependency list was generated
-						if (len(new_dependency_list) == 0) :
-							# it failed
-							# keep a record of the dependent file's mtime at the time of this cycle's check
-							for dep_file_path in dependency_list[dep_file_basename] :
-								# check if this path is still valid
-								if (not os.path.isfile(dep_file_path)) :
-									# it isn't
-									dependency_list[dep_file_basename].remove(dep_file_path)
+			# check if the dependency list needs to be (re)built
+			if (build_dep_list) :
+				# it does
+				new_dependency_list = self.buildDependencyList(src_file_basename)
+
+				# make sure the dependency list was generated
+				if (len(new_dependency_list) == 0) :
+					# it failed
+					# keep a record of the dependent file's mtime at the time of this cycle's check
+					for dep_file_path in dependency_list[dep_file_basename] :
+						# check if this path is still valid
+						if (not self.stat_cache.isFile(dep_file_path)) :
+							# it isn't
+							dependency_list[dep_file_basename].remove(dep_file_path)
+							self.unindexDependencyList(dep_file_basename, [dep_file_path])
 
-									# move on to next path
-									continue
+							# move on to next path
+							continue
 
-								#
-								checked_mtimes[src_file_basename][dep_file_path] = os.path.getmtime(dep_file_path)
+						#
+						self.checked_mtimes[src_file_basename][dep_file_path] = self.file_fingerprints.getMtime(dep_file_path)
 
-							# move to next source file
-							continue
+					# move to next source file
+					results["failed"].append(src_file_basename)
+					continue
 
-						# keep a record of the dependent file's mtime at the time of this cycle's check
-						for new_file_path in new_dependency_list :
-							checked_mtimes[src_file_basename][new_file_path] = os.path.getmtime(new_file_path)
-
-					# if at this point nothing has triggered a regenerate of the dependency file
-					# but the dependency list was built this cycle, then compare the old dependency list
-					# with the one generated this cycle to check if there were changes to it
-					if (not generate and build_dep_list) :
-						# check if the old list has this item
-						if (dep_file_basename not in dependency_list) :
-							# it doesn't
+				# keep a record of the dependent file's mtime at the time of this cycle's check
+				for new_file_path in new_dependency_list :
+					self.checked_mtimes[src_file_basename][new_file_path] = self.file_fingerprints.getMtime(new_file_path)
+
+			# if at this point nothing has triggered a regenerate of the dependency file
+			# but the dependency list was built this cycle, then compare the old dependency list
+			# with the one generated this cycle to check if there were changes to it
+			if (not generate and build_dep_list) :
+				# check if the old list has this item
+				if (dep_file_basename not in dependency_list) :
+					# it doesn't
+					for new_file_path in new_dependency_list :
+						# check if this file was modified after the dependency file was generated
+						if (self.file_fingerprints.getMtime(new_file_path) > dependency_file_mtime) :
+							# it was
+							# the dependency file needs to be (re)generated
+							generate = True
+
+							# no need to continue checking the rest of items
+							break
+				else :
+					# it does
+					# check if the #items in both lists is the same
+					if (len(dependency_list[dep_file_basename]) != len(new_dependency_list)) :
+						# they aren't
+						# the list changed, so flag the dependency file to be regenerated
+						generate = True
+					else :
+						# they are
+						# check if the comparison is based on basenames only
+						if (first_iteration and not items_have_paths) :
+							# it is
+							# check if all the files are the same
 							for new_file_path in new_dependency_list :
-								# check if this file was modified after the dependency file was generated
-								if (os.path.getmtime(new_file_path) > dependency_file_mtime) :
-									# it was
-									# the dependency file needs to be (re)generated
+								# check if this file is in the old list
+								if (os.path.basename(new_file_path) not in dependency_list[dep_file_basename]) :
+									# the file isn't in the old list
+									# the list changed, so flag the dependency file to be regenerated
 									generate = True
 
 									# no need to continue checking the rest of items
 									break
 						else :
-							# it does
-							# check if the #items in both lists is the same
-							if (len(dependency_list[dep_file_basename]) != len(new_dependency_list)) :
-								# they aren't
-								# the list changed, so flag the dependency file to be regenerated
-								generate = True
-							else :
-								# they are
-								# check if the comparison is based on basenames only
-								if (first_iteration and not items_have_paths) :
-									# it is
-									# check if all the files are the same
-									for new_file_path in new_dependency_list :
-										# check if this file is in the old list
-										if (os.path.basename(new_file_path) not in dependency_list[dep_file_basename]) :
-											# the file isn't in the old list
-											# the list changed, so flag the dependency file to be regenerated
-											generate = True
-
-											# no need to continue checking the rest of items
-											break
-								else :
-									# it isn't
-									# check if all the files and their paths are the same
-									for new_file_path in new_dependency_list :
-										# check if this file is in the old list and its path is the same
-										if (new_file_path not in dependency_list[dep_file_basename]) :
-											# no match -> either the file isn't in the old list or the path changed
-											# the list changed, so flag the dependency file to be regenerated
-											generate = True
-
-											# no need to continue checking the rest of items
-											break
-
-					# check if dependency_list needs to be updated
-					if (build_dep_list) :
-						# it does
-						dependency_list[dep_file_basename] = new_dependency_list
+							# it isn't
+							# check if all the files and their paths are the same
+							for new_file_path in new_dependency_list :
+								# check if this file is in the old list and its path is the same
+								if (new_file_path not in dependency_list[dep_file_basename]) :
+									# no match -> either the file isn't in the old list or the path changed
+									# the list changed, so flag the dependency file to be regenerated
+									generate = True
 
-					# check if the dependency file needs to be generated
-					if (generate) :
-						# it does
-						# build the dependency list string
-						dependency_list_str = self.buildDependencyListString(dependency_list[dep_file_basename])
+									# no need to continue checking the rest of items
+									break
 
-						# generate and save this dependency file
-						if (dependency_list_str != "" and self.generateDepFile(src_file_basename, dependency_list_str)) :
-							# it was successful
-							self.cli_obj.printMsg(1, "The dependency file for \"" + src_file_basename + "\" was updated.", True)
-						else :
-							# it failed
-							self.cli_obj.printMsg(0, "The dependency file for \"" + src_file_basename + "\" failed to be updated.", True)
+			# check if dependency_list needs to be updated
+			if (build_dep_list) :
+				# it does
+				if (dep_file_basename in dependency_list) :
+					self.unindexDependencyList(dep_file_basename, dependency_list[dep_file_basename])
+				dependency_list[dep_file_basename] = new_dependency_list
+				self.indexDependencyList(dep_file_basename, new_dependency_list)
 
-				# no longer in the first iteration of the loop
-				first_iteration = False
+				# make sure the watcher is aware of changes to these files
+				self.watchDependents(new_dependency_list)
 
-				# sleep before starting the next cycle
-				self.startSleep(self.config["sleep_timer"])
-		except (KeyboardInterrupt, SystemExit) :
-			# the user pressed CTRL-C to stop the scan task
-			# clear any files found in the last iteration of the scan loop
-			self.files.clear()
+			# check if the dependency file needs to be generated
+			if (generate) :
+				# it does
+				# generate and save this dependency file
+				generate_result = -1
+				if (len(dependency_list[dep_file_basename]) > 0) :
+					# check if the rules are in aggregated dependency files
+					if (self.isAggregated()) :
+						# they are, so the rule is written with its aggregated dependency file at the end of the cycle
+						if (self.generateAggregateRule(src_file_basename, self.buildDependencyListString(dependency_list[dep_file_basename]))) :
+							continue
+					else :
+						# they aren't, so the dependency file is written in the format of the "output_format" configuration
+						generate_result = getattr(self, Application.output_backends_[self.config["output_format"]])(src_file_basename, dependency_list[dep_file_basename])
+
+				# check if the dependency file has the current content
+				if (generate_result != -1) :
+					# it has
+					# keep a record of the rule template's modify time when this dependency file was generated
+					self.checked_mtimes[src_file_basename][self.files["dependency_template"]] = self.file_fingerprints.getMtime(self.files["dependency_template"])
+
+					# record the dependency list and configuration this dependency file was written with
+					self.recordManifestEntry(src_file_basename, dependency_list[dep_file_basename])
+				else :
+					# it hasn't, so whatever is recorded about the dependency file can't be trusted
+					self.manifest.removeEntry(src_file_basename)
+
+				# check if the dependency file was written
+				if (generate_result == 1) :
+					# it was
+					self.cli_obj.printMsg(1, "The dependency file for \"" + src_file_basename + "\" was updated.", True)
+					results["updated"].append(src_file_basename)
+				elif (generate_result == 0) :
+					# it wasn't, since its content didn't change
+					results["unchanged"].append(src_file_basename)
+				else :
+					# it failed
+					self.cli_obj.printMsg(0, "The dependency file for \"" + src_file_basename + "\" failed to be updated.", True)
+					results["failed"].append(src_file_basename)
+			else :
+				# it doesn't
+				results["unchanged"].append(src_file_basename)
+
+				# check if the dependency list was built this cycle
+				if (build_dep_list) :
+					# it was, so it's the list the dependency file has
+					self.recordManifestEntry(src_file_basename, dependency_list[dep_file_basename])
+
+		# collect any pending dependency lists whose source files weren't checked
+		for dep_file_basename in sorted(self.deduced_lists) :
+			self.collectDeducedList(dependency_list, dep_file_basename)
+		self.stopDeducingLists()
+
+		# write the aggregated dependency files whose rules changed, if they are used
+		if (self.isAggregated()) :
+			self.writeAggregateFiles(results)
+
+		# store the record of the dependency files generated
+		self.saveManifest()
+
+		# return the final data
+		return(results)
+
+	# adds the dependency list used to generate an existing dependency file to "dependency_list", if it's pending
+	def collectDeducedList(self, dependency_list, dep_file_basename) :
+		# collect the list
+		deduced_list = self.takeDeducedList(dep_file_basename)
+
+		# check if there was one
+		if (deduced_list != None) :
+			# there was
+			dependency_list[dep_file_basename] = deduced_list
+			self.indexDependencyList(dep_file_basename, deduced_list)
+
+	# records in the manifest the dependency list a source file's dependency file has, with the current configuration
+	# and rule template, and the dependent files' modify times when the list was validated
+	def recordManifestEntry(self, src_file_basename, dep_list) :
+		# check if the rules are in aggregated dependency files
+		if (self.isAggregated()) :
+			# they are, so there is no dependency file to describe
+			self.manifest.removeEntry(src_file_basename)
+			return
+
+		# get the dependency file's modify time and size, as it was written
+		dep_file_stat = self.stat_cache.lookup(self.buildDepFilePath(src_file_basename))
+
+		# check if the dependency file and the rule template can be read
+		if (dep_file_stat == None or not self.rule_template.load(self.files["dependency_template"])) :
+			# they can't, so the dependency file can't be described
+			self.manifest.removeEntry(src_file_basename)
+			return
+
+		# find the modify times the dependent files were validated at
+		src_checked_mtimes = self.checked_mtimes.get(src_file_basename, dict())
+		dep_mtimes = dict()
+		for dep_file_path in dep_list :
+			if (dep_file_path in src_checked_mtimes) :
+				dep_mtimes[dep_file_path] = src_checked_mtimes[dep_file_path]
+
+		# get the configurations the dependency file was written with
+		emitted_config = dict()
+		for config_key in Application.emitted_config_keys_ :
+			emitted_config[config_key] = self.config[config_key]
+
+		self.manifest.setEntry(src_file_basename, dep_list, emitted_config, self.rule_template.digest, dep_mtimes, dep_file_stat)
+
+	# writes the record of the dependency files generated to the manifest file, without the source files that no
+	# longer exist
+	def saveManifest(self) :
+		self.manifest.prune(self.files["source"])
+
+		# write the manifest file, if anything changed
+		if (not self.manifest.save()) :
+			# it couldn't be written
+			# NOTE: it's written again once any dependency file is generated, and until then the existing dependency files
+			# 		are parsed on the program's start
+			self.cli_obj.printMsg(2, "The dependency manifest file couldn't be written.", True)
+
+	# builds the absolute path where this project's manifest file should be located at
+	# based on the current "dependency_dir" configuration value
+	def buildManifestPath(self) :
+		return(os.path.dirname(self.buildProjConfigPath()) + os.sep + Application.manifest_basename_)
+
+	# opens the project's crawl cache, if the "persistent_cache" configuration asks for one, and loads the
+	# information it has into the DepListBuilder and self.checked_mtimes
+	def openCrawlCache(self) :
+		# make sure no previous crawl cache is open
+		self.closeCrawlCache()
+
+		# check if a crawl cache should be used
+		if (not self.config["persistent_cache"]) :
+			# it shouldn't
+			return
+
+		# open the crawl cache
+		self.crawl_cache = CrawlCache.CrawlCache(self.buildCrawlCachePath())
+		if (not self.crawl_cache.open(self.getCrawlContext())) :
+			# the crawl cache couldn't be opened
+			self.crawl_cache = None
+
+			# print warning message
+			self.cli_obj.printMsg(2, "The crawl cache file couldn't be opened, so the information obtained by crawling files will not be kept for future runs of the program.", True)
+			return
+
+		# replace any information obtained by crawling files with the stored information
+		self.dep_list_builder_obj.clearCrawlData()
+		if (not self.crawl_cache.load(self.dep_list_builder_obj, self.checked_mtimes)) :
+			# the stored information couldn't be loaded, so discard it
+			self.dep_list_builder_obj.clearCrawlData()
+			self.resetCrawlCache()
+
+	# closes the project's crawl cache, if it's open
+	def closeCrawlCache(self) :
+		# check if the crawl cache is open
+		if (self.crawl_cache != None) :
+			# it is
+			self.crawl_cache.close()
+			self.crawl_cache = None
+
+	# discards the information stored in the project's crawl cache, if it's open
+	# NOTE: called when the information obtained by crawling files is no longer valid
+	def resetCrawlCache(self) :
+		# check if the crawl cache is open
+		if (self.crawl_cache == None) :
+			# it isn't
+			return
+
+		# discard the stored information
+		if (not self.crawl_cache.reset(self.getCrawlContext())) :
+			# failed to write to the crawl cache
+			self.closeCrawlCache()
+
+			# print warning message
+			self.cli_obj.printMsg(2, "The crawl cache file couldn't be written, so it will no longer be used.", True)
+			return
+
+		# the checked times of every source file will need to be stored again
+		self.dirty_checked_mtimes.update(self.checked_mtimes)
+
+	# stores in the project's crawl cache the information that changed since the last time it was saved
+	# the dependency times checked for each source file are only stored if "save_checked_mtimes" is True
+	def saveCrawlCache(self, save_checked_mtimes = True) :
+		# check if the crawl cache is open
+		if (self.crawl_cache == None) :
+			# it isn't
+			return
+
+		# save the changes
+		if (not self.crawl_cache.saveCrawls(self.dep_list_builder_obj) or (save_checked_mtimes and not self.crawl_cache.saveCheckedMtimes(self.checked_mtimes, self.dirty_checked_mtimes))) :
+			# failed to write to the crawl cache
+			self.closeCrawlCache()
+
+			# print warning message
+			self.cli_obj.printMsg(2, "The crawl cache file couldn't be written, so it will no longer be used.", True)
+
+	# builds a string with the configurations the information obtained by crawling files depends on
+	# used to discard a crawl cache created with different configurations
+	def getCrawlContext(self) :
+		return(json.dumps([self.dep_list_builder_obj.search_paths, self.config["builtin_libs"], self.config["scanner_engine"], self.ignore_patterns]))
+
+	# builds the absolute path where this project's crawl cache file should be located at
+	# based on the current "dependency_dir" configuration value
+	def buildCrawlCachePath(self) :
+		return(os.path.dirname(self.buildProjConfigPath()) + os.sep + Application.crawl_cache_basename_)
+
+	# checks if a file's #include directives changed after "validated_mtime", which is the modify time of the file
+	# (or of the dependency file) when the dependency list using this file was last validated
+	# "src_file_path" is the source file whose dependency list uses this file
+	# if they didn't, any modifications since then didn't change the file's dependent files
+	# returns True if they changed or that can't be known, False otherwise
+	def isSignatureChanged(self, src_file_path, file_path, validated_mtime) :
+		# get the modify time of the file when its include signature last changed, as known by the DepListBuilder
+		# that crawls the source file
+		signature_mtime = self.dep_list_builder_obj.getBuilder(src_file_path).getSignatureMtime(file_path)
+
+		return(signature_mtime == None or signature_mtime > validated_mtime)
 
 	# builds the string of whitespace separated dependent files, based on the information
 	# in the dependency list for that file
@@ -464,11 +1021,263 @@ class Application :
 		# wait X second (set in the "sleep_timer" configuration)
 		time.sleep(sleep_time)
 
-	# searches existing dependency files and finds the dependency lists used to generate them
-	# returns a dict() with the dependency lists
-	def deduceDependencyLists(self) :
+	# starts the event driven watcher of the project's directory tree, if the "watch_mode" configuration asks for one
+	# if the watcher can't be started the scan will fall back to the periodic search of the project's directory tree
+	def startWatcher(self) :
+		# make sure no previous watcher is active
+		self.stopWatcher()
+
+		# check if a watcher should be used
+		if (self.config["watch_mode"] != "inotify") :
+			# it shouldn't
+			return
+
+		# check if the current platform supports the watcher
+		if (not Watcher.Watcher.isSupported()) :
+			# it doesn't
+			# print warning message
+			self.cli_obj.printMsg(2, "The \"inotify\" watch mode isn't supported on this platform. The project's directory tree will be scanned every " + str(self.config["sleep_timer"]) + " seconds instead.", True)
+			return
+
+		# create the watcher and watch the project's directory tree
+		self.watcher = Watcher.Watcher()
+		if (not self.watcher.start(self.project_root)) :
+			# the watcher couldn't be started
+			self.watcher = None
+
+			# print warning message
+			self.cli_obj.printMsg(2, "The project's directory tree couldn't be watched, possibly because the system's limit of inotify watches was reached or the project's root directory can't be read. The project's directory tree will be scanned every " + str(self.config["sleep_timer"]) + " seconds instead.", True)
+
+	# stops the event driven watcher, if one is active
+	def stopWatcher(self) :
+		# check if there is an active watcher
+		if (self.watcher != None) :
+			# there is
+			self.watcher.stop()
+			self.watcher = None
+
+	# waits until the next scan cycle should start
+	# if the watcher is active, waits for changes in the watched directories and updates self.files
+	# otherwise sleeps for "sleep_timer" seconds
+	# returns a set() with the absolute paths of the files changed, or None if the changes are unknown
+	def waitForChanges(self) :
+		# check if there is an active watcher
+		if (self.watcher == None) :
+			# there isn't
+			# sleep before the next cycle
+			self.startSleep(self.config["sleep_timer"])
+
+			# the changes are unknown
+			return(None)
+
+		# wait for the events of the next burst of changes
+		# NOTE: a burst lasting longer than "sleep_timer" seconds will be split into several cycles
+		events = self.watcher.waitForEvents(self.config["watch_debounce"] / 1000, self.config["sleep_timer"])
+
+		# check if the system's limit of watches was reached while watching new directories
+		if (self.watcher.limit_reached) :
+			# it was
+			self.stopWatcher()
+
+			# print warning message
+			self.cli_obj.printMsg(2, "The system's limit of inotify watches was reached. The project's directory tree will be scanned every " + str(self.config["sleep_timer"]) + " seconds instead.", True)
+
+			# the changes are unknown
+			return(None)
+
+		# check if any events were lost
+		if (events["overflow"]) :
+			# they were, so the changes are unknown
+			return(None)
+
+		# stores the absolute paths of the changed files
+		changed_paths = events["changed"].union(events["deleted"])
+
+		# check if any directories were deleted or moved away
+		if (len(events["deleted_dirs"]) > 0) :
+			# they were
+			# any of the files checked might have been inside them, so discard what is known about them
+			self.stat_cache.clear()
+
+			# build a list() with all the files currently stored in self.files
+			stored_paths = list()
+			for files_key in ["source", "relevant", "dependency"] :
+				stored_paths.extend(self.files[files_key].values())
+			stored_paths.append(self.files["dependency_template"])
+
+			# loop through each stored file, flagging the ones that were inside the deleted directories
+			for file_path in stored_paths :
+				for dir_path in events["deleted_dirs"] :
+					if (file_path.startswith(dir_path + os.sep)) :
+						# this file is gone
+						events["deleted"].add(file_path)
+						changed_paths.add(file_path)
+						break
+
+		# update self.files with the changes inside the project's directory tree
+		for file_path in changed_paths :
+			# the information known about this file is no longer valid
+			self.stat_cache.invalidate(file_path)
+
+			# check if this file is inside the project's directory tree
+			if (not file_path.startswith(self.project_root + os.sep)) :
+				# it isn't, so it's not stored in self.files
+				continue
+
+			# check if this file still exists
+			if (file_path in events["changed"]) :
+				# it does
+				self.addToFiles(os.path.basename(file_path), file_path)
+			else :
+				# it doesn't
+				self.removeFromFiles(file_path)
+
+		# return the changed files
+		return(changed_paths)
+
+	# finds the source files whose dependency file might be affected by the changed files
+	# uses the reverse index of the dependency lists, so only the dependent files that changed are looked up
+	# returns a set() with the basenames of the affected source files
+	def findAffectedSources(self, dependency_list, changed_paths) :
+		# find the dependency files whose dependency lists have any of the changed files
+		# NOTE: on the first cycle the dependency lists might only have basenames
+		affected_deps = set()
+		for file_path in changed_paths :
+			affected_deps.update(self.dependents_index.get(file_path, set()))
+			affected_deps.update(self.dependents_index.get(os.path.basename(file_path), set()))
+
+		# check if the rule template changed, in which case every source file is affected
+		template_changed = self.files["dependency_template"] in changed_paths
+
+		# stores the final data
+		affected_sources = set()
+
+		# loop through each source file
+		for src_file_basename in self.files["source"] :
+			# build this source file's dependency file basename
+			dep_file_basename = src_file_basename[:src_file_basename.rfind(".")] + "." + Application.dep_extension_
+
+			# find the dependency file with this source file's rule
+			# NOTE: if the rules are in aggregated dependency files, it's the aggregated dependency file the rule was written to
+			dep_file_path = self.findDepFilePath(src_file_basename, dep_file_basename)
+
+			# check if the source file itself, its dependency file or one of its dependent files changed,
+			# or if the dependency file or the dependency list don't exist yet
+			if (template_changed or dep_file_basename in affected_deps or self.files["source"][src_file_basename] in changed_paths or dep_file_path == None or dep_file_basename not in dependency_list or dep_file_path in changed_paths) :
+				# it is
+				affected_sources.add(src_file_basename)
+			elif (len(dependency_list[dep_file_basename]) == 0 or os.sep not in dependency_list[dep_file_basename][0]) :
+				# the dependency list only has basenames, because it couldn't be rebuilt since it was deduced,
+				# so it's checked every cycle
+				affected_sources.add(src_file_basename)
+
+		# return the final data
+		return(affected_sources)
+
+	# adds a dependency list to the reverse index of the dependency lists
+	def indexDependencyList(self, dep_file_basename, dep_list) :
+		# loop through each dependent file
+		for dep_file_path in dep_list :
+			# check if this file is in the index
+			if (dep_file_path not in self.dependents_index) :
+				# it isn't
+				self.dependents_index[dep_file_path] = set()
+
+				# keep a record of this file's current state, so only later changes are detected
+				if (os.sep in dep_file_path) :
+					self.tracked_stats[dep_file_path] = self.stat_cache.lookup(dep_file_path)
+
+			self.dependents_index[dep_file_path].add(dep_file_basename)
+
+	# removes a dependency list from the reverse index of the dependency lists
+	def unindexDependencyList(self, dep_file_basename, dep_list) :
+		# loop through each dependent file
+		for dep_file_path in dep_list :
+			# check if this file is in the index
+			if (dep_file_path in self.dependents_index) :
+				# it is
+				self.dependents_index[dep_file_path].discard(dep_file_basename)
+
+				# check if any dependency list still has this file
+				if (len(self.dependents_index[dep_file_path]) == 0) :
+					# none has
+					del self.dependents_index[dep_file_path]
+
+	# finds the tracked files (source, dependency, rule template and dependent files) that changed since the last call
+	# each file is checked only once, regardless of how many dependency lists have it
+	# returns a set() with the absolute paths of the files that changed, were added or were removed
+	def findChangedFiles(self) :
+		# build a set() with the files currently tracked
+		tracked_paths = set([file_path for file_path in self.dependents_index if os.sep in file_path])
+		tracked_paths.update(self.files["source"].values())
+		tracked_paths.update(self.files["dependency"].values())
+		if (self.files["dependency_template"] != "") :
+			tracked_paths.add(self.files["dependency_template"])
+
 		# stores the final data
-		data = dict()
+		changed_paths = set()
+
+		# loop through each file tracked now or in the last call
+		for file_path in tracked_paths.union(self.tracked_stats.keys()) :
+			# get this file's current state
+			file_info = self.stat_cache.lookup(file_path)
+
+			# check if this file changed
+			if (file_path not in self.tracked_stats or self.tracked_stats[file_path] != file_info) :
+				# it did
+				changed_paths.add(file_path)
+
+			# update the stored state
+			if (file_path in tracked_paths) :
+				self.tracked_stats[file_path] = file_info
+			else :
+				del self.tracked_stats[file_path]
+
+		# return the final data
+		return(changed_paths)
+
+	# makes sure the watcher is watching the directories of the provided dependent files
+	# NOTE: the directories outside the project's directory tree are watched individually, not recursively
+	def watchDependents(self, dep_file_paths) :
+		# check if there is an active watcher
+		if (self.watcher == None) :
+			# there isn't
+			return
+
+		# loop through each dependent file's directory
+		for dir_path in set([os.path.dirname(path) for path in dep_file_paths]) :
+			# check if this directory is inside the project's directory tree, which is already being watched
+			if (dir_path == self.project_root or dir_path.startswith(self.project_root + os.sep)) :
+				# it is
+				continue
+
+			# watch this directory
+			if (self.watcher.watchDirectory(dir_path) == -1) :
+				# the system's limit of watches was reached
+				self.stopWatcher()
+
+				# print warning message
+				self.cli_obj.printMsg(2, "The system's limit of inotify watches was reached. The project's directory tree will be scanned every " + str(self.config["sleep_timer"]) + " seconds instead.", True)
+
+				# no need to continue
+				break
+
+	# starts finding the dependency lists used to generate the existing dependency files
+	# the lists are only needed once their source files are checked, so they are collected by takeDeducedList()
+	# if the "crawl_workers" configuration allows it, the dependency files are read and parsed in parallel, in the
+	# background, otherwise each one is only read and parsed when its list is collected
+	# "src_basenames" is a set() with the basenames of the only source files whose lists are needed, or None for all of them
+	def startDeducingLists(self, src_basenames = None) :
+		# make sure no previous lists are pending
+		self.stopDeducingLists()
+
+		# bring the compiled rule template up-to-date with the dependency_template.txt file
+		if (not self.rule_template.load(self.files["dependency_template"])) :
+			# the file couldn't be read, so the dependency files can't be parsed
+			return
+
+		# read the record of the dependency files generated in previous runs of the program
+		self.manifest.load()
 
 		# loop through each existing dependency file
 		for dep_file_basename in self.files["dependency"] :
@@ -493,48 +1302,160 @@ class Application :
 				# it wasn't, so move on
 				continue
 
-			# grab the content of this dependency file
-			dep_file_content = General.General.readFile(self.files["dependency"][dep_file_basename])
+			# check if this source file's dependency list is needed
+			if (src_basenames != None and src_file_basename not in src_basenames) :
+				# it isn't, so move on
+				continue
 
-			# check if the file's content was successfully acquired
-			if (dep_file_content == None) :
-				# it wasn't
+			# check if the manifest has the list this dependency file was written with
+			manifest_entry = self.manifest.getEntry(src_file_basename, self.stat_cache.lookup(self.files["dependency"][dep_file_basename]))
+			if (manifest_entry != None) :
+				# it has, so the dependency file doesn't need to be parsed
+				self.deduced_lists[dep_file_basename] = list(manifest_entry["dependents"])
+				self.useManifestEntry(src_file_basename, dep_file_basename, manifest_entry)
 				continue
 
-			# create the regex string, based on the rule template, for this source file
-			regex_str = ""
-			for line in self.replaceKeywords(src_file_basename, "|!dependents!|").splitlines() :
-				# check if this line has the "|!dependents!|" keyword
-				if ("|!dependents!|" in line) :
-					# it does
-					# this will be the regex string
-					regex_str = "^" + re.escape(line).replace(re.escape("|!dependents!|"), "([^\\n\\r]+)") + "$"
+			# store what is needed to find this list
+			self.deduced_lists[dep_file_basename] = (src_file_basename, self.files["dependency"][dep_file_basename])
 
-			# match the regex string to this dependency file
-			re_match = re.search(regex_str, dep_file_content, re.I|re.M)
+		# find the dependency files that need to be parsed
+		parsed_files = [dep_file_basename for dep_file_basename in sorted(self.deduced_lists) if isinstance(self.deduced_lists[dep_file_basename], tuple)]
 
-			# check if the match was successful
-			if (re_match == None or re_match.group(1) == None) :
-				# it wasn't, so move on
-				continue
+		# check if the dependency files should be parsed in parallel
+		if (DepListBuilder.DepListBuilder.workers_ > 1 and len(parsed_files) > 1) :
+			# they should
+			# NOTE: threads are used, since reading the files is most of the work
+			self.deduce_executor = concurrent.futures.ThreadPoolExecutor(DepListBuilder.DepListBuilder.workers_)
+			for dep_file_basename in parsed_files :
+				self.deduced_lists[dep_file_basename] = self.deduce_executor.submit(self.deduceDependencyList, *self.deduced_lists[dep_file_basename])
+
+	# uses the information in a source file's manifest entry, whose list is the one its dependency file was written with
+	# the configuration the dependency file was written with is stored in self.emitted_configs and the dependent files'
+	# modify times when the list was validated, and the rule template's if it didn't change since then, are added to
+	# self.checked_mtimes
+	def useManifestEntry(self, src_file_basename, dep_file_basename, manifest_entry) :
+		# store the configuration the dependency file was written with
+		self.emitted_configs[dep_file_basename] = dict(manifest_entry["config"])
+
+		# check if this source file is present in checked_mtimes
+		if (src_file_basename not in self.checked_mtimes) :
+			# it isn't, so add it
+			self.checked_mtimes[src_file_basename] = dict()
+		src_checked_mtimes = self.checked_mtimes[src_file_basename]
+		self.dirty_checked_mtimes.add(src_file_basename)
+
+		# keep a record of the modify times the dependent files were validated at, unless later ones are known
+		for file_path in manifest_entry["mtimes"] :
+			if (manifest_entry["mtimes"][file_path] > src_checked_mtimes.get(file_path, -1)) :
+				src_checked_mtimes[file_path] = manifest_entry["mtimes"][file_path]
+
+		# check if the dependency file was written with the current rule template
+		# NOTE: it was, even if the rule template's file was modified after the dependency file
+		if (manifest_entry["template_digest"] == self.rule_template.digest) :
+			# it was
+			src_checked_mtimes[self.files["dependency_template"]] = max(src_checked_mtimes.get(self.files["dependency_template"], -1), self.file_fingerprints.getMtime(self.files["dependency_template"]))
+
+	# collects the dependency list used to generate an existing dependency file, started by startDeducingLists()
+	# waits for the list to be found, if it's being found in parallel
+	# returns the list() with the dependent files' paths, or None if there isn't one
+	def takeDeducedList(self, dep_file_basename) :
+		# grab this dependency file's pending list
+		pending_list = self.deduced_lists.pop(dep_file_basename, None)
+
+		# check if this list is pending
+		if (pending_list == None) :
+			# it isn't
+			return(None)
 
-			# stores the paths found
-			dep_list = list()
+		# check if the list came from the manifest
+		if (isinstance(pending_list, list)) :
+			# it did
+			return(pending_list)
 
-			# standardize each item in the capture group
-			for item in re_match.group(1).strip().split(" ") :
-				dep_list.append(General.General.standardizePath(item))
+		# check if the list is being found in parallel
+		if (isinstance(pending_list, concurrent.futures.Future)) :
+			# it is
+			return(pending_list.result())
+
+		return(self.deduceDependencyList(pending_list[0], pending_list[1]))
+
+	# discards the dependency lists pending collection and stops any workers finding them
+	def stopDeducingLists(self) :
+		# check if workers were started
+		if (self.deduce_executor != None) :
+			# they were
+			for pending_list in self.deduced_lists.values() :
+				if (isinstance(pending_list, concurrent.futures.Future)) :
+					pending_list.cancel()
+			self.deduce_executor.shutdown()
+			self.deduce_executor = None
+
+		self.deduced_lists.clear()
+		self.emitted_configs.clear()
+
+	# finds the dependency list used to generate an existing dependency file, by parsing it in the format of the
+	# "output_format" configuration
+	# NOTE: can run in several threads at the same time
+	# returns the list() with the dependent files' paths, or None if it couldn't be found
+	def deduceDependencyList(self, src_file_basename, dep_file_path) :
+		# grab the content of this dependency file
+		dep_file_content = General.General.readFile(dep_file_path)
 
-			# check if the list is empty
-			if (len(dep_list) == 0) :
-				# it is, so move on
-				continue
+		# check if the file's content was successfully acquired
+		if (dep_file_content == None) :
+			# it wasn't
+			return(None)
 
-			# store the list
-			data[dep_file_basename] = dep_list
+		return(getattr(self, Application.input_backends_[self.config["output_format"]])(src_file_basename, dep_file_content))
 
-		# return the final data
-		return(data)
+	# finds the dependency list in the content of a dependency file written with the rule template
+	# returns the list() with the dependent files' paths, or None if it couldn't be found
+	def parseTemplateDepFile(self, src_file_basename, dep_file_content) :
+		# find the dependent files in this dependency file, based on the rule template
+		dependents_str = self.rule_template.parseDependents(src_file_basename, dep_file_content)
+
+		# check if they were found
+		if (dependents_str == None) :
+			# they weren't
+			return(None)
+
+		# stores the paths found
+		dep_list = list()
+
+		# standardize each item found
+		for item in dependents_str.strip().split(" ") :
+			dep_list.append(General.General.standardizePath(item))
+
+		# check if the list is empty
+		if (len(dep_list) == 0) :
+			# it is
+			return(None)
+
+		return(dep_list)
+
+	# finds the dependency list in the content of a Ninja depfile, which is a single rule with the dependent files after
+	# the first ": ", where line continuations are allowed and spaces, "#" and "$" in the paths are escaped
+	# returns the list() with the dependent files' paths, or None if it couldn't be found
+	def parseNinjaDepFile(self, src_file_basename, dep_file_content) :
+		# find where the dependent files start
+		aux_pos = dep_file_content.find(": ")
+		if (aux_pos == -1) :
+			# the content isn't a rule
+			return(None)
+
+		# stores the paths found
+		dep_list = list()
+
+		# unescape and standardize each item found, ignoring the line continuations
+		for item in Application.ninja_item_regex_.findall(dep_file_content[aux_pos + 2:].replace("\\\n", " ")) :
+			dep_list.append(General.General.standardizePath(item.replace("\\ ", " ").replace("\\#", "#").replace("$$", "$")))
+
+		# check if the list is empty
+		if (len(dep_list) == 0) :
+			# it is
+			return(None)
+
+		return(dep_list)
 
 	# scan the file given in path for all #include files and then scan all them as well
 	# building a list() of files that are included in the original file provided by path
@@ -546,62 +1467,40 @@ class Application :
 		# get this source file's absolute path
 		src_file_path = self.files["source"][src_file_basename]
 
-		# stores the paths to the dependent files
-		dep_list = list()
-
-		# stores the paths to the dependent files that couldn't be found
-		# format: [file abs path] = set() with the #include matches that couldn't be found
-		# 		  if the set() is empty then the file itself couldn't be found
-		failed_files = dict()
-
-		# (re)set some of the DepListBuilder's class variables
-		self.dep_list_builder_obj.queue = set([src_file_path])
-		self.dep_list_builder_obj.found_files.clear()
-		self.dep_list_builder_obj.dep_list = dep_list
-		self.dep_list_builder_obj.failed_files = failed_files
+		# provide the DepListBuilder with the files found in the project's directory tree
 		self.dep_list_builder_obj.files = self.files.copy()
 
 		# find all dependent files
-		# the dependent files found will be stored in dep_list and any files that
-		# couldn't be found will be stored in failed_files
-		self.dep_list_builder_obj.run()
+		# dep_list will have the paths to the dependent files and failed_files the paths to the dependent files
+		# that couldn't be found, with format: [file abs path] = set() with the #include matches that couldn't be found
+		# 		  if the set() is empty then the file itself couldn't be found
+		dep_list, failed_files = self.dep_list_builder_obj.buildDependencyList(src_file_path)
 
 		# check if any errors occured
 		if (len(failed_files) > 0) :
 			# yes
-			# build the error message
-			message = "The list of dependent files for the source file \"" + src_file_path + "\" "
-
-			# check if incomplete lists are to be used
-			if (self.config["use_incomplete_list"]) :
-				# they are
-				message += " is incomplete, because:"
-			else:
-				# they aren't
-				message += "couldn't be generated, because:"
-
-			# loop through the failed files
-			for failed_path in failed_files :
-				# check if the file wasn't found
-				if (len(failed_files[failed_path]) == 0) :
-					# it wasn't
-					message += "\n\t- the file \"" + failed_path + "\" couldn't be found."
-				else :
-					# it was
-					message += "\n\t- the contents of these #include directives, in " + failed_path + ", couldn't be found:"
-
-					# loop through the #include directives that couldn't be processed
-					for failed_match in failed_files[failed_path] :
-						message += "\n\t\t- " + failed_match
-
-			# print error messages
-			self.cli_obj.printMsg(0, message, True)
+			# check if these same errors were already reported for this source file
+			if (self.reported_failures.get(src_file_basename) == failed_files) :
+				# they were, so they aren't reported again
+				pass
+			else :
+				# they weren't
+				self.reportFailedFiles(src_file_path, failed_files)
+				self.reported_failures[src_file_basename] = failed_files
 
 			# check if incomplete lists are to be used
 			if (not self.config["use_incomplete_list"]) :
 				# they aren't
 				# empty the dep_list variable
 				dep_list.clear()
+		else :
+			# no
+			# any errors reported for this source file are gone, so report them again if they come back
+			self.reported_failures.pop(src_file_basename, None)
+
+		# store the information obtained by this crawl in the crawl cache
+		# NOTE: the checked times are saved once per cycle, with the ones of every source file checked in it
+		self.saveCrawlCache(False)
 
 		# print end message
 		self.cli_obj.printMsg(1, "Finished building dependency list for \"" + src_file_basename + "\"", True)
@@ -609,66 +1508,271 @@ class Application :
 		# return the final data
 		return(dep_list)
 
+	# prints the error message about the dependent files of a source file that couldn't be found
+	# "failed_files" has the same format as the one returned by DepListBuilder.buildDependencyList()
+	def reportFailedFiles(self, src_file_path, failed_files) :
+		# build the error message
+		message = "The list of dependent files for the source file \"" + src_file_path + "\" "
+
+		# check if incomplete lists are to be used
+		if (self.config["use_incomplete_list"]) :
+			# they are
+			message += " is incomplete, because:"
+		else:
+			# they aren't
+			message += "couldn't be generated, because:"
+
+		# loop through the failed files
+		for failed_path in failed_files :
+			# check if the file wasn't found
+			if (len(failed_files[failed_path]) == 0) :
+				# it wasn't
+				message += "\n\t- the file \"" + failed_path + "\" couldn't be found."
+			else :
+				# it was
+				message += "\n\t- the contents of these #include directives, in " + failed_path + ", couldn't be found:"
+
+				# loop through the #include directives that couldn't be processed
+				for failed_match in failed_files[failed_path] :
+					message += "\n\t\t- " + failed_match
+
+		# print error messages
+		self.cli_obj.printMsg(0, message, True)
+
 	# replaces any valid keywords in the rule template by the respective data
 	# returns a string which is the rule template after the keywords have been replaced
 	def replaceKeywords(self, src_file_basename, dependency_str) :
-		# grab the content of the dependency_template.txt file
-		dependency_template_str = General.General.readFile(self.files["dependency_template"])
-
-		# check if the file's content was successfully acquired
-		if (dependency_template_str == None) :
-			# it wasn't
+		# bring the compiled rule template up-to-date with the dependency_template.txt file
+		if (not self.rule_template.load(self.files["dependency_template"])) :
+			# the file couldn't be read
 			return("")
 
-		# find the src file's name and extension
-		src_file_name = ""
-		src_file_ext = ""
-
-		# check if the source file has an explicit extension
-		aux_pos = src_file_basename.rfind(".")
-		if (aux_pos != -1) :
-			# it has
-			src_file_name = src_file_basename[:aux_pos]
-			src_file_ext = src_file_basename[aux_pos + 1:]
-		else :
-			# it doesn't
-			src_file_name = src_file_basename
-
-		# process the rule template by replacing any valid keywords by their respective data
-		dependency_template_str = dependency_template_str.replace("|!dependents!|", dependency_str)
-		dependency_template_str = dependency_template_str.replace("|!src_file_basename!|", src_file_basename)
-		dependency_template_str = dependency_template_str.replace("|!src_file_name!|", src_file_name)
-		dependency_template_str = dependency_template_str.replace("|!src_file_ext!|", src_file_ext)
-
 		# return the final rule template string
-		return(dependency_template_str)
+		return(self.rule_template.render(src_file_basename, dependency_str))
 
 	# generate the dependency file's content, based on the rule template, and save the file
-	# to the project's directory tree
-	# returns True if successful, False otherwise
+	# to the project's directory tree, unless the file already has that content
+	# the file is replaced atomically, so it's never seen partially written
+	# returns 1 if the file was written, 0 if it already had the content or -1 if it failled
 	# NOTE: all dependent files will be added with a / as the directory separator (better for Makefile)
-	def generateDepFile(self, src_file_basename, dependency_str) :
+	def generateDepFile(self, src_file_basename, dependency_list) :
 		# replace any valid keywords in the rule template by the respective data
-		dependency_template_str = self.replaceKeywords(src_file_basename, dependency_str)
+		dependency_template_str = self.replaceKeywords(src_file_basename, self.buildDependencyListString(dependency_list))
 
 		# check if the final rule template string is empty
 		if (dependency_template_str == "") :
 			# it is
 			# failed to generate the dependency file
+			return(-1)
+
+		# write the rule template to the dependency file for this specific source file, if its content changed
+		return(self.writeDepFile(src_file_basename, dependency_template_str))
+
+	# generate the dependency file's content, in the format of the depfiles read by Ninja, and save the file to the
+	# project's directory tree, unless the file already has that content
+	# the file is a single rule, whose target is the "ninja_target" configuration with the keywords replaced by the
+	# respective data of the source file, so it matches the output of the Ninja build statement that uses the depfile
+	# returns 1 if the file was written, 0 if it already had the content or -1 if it failled
+	# NOTE: all dependent files will be added with a / as the directory separator
+	def generateNinjaDepFile(self, src_file_basename, dependency_list) :
+		# build the rule's target
+		target_str = RuleTemplate.RuleTemplate.renderSegments(RuleTemplate.RuleTemplate.compileSegments(self.config["ninja_target"]), RuleTemplate.RuleTemplate.buildKeywordValues(src_file_basename, ""))
+
+		# build the rule's dependent files, escaped for Ninja's depfile parser
+		dependents = list()
+		for dep_list_file_path in dependency_list :
+			# check if the absolute paths of the dependent files should be used
+			if (self.config["dependency_paths"]) :
+				# they should
+				dependent = dep_list_file_path.replace("\\", "/")
+			else :
+				# they shouldn't
+				dependent = os.path.basename(dep_list_file_path)
+
+			dependents.append(dependent.replace("$", "$$").replace("#", "\\#").replace(" ", "\\ "))
+
+		# write the rule to the dependency file for this specific source file, if its content changed
+		return(self.writeDepFile(src_file_basename, target_str + ": " + " ".join(dependents) + "\n"))
+
+	# writes the content of a source file's dependency file, atomically, unless the file already has that content
+	# returns 1 if the file was written, 0 if it already had the content or -1 if it failled
+	def writeDepFile(self, src_file_basename, file_content) :
+		# build the dependency file's path
+		dep_file_path = self.buildDepFilePath(src_file_basename)
+
+		# write the content to the dependency file, if it changed
+		write_result = General.General.writeFileIfChanged(dep_file_path, file_content)
+
+		# check if the file was written
+		if (write_result == 1) :
+			# it was, so the information known about the dependency file is no longer valid
+			self.stat_cache.invalidate(dep_file_path)
+
+		return(write_result)
+
+	# checks if the rules are written to aggregated dependency files, which depends on the "output_mode" configuration
+	# NOTE: only the "template" output format can be aggregated, since Ninja needs a depfile for each build statement
+	# returns True if they are, False otherwise
+	def isAggregated(self) :
+		return(self.config["output_mode"] != "files" and self.config["output_format"] == "template")
+
+	# finds the dependency file with a source file's rule, which is either the source file's dependency file or, if the
+	# "output_mode" configuration is "single" or "directory", the aggregated dependency file it was written to
+	# returns the dependency file's absolute path, or None if there is no such file
+	def findDepFilePath(self, src_file_basename, dep_file_basename) :
+		# check if the rules are in aggregated dependency files
+		if (not self.isAggregated()) :
+			# they aren't
+			return(self.files["dependency"].get(dep_file_basename))
+
+		# check if this source file's rule was written to the aggregated dependency file it belongs to
+		if (src_file_basename not in self.aggregate_rules or self.aggregate_rules[src_file_basename][0] != self.buildAggregatePath(src_file_basename)) :
+			# it wasn't
+			return(None)
+
+		return(self.aggregate_rules[src_file_basename][0])
+
+	# generates a source file's rule, based on the rule template, to be written to its aggregated dependency file
+	# by writeAggregateFiles()
+	# returns True if successful or False if failed
+	def generateAggregateRule(self, src_file_basename, dependency_str) :
+		# replace any valid keywords in the rule template by the respective data
+		rule_str = self.replaceKeywords(src_file_basename, dependency_str)
+
+		# check if the final rule template string is empty
+		if (rule_str == "") :
+			# it is
 			return(False)
 
+		# keep the previous rule, to know if the rule changed once the aggregated dependency file is written
+		if (src_file_basename not in self.pending_rules) :
+			self.pending_rules[src_file_basename] = self.aggregate_rules.get(src_file_basename, (None, None))[1]
+
+		self.aggregate_rules[src_file_basename] = (self.buildAggregatePath(src_file_basename), rule_str)
+
+		return(True)
+
+	# writes each aggregated dependency file whose rules changed, or that no longer exists, with the rules of all its
+	# source files, and adds the source files whose rules were generated this cycle to "results"
+	# the files are replaced atomically, so they are never seen partially written
+	# "results" has the format returned by runScanCycle()
+	def writeAggregateFiles(self, results) :
+		# group the rules by aggregated dependency file, in the order of the source files' basenames
+		# NOTE: the rules of the source files that no longer exist are removed
+		aggregate_files = dict()
+		for src_file_basename in sorted(self.aggregate_rules) :
+			# check if this source file still exists
+			if (src_file_basename not in self.files["source"]) :
+				# it doesn't
+				del self.aggregate_rules[src_file_basename]
+				continue
+
+			file_path, rule_str = self.aggregate_rules[src_file_basename]
+			if (file_path not in aggregate_files) :
+				aggregate_files[file_path] = list()
+
+			# make sure each rule starts in a new line
+			if (not rule_str.endswith("\n")) :
+				rule_str += "\n"
+			aggregate_files[file_path].append(rule_str)
+
+		# stores the result of writing each aggregated dependency file and the file's content before it was written
+		# format: [aggregated dependency file abs path] = tuple(1 if written, 0 if unchanged or -1 if failed, previous content or None)
+		write_results = dict()
+
+		# loop through each aggregated dependency file
+		for file_path in aggregate_files :
+			file_content = "".join(aggregate_files[file_path])
+
+			# check if the file still has the content last written
+			if (file_content == self.aggregate_contents.get(file_path) and self.stat_cache.isFile(file_path)) :
+				# it has, so it doesn't need to be read or written
+				write_results[file_path] = (0, file_content)
+				continue
+
+			# get the file's current content
+			# NOTE: used to know which source files' rules changed, when their previous rules aren't known
+			# NOTE: if the file's content isn't valid text it can't be read, so it will be replaced
+			previous_content = General.General.readFile(file_path)
+
+			# check if the file already has this content
+			if (file_content == previous_content) :
+				# it has
+				write_results[file_path] = (0, previous_content)
+				self.aggregate_contents[file_path] = file_content
+			elif (General.General.writeFileAtomic(file_path, file_content)) :
+				# it didn't and it was written, so the information known about the file is no longer valid
+				write_results[file_path] = (1, previous_content)
+				self.aggregate_contents[file_path] = file_content
+				self.stat_cache.invalidate(file_path)
+			else :
+				# it didn't and it failed to be written
+				write_results[file_path] = (-1, previous_content)
+				self.aggregate_contents.pop(file_path, None)
+
+		# loop through each source file whose rule was generated this cycle
+		for src_file_basename in sorted(self.pending_rules) :
+			previous_rule = self.pending_rules[src_file_basename]
+
+			# check if this source file still exists
+			if (src_file_basename not in self.aggregate_rules) :
+				# it doesn't
+				continue
+
+			file_path, rule_str = self.aggregate_rules[src_file_basename]
+			write_result, previous_content = write_results[file_path]
+
+			# check if the aggregated dependency file has the current rule
+			if (write_result == -1) :
+				# it hasn't
+				# the rule will be generated again in the next cycle
+				del self.aggregate_rules[src_file_basename]
+
+				self.cli_obj.printMsg(0, "The dependency file for \"" + src_file_basename + "\" failed to be updated.", True)
+				results["failed"].append(src_file_basename)
+				continue
+
+			# keep a record of the rule template's modify time when this rule was generated
+			self.checked_mtimes[src_file_basename][self.files["dependency_template"]] = self.file_fingerprints.getMtime(self.files["dependency_template"])
+			self.dirty_checked_mtimes.add(src_file_basename)
+
+			# check if the rule changed
+			# NOTE: if the previous rule isn't known, it changed if it isn't in the file's previous content
+			if (write_result == 1 and rule_str != previous_rule and (previous_rule != None or previous_content == None or rule_str not in previous_content)) :
+				# it did
+				self.cli_obj.printMsg(1, "The dependency file for \"" + src_file_basename + "\" was updated.", True)
+				results["updated"].append(src_file_basename)
+			else :
+				# it didn't
+				results["unchanged"].append(src_file_basename)
+
+		self.pending_rules.clear()
+
+	# builds the absolute path of the aggregated dependency file a source file's rule is written to
+	# based on the current "output_mode" and "dependency_dir" configuration values
+	# if "single", every rule is written to the same file, stored in the same directory as the project's configuration file
+	# if "directory", the rules are written to a file in the directory where the source file's dependency file would be stored
+	def buildAggregatePath(self, src_file_basename) :
+		# check if the rules are sharded by directory
+		if (self.config["output_mode"] == "directory") :
+			# they are
+			return(os.path.dirname(self.buildDepFilePath(src_file_basename)) + os.sep + Application.aggregate_basename_)
+
+		return(os.path.dirname(self.buildProjConfigPath()) + os.sep + Application.aggregate_basename_)
+
+	# builds the absolute path where a source file's dependency file should be located at
+	# based on the current "dependency_dir" configuration value
+	def buildDepFilePath(self, src_file_basename) :
 		# split the src file's path into the directory, name and extension
 		src_file_parts = os.path.split(self.files["source"][src_file_basename])
 		src_file_dir = src_file_parts[0]
 		src_file_name = ""
-		src_file_ext = ""
 
 		# check if the source file has an explicit extension
 		aux_pos = src_file_basename.rfind(".")
 		if (aux_pos != -1) :
 			# it has
 			src_file_name = src_file_basename[:aux_pos]
-			src_file_ext = src_file_basename[aux_pos + 1:]
 		else :
 			# it doesn't
 			src_file_name = src_file_basename
@@ -681,13 +1785,7 @@ class Application :
 			# it should
 			dependency_path = src_file_dir
 
-		# write the rule template to the dependency file for this specific source file
-		if (not General.General.writeFile(dependency_path + "\\" + src_file_name + ".d", "w", dependency_template_str)) :
-			# failed to write to file
-			return(False)
-
-		# at this point, everything went OK
-		return(True)
+		return(dependency_path + os.sep + src_file_name + "." + Application.dep_extension_)
 
 	# resets the configuration in effect to the defaults
 	# returns True if successful or False is failed
@@ -696,7 +1794,7 @@ class Application :
 		self.config.clear()
 
 		# check if the program's default configuration file exists
-		json_path = os.path.abspath(self.program_root + "\\data\\default_config.json")
+		json_path = os.path.abspath(os.path.join(self.program_root, "data", "default_config.json"))
 		if (not os.path.isfile(json_path)) :
 			# the file doesn't exist
 			# print error message
@@ -795,7 +1893,7 @@ class Application :
 		project_config_path = self.findProjConfigFile()
 
 		# check if the current project has a configuration file
-		if (project_config_path == "" or not os.path.isfile(project_config_path)) :
+		if (project_config_path == "") :
 			# it doesn't
 			# print warning message
 			self.cli_obj.printMsg(2, "This project doesn't have a configuration file yet. Use the command \"config save\" to create one.", True)
@@ -824,6 +1922,13 @@ class Application :
 				self.config.clear()
 				return(False)
 
+			# add any configurations missing from this project's configuration file, with their default values
+			# NOTE: relevant for configuration files saved before those configurations existed
+			default_config = General.General.parseJSON(os.path.abspath(os.path.join(self.program_root, "data", "default_config.json")))
+			for config_key in default_config :
+				if (config_key not in self.config) :
+					self.config[config_key] = default_config[config_key]
+
 			# validate the loaded configuration
 			for config_key in self.config_validation :
 				# check if this validation passed
@@ -914,7 +2019,7 @@ class Application :
 		if ("min" in self.config_validation[config_key] and self.config[config_key] < self.config_validation[config_key]["min"]) :
 			# the config value is below the minimum
 			# print error message
-			self.cli_obj.printMsg(0, "The value for the configuration \"" + config_key + "\" is below the valid minimum of " + self.config_validation[config_key]["min"], True)
+			self.cli_obj.printMsg(0, "The value for the configuration \"" + config_key + "\" is below the valid minimum of " + str(self.config_validation[config_key]["min"]) + ".", True)
 
 			# return faillure
 			return(False)
@@ -923,7 +2028,16 @@ class Application :
 		if ("max" in self.config_validation[config_key] and self.config[config_key] > self.config_validation[config_key]["max"]) :
 			# the config value is above the maximum
 			# print error message
-			self.cli_obj.printMsg(0, "The value for the configuration \"" + config_key + "\" is above the valid maximum of " + self.config_validation[config_key]["max"] + ".", True)
+			self.cli_obj.printMsg(0, "The value for the configuration \"" + config_key + "\" is above the valid maximum of " + str(self.config_validation[config_key]["max"]) + ".", True)
+
+			# return faillure
+			return(False)
+
+		# check if the "values" parameter needs to be checked and if so validate the config value
+		if ("values" in self.config_validation[config_key] and self.config[config_key] not in self.config_validation[config_key]["values"]) :
+			# the config value isn't one of the valid values
+			# print error message
+			self.cli_obj.printMsg(0, "The value for the configuration \"" + config_key + "\" isn't valid. The valid values are: " + ", ".join(self.config_validation[config_key]["values"]) + ".", True)
 
 			# return faillure
 			return(False)
@@ -992,6 +2106,7 @@ class Application :
 
 				# delete this file from the project's directory tree
 				os.remove(self.files["dependency"][dep_file_basename])
+				self.stat_cache.invalidate(self.files["dependency"][dep_file_basename])
 
 				# remove this file from files["dependency"]
 				del self.files["dependency"][dep_file_basename]
@@ -1035,7 +2150,7 @@ class Application :
 						# check if this file is in the correct location
 						if (os.path.dirname(self.files["dependency"][dep_file_basename]) != os.path.dirname(self.files["source"][src_file_basename])) :
 							# it isn't
-							new_path = os.path.dirname(self.files["source"][src_file_basename]) + "\\" + dep_file_basename
+							new_path = os.path.dirname(self.files["source"][src_file_basename]) + os.sep + dep_file_basename
 							move_file = True
 
 						# no need to looping through the rest of the source extensions
@@ -1045,7 +2160,7 @@ class Application :
 				# check if this file is in the correct location
 				if (os.path.dirname(self.files["dependency"][dep_file_basename]) != self.config["dependency_dir"]) :
 					# it isn't
-					new_path = self.config["dependency_dir"] + "\\" + dep_file_basename
+					new_path = self.config["dependency_dir"] + os.sep + dep_file_basename
 					move_file = True
 
 			# check if this dependency file needs to be moved
@@ -1054,7 +2169,14 @@ class Application :
 				continue
 
 			# at this point this dependency file needs to be moved from its current location to the correct one
-			if (not General.General.moveFile(self.files["dependency"][dep_file_basename], new_path)) :
+			move_ok = General.General.moveFile(self.files["dependency"][dep_file_basename], new_path)
+
+			# the information known about the file's old and new paths is no longer valid
+			self.stat_cache.invalidate(self.files["dependency"][dep_file_basename])
+			self.stat_cache.invalidate(new_path)
+
+			# check if the file was moved
+			if (not move_ok) :
 				# failed to move the file
 				success = False
 
@@ -1079,7 +2201,7 @@ class Application :
 		project_config_path = self.findProjConfigFile()
 
 		# check if the current project has a configuration file
-		if (project_config_path != "" and os.path.isfile(project_config_path)) :
+		if (project_config_path != "") :
 			# it does
 			# get the absolute path to where the file should be stored
 			correct_path = self.buildProjConfigPath()
@@ -1109,11 +2231,11 @@ class Application :
 		if (self.config["dependency_dir"] == "") :
 			# it is
 			# the project's config file will be stored in the project's root directory
-			return(self.project_root + "\\" + Application.project_config_basename_)
+			return(self.project_root + os.sep + Application.project_config_basename_)
 		else :
 			# it isn't
 			# the "dependency_dir" config value is the path where the file will be stored
-			return(self.config["dependency_dir"] + "\\" + Application.project_config_basename_)
+			return(self.config["dependency_dir"] + os.sep + Application.project_config_basename_)
 
 	# searches for the location of this project's configuration file, in the project's directory
 	# returns the file's absolute path if found, or an empty string if not found
@@ -1121,15 +2243,25 @@ class Application :
 		# stores the absolute path to this project's config file
 		project_config_path = ""
 
+		# check the locations where the file is stored, starting with the one based on the current configurations
+		# NOTE: the configurations might not be loaded yet, in which case only the project's root directory is checked
+		candidate_paths = [self.project_root + os.sep + Application.project_config_basename_]
+		if ("dependency_dir" in self.config) :
+			candidate_paths.insert(0, self.buildProjConfigPath())
+		for candidate_path in candidate_paths :
+			if (os.path.isfile(candidate_path)) :
+				# the file is in this location, so there is no need to search the project's directory tree
+				return(candidate_path)
+
 		# search for this project's config file, if it exists
-		found_files = General.General.findFiles(set([Application.project_config_basename_]), self.project_root)
+		found_files = TreeWalker.TreeWalker.findFiles(set([Application.project_config_basename_]), self.project_root)
 
 		# check if this project has a configuration file
 		if (len(found_files) > 0) :
 			# it has
 			# get the project's config file absolute path
 			if (Application.project_config_basename_ in found_files) :
-				project_config_path = found_files[Application.project_config_basename_]
+				project_config_path = found_files[Application.project_config_basename_].path
 
 		# return the path
 		return(project_config_path)
@@ -1156,7 +2288,7 @@ class Application :
 			return(True)
 
 		# check if it's an absolute path
-		if (re.match("[a-z]:[\\\\]", self.config[config_key], re.I) == None) :
+		if (not General.General.isAbsolutePath(self.config[config_key])) :
 			# it isn't, so it's a relative path
 			# check if this config can be a relative path
 			if ("rel" in self.config_validation[config_key]["path_types"]) :
@@ -1168,7 +2300,7 @@ class Application :
 				else :
 					# it isn't
 					# convert the relative path into an absolute path
-					self.config[config_key] = self.project_root + "\\" + self.config[config_key]
+					self.config[config_key] = self.project_root + os.sep + self.config[config_key]
 			else :
 				# it can't
 				# print error message
@@ -1203,6 +2335,28 @@ class Application :
 			# the operation failed
 			return(False)
 
+		# check if the crawl cache is open and not in the correct directory
+		if (self.crawl_cache != None and self.crawl_cache.db_path != self.buildCrawlCachePath()) :
+			# it is, so move it
+			# NOTE: if the file can't be moved, a new crawl cache will be created in the correct directory
+			old_path = self.crawl_cache.db_path
+			self.closeCrawlCache()
+			try :
+				os.replace(old_path, self.buildCrawlCachePath())
+			except OSError as e :
+				pass
+			self.openCrawlCache()
+
+		# check if the manifest was created and isn't in the correct directory
+		if (self.manifest != None and self.manifest.file_path != self.buildManifestPath()) :
+			# it is, so move it
+			# NOTE: if the file can't be moved, the existing dependency files are parsed on the next scan
+			try :
+				os.replace(self.manifest.file_path, self.buildManifestPath())
+			except OSError as e :
+				pass
+			self.manifest.file_path = self.buildManifestPath()
+
 		# at this point the validation passed
 		return(True)
 
@@ -1216,9 +2370,156 @@ class Application :
 			# rebuild the DepListBuilder's search paths
 			self.dep_list_builder_obj.buildSearchPaths()
 
+			# the stored information obtained by crawling files is no longer valid
+			self.resetCrawlCache()
+
+		# this particular operation doesn't return faillure
+		return(True)
+
+	# called when the "compile_commands" configuration is changed
+	# returns True if successful, False otherwise
+	def updateCompileCommands(self, config_key) :
+		# check if the DepListBuilder instance has been created
+		# NOTE: relevant when the initial configuration is loaded on the program's start, in which case
+		# 		this method is called again once the DepListBuilder instance is created
+		if (hasattr(self, "dep_list_builder_obj")) :
+			# it has
+			# use the compilation database to find the include directories of each source file
+			if (not self.dep_list_builder_obj.setCompileCommands(self.config[config_key])) :
+				# it couldn't be loaded
+				# print warning message
+				self.cli_obj.printMsg(2, "The compilation database \"" + self.config[config_key] + "\" couldn't be loaded. It will be loaded once it's fixed, until then the search paths will be used for every source file.", True)
+
+		# this particular operation doesn't return faillure
+		return(True)
+
+	# called when the "ignore_patterns" configuration is changed
+	# builds the ignore rules from the configuration and the project's ignore file, if it exists
+	# returns True if successful, False otherwise
+	def updateIgnoreRules(self, config_key) :
+		# build the list of patterns from the configuration, followed by the ones in the project's ignore file
+		ignore_patterns = self.config[config_key].split(";")
+		file_content = General.General.readFile(self.project_root + os.sep + Application.ignore_file_basename_)
+		if (file_content != None) :
+			ignore_patterns.extend(file_content.splitlines())
+
+		# check if the patterns changed since the ignore rules were last built
+		if (ignore_patterns == self.ignore_patterns) :
+			# they didn't, so the current rules are still valid
+			return(True)
+		self.ignore_patterns = ignore_patterns
+
+		# build the ignore rules
+		ignore_rules = IgnoreRules.IgnoreRules()
+		ignore_rules.addPatterns(ignore_patterns)
+
+		# use them in the searches of directory trees
+		if (len(ignore_rules.rules) == 0) :
+			TreeWalker.TreeWalker.ignore_rules_ = None
+		else :
+			TreeWalker.TreeWalker.ignore_rules_ = ignore_rules
+
+		# the files found in previous searches might be excluded now or vice-versa, so the project's
+		# directory tree will need to be searched from scratch
+		self.tree_snapshot.clear()
+		self.files.clear()
+
+		# the same goes for the files found while crawling
+		self.resetCrawlData()
+
+		# this particular operation doesn't return faillure
+		return(True)
+
+	# called when the "persistent_cache" configuration is changed
+	# returns True if successful, False otherwise
+	def updateCrawlCache(self, config_key) :
+		# check if the DepListBuilder instance has been created
+		# NOTE: relevant when the initial configuration is loaded on the program's start, in which case
+		# 		the crawl cache is opened once the DepListBuilder instance is created
+		if (hasattr(self, "dep_list_builder_obj")) :
+			# it has
+			# open or close the crawl cache
+			self.openCrawlCache()
+
+		# this particular operation doesn't return faillure
+		return(True)
+
+	# discards the information obtained by crawling files, both in the DepListBuilder and in the crawl cache
+	def resetCrawlData(self) :
+		# check if the DepListBuilder instance has been created
+		# NOTE: relevant when the initial configuration is loaded on the program's start
+		if (hasattr(self, "dep_list_builder_obj")) :
+			# it has
+			self.dep_list_builder_obj.clearCrawlData()
+			self.resetCrawlCache()
+
+	# called when the "walker_threads" configuration is changed
+	# returns True if successful, False otherwise
+	def updateTreeWalker(self, config_key) :
+		# set the number of threads used to walk directory trees
+		TreeWalker.TreeWalker.workers_ = self.config[config_key]
+
+		# this particular operation doesn't return faillure
+		return(True)
+
+	# called when the "crawl_workers" configuration is changed
+	# returns True if successful, False otherwise
+	def updateCrawlWorkers(self, config_key) :
+		# set the number of workers used to scan the files in parallel
+		DepListBuilder.DepListBuilder.workers_ = self.config[config_key]
+
+		# this particular operation doesn't return faillure
+		return(True)
+
+	# called when the "crawl_pool" configuration is changed
+	# returns True if successful, False otherwise
+	def updateCrawlPool(self, config_key) :
+		# set the kind of pool the workers run in
+		DepListBuilder.DepListBuilder.pool_ = self.config[config_key]
+
+		# this particular operation doesn't return faillure
+		return(True)
+
+	# called when the "content_hash" configuration is changed
+	# returns True if successful, False otherwise
+	def updateFileFingerprints(self, config_key) :
+		# check if the fingerprints were enabled or disabled
+		if (self.file_fingerprints.enabled != self.config[config_key]) :
+			# they were, so any stored fingerprints might be outdated
+			self.file_fingerprints.clear()
+
+		# set whether the fingerprints are used
+		self.file_fingerprints.enabled = self.config[config_key]
+
+		# this particular operation doesn't return faillure
+		return(True)
+
+	# called when the "scanner_engine" configuration is changed
+	# returns True if successful, False otherwise
+	def updateIncludeScanner(self, config_key) :
+		# set the engine used to find the #include directives in the files
+		IncludeScanner.IncludeScanner.engine_ = self.config[config_key]
+
+		# the engines might find different directives, so the files need to be crawled again
+		self.resetCrawlData()
+
 		# this particular operation doesn't return faillure
 		return(True)
 
 	# getter for config
 	def getConfig(self) :
 		return(self.config)
+
+	# getter for the performance counters
+	# returns a dict() with format: [counter description] = value
+	def getStats(self) :
+		return(dict([
+			("stat cache hits", self.stat_cache.hits),
+			("stat cache misses (file system accesses)", self.stat_cache.misses),
+			("files hashed", self.file_fingerprints.hashes),
+			("modifications ignored because the content didn't change", self.file_fingerprints.unchanged),
+			("modified files whose #include directives didn't change", self.dep_list_builder_obj.getCounter("signature_hits")),
+			("dependency lists assembled from cached closures", self.dep_list_builder_obj.getCounter("closure_hits")),
+			("include searches skipped because the file is known to be missing", self.dep_list_builder_obj.getCounter("searches_avoided")),
+			("files and directories skipped by the ignore rules", TreeWalker.TreeWalker.skipped_)
+		]))
@@ -127,6 +127,7 @@ class Cli :
 		str += "\n\t- config save: saves the current configuration for this project, which will be loaded and used in the future."
 		str += "\n\t- config load: loads this project's configuration if one exists, or the program default configuration otherwise."
 		str += "\n\t- config default: changes the current configuration to the program default configuration."
+		str += "\n\t- stats: shows the performance counters accumulated since the program started."
 		str += "\n\t- help: shows help information."
 		str += "\n\t- exit: exit the program."
 
@@ -243,6 +244,25 @@ class Cli :
 		# signal this class to continue asking for commands
 		return(0)
 
+	# processes the "stats" command
+	def processStats(self, parameters) :
+		# stores the message text
+		text = "The performance counters since the program started are:"
+
+		# get the current counters
+		stats_data = self.caller_obj.getStats()
+
+		# loop through the counters
+		for stats_key in stats_data :
+			# add this counter to the message text
+			text += "\n\t- " + stats_key + " = " + str(stats_data[stats_key])
+
+		# print the message
+		self.printMsg(1, text, True)
+
+		# signal this class to continue asking for commands
+		return(0)
+
 	# processes the "exit" command
 	def processExit(self, parameters) :
 		# signal this class that it should stop asking for commands and inform
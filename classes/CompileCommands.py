@@ -0,0 +1,215 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+import os, re
+from classes import General
+
+class CompileCommands :
+	"""Include directories of each translation unit, read from a compilation database (compile_commands.json file).
+	Each distinct set of include flags is only parsed once, and its include directories are shared by every
+	translation unit compiled with it."""
+
+	# class variable with the flags that add an include directory and the group each one belongs to
+	# the groups are searched in order: "-iquote" directories, then "-I" directories and then "-isystem" directories
+	# NOTE: the "-iquote" directories are only searched by the #include directives using quotes
+	flag_groups_ = {"-iquote" : 0, "-I" : 1, "-isystem" : 2}
+
+	# class variable with the same flags, plus the ones only recognised in the commands of MSVC style compilers
+	# NOTE: for other compilers an argument starting with "/I" is a path (ex: "/Include/file.c")
+	msvc_flag_groups_ = {"-iquote" : 0, "-I" : 1, "/I" : 1, "-isystem" : 2}
+
+	# class variable with the basenames of the MSVC style compilers, in lower case
+	msvc_compilers_ = ("cl", "cl.exe", "clang-cl", "clang-cl.exe")
+
+	# class variable with the regex matching each argument of a command string, which is a sequence of
+	# characters other than whitespace, where quoted parts can have whitespace
+	argument_regex_ = re.compile("(?:[^\\s\"]|\"[^\"]*\")+")
+
+	def __init__(self, db_path, stat_cache) :
+		# instance variable storing the absolute path to the compilation database
+		self.db_path = db_path
+
+		# instance variable referencing the StatCache used to know if the compilation database changed
+		self.stat_cache = stat_cache
+
+		# instance variable storing the modify time and size of the compilation database when it was last loaded
+		# or None if it hasn't been loaded yet
+		self.db_stat = None
+
+		# instance variable storing whether the compilation database was successfully loaded the last time
+		self.valid = False
+
+		# instance variable storing the include directories of each translation unit
+		# format: [source file abs path] = tuple(tuple() with the include directory abs paths only searched by the
+		# 		  #include directives using quotes, tuple() with the ones searched by every directive), in the order they
+		# 		  are searched, or an empty tuple() if it has no include directories
+		self.units = dict()
+
+		# instance variable storing the include directories of each distinct set of include flags
+		# format: [tuple(working directory, tuple() with each include flag as tuple(flag, value))] = same tuple() as in self.units
+		self.flag_sets = dict()
+
+	# loads the compilation database again, if it changed since it was last loaded
+	# returns True if it was loaded again, False otherwise
+	def refresh(self) :
+		# get the compilation database's modify time and size
+		db_stat = self.stat_cache.lookup(self.db_path)
+
+		# check if it changed since it was last loaded
+		if (self.db_stat != None and db_stat == self.db_stat) :
+			# it didn't
+			return(False)
+
+		self.db_stat = db_stat
+		self.valid = self.load()
+
+		return(True)
+
+	# reads the compilation database and finds the include directories of each translation unit
+	# returns True if successful, False otherwise
+	def load(self) :
+		# the translation units of a previous load are no longer valid, but the flag sets can be reused
+		self.units.clear()
+
+		# check if the compilation database exists
+		if (self.db_stat == None) :
+			# it doesn't
+			return(False)
+
+		# get the compilation database's content
+		db_entries = General.General.parseJSON(self.db_path)
+		if (not isinstance(db_entries, list)) :
+			# it isn't valid
+			return(False)
+
+		# loop through each translation unit
+		for db_entry in db_entries :
+			try :
+				working_dir = General.General.standardizePath(db_entry["directory"])
+				file_path = CompileCommands.joinPath(working_dir, db_entry["file"])
+
+				# get the compiler's arguments, which are either a list or a single command string
+				if ("arguments" in db_entry) :
+					arguments = db_entry["arguments"]
+				else :
+					arguments = CompileCommands.splitCommand(db_entry["command"])
+
+				# get this translation unit's set of include flags
+				flag_set = (working_dir, CompileCommands.findIncludeFlags(arguments))
+			except (AttributeError, KeyError, TypeError, ValueError) as e :
+				# this entry isn't valid, so ignore it
+				continue
+
+			# get the include directories of this set of include flags, unless it was already parsed
+			if (flag_set not in self.flag_sets) :
+				self.flag_sets[flag_set] = CompileCommands.buildIncludeDirs(flag_set[0], flag_set[1])
+
+			# the first entry of each file is the one used, like most tools do
+			if (file_path not in self.units) :
+				self.units[file_path] = self.flag_sets[flag_set]
+
+		return(True)
+
+	# gets the include directories of a translation unit
+	# returns the same tuple() as in self.units or None if the file isn't in the compilation database
+	def getIncludeDirs(self, file_path) :
+		return(self.units.get(file_path))
+
+	# splits a command string into its arguments
+	# NOTE: backslashes are kept, since they are the paths' separator, and the quotes are removed
+	# returns a list() with the arguments
+	@staticmethod
+	def splitCommand(command) :
+		return([argument.replace("\"", "") for argument in CompileCommands.argument_regex_.findall(command)])
+
+	# finds the flags that add include directories in a list of compiler arguments
+	# supports both the "-Idir" and the "-I dir" forms, and the "/I" flags if the compiler is MSVC style
+	# returns a tuple() with each flag as tuple(flag, value), in the order they appear
+	@staticmethod
+	def findIncludeFlags(arguments) :
+		include_flags = list()
+
+		# get the flags recognised by this compiler, which is the first argument
+		flag_groups = CompileCommands.flag_groups_
+		if (len(arguments) > 0 and arguments[0].replace("\\", "/").split("/")[-1].lower() in CompileCommands.msvc_compilers_) :
+			flag_groups = CompileCommands.msvc_flag_groups_
+
+		# loop through each argument
+		index = 0
+		while index < len(arguments) :
+			argument = arguments[index]
+			index += 1
+
+			# check if this argument is an include flag
+			for flag in flag_groups :
+				if (argument.startswith(flag)) :
+					# it is
+					# check if the value is in the next argument
+					if (argument == flag) :
+						# it is
+						if (index < len(arguments)) :
+							include_flags.append((flag, arguments[index]))
+							index += 1
+					else :
+						# it isn't
+						include_flags.append((flag, argument[len(flag):]))
+
+					break
+
+		return(tuple(include_flags))
+
+	# builds the include directories of a set of include flags
+	# relative directories are relative to the working directory the compiler runs in
+	# returns the same tuple() as in self.units, without repeats
+	@staticmethod
+	def buildIncludeDirs(working_dir, include_flags) :
+		# check if there are any include directories
+		if (len(include_flags) == 0) :
+			# there aren't
+			return(tuple())
+
+		# stores the include directories in each group
+		groups = [list(), list(), list()]
+
+		# loop through each flag
+		for flag, value in include_flags :
+			groups[CompileCommands.msvc_flag_groups_[flag]].append(CompileCommands.joinPath(working_dir, value))
+
+		# get the directories only searched by the #include directives using quotes, keeping only the first occurrence
+		# of each directory
+		quoted_dirs = list()
+		for include_dir in groups[0] :
+			if (include_dir not in quoted_dirs) :
+				quoted_dirs.append(include_dir)
+
+		# join the groups searched by every #include directive, keeping only the first occurrence of each directory
+		include_dirs = list()
+		for include_dir in groups[1] + groups[2] :
+			if (include_dir not in include_dirs) :
+				include_dirs.append(include_dir)
+
+		return((tuple(quoted_dirs), tuple(include_dirs)))
+
+	# builds the absolute path of a path, which might be relative to "base_dir"
+	# returns the standardized absolute path
+	@staticmethod
+	def joinPath(base_dir, path) :
+		# standardize the path, keeping any leading separator of a path relative to the current drive
+		path = path.replace("/", os.sep).replace("\\", os.sep)
+
+		# check if it's an absolute path
+		if (not General.General.isAbsolutePath(path)) :
+			# it isn't
+			path = os.path.join(base_dir, path)
+
+		return(General.General.standardizePath(os.path.normpath(path)))
@@ -0,0 +1,237 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+import os, json, sqlite3
+
+class CrawlCache :
+	"""Persistent cache of the information obtained by crawling files, stored in a SQLite database.
+	Allows a restart of the program to only check the files' modify times instead of crawling them all again."""
+
+	# class variable storing the version of the database's layout
+	# a database with a different version is discarded
+	version_ = 2
+
+	def __init__(self, db_path) :
+		# instance variable storing the absolute path to the database file
+		self.db_path = db_path
+
+		# instance variable storing the connection to the database, or None if it isn't open
+		self.connection = None
+
+		# instance variable storing the dependency times checked for each source file, as of the last save
+		# format: [source file basename] = dict() with format: [file absolute path] = modify time
+		self.saved_checked_mtimes = dict()
+
+	# opens the database, creating it if needed
+	# "context" should be a string identifying the configuration the stored information depends on
+	# if the database was created by a different version of this class or in a different context, it's emptied
+	# returns True if successful or False otherwise
+	def open(self, context) :
+		# make sure no previous connection is open
+		self.close()
+
+		try :
+			self.connection = sqlite3.connect(self.db_path)
+			self.createTables()
+
+			# check if the stored information is valid for this version and context
+			if (self.getMeta("version") != str(CrawlCache.version_) or self.getMeta("context") != context) :
+				# it isn't
+				self.clearTables(context)
+		except sqlite3.OperationalError as e :
+			# the database can't be used (ex: it's locked or the directory isn't writable)
+			self.close()
+			return(False)
+		except sqlite3.DatabaseError as e :
+			# the database is corrupted or isn't a database, so start a new one
+			self.close()
+			try :
+				os.remove(self.db_path)
+				self.connection = sqlite3.connect(self.db_path)
+				self.createTables()
+				self.clearTables(context)
+			except (OSError, sqlite3.Error) as e :
+				# the database can't be used
+				self.close()
+				return(False)
+		except sqlite3.Error as e :
+			# the database can't be used
+			self.close()
+			return(False)
+
+		# at this point everything went OK
+		return(True)
+
+	# closes the database, if it's open
+	def close(self) :
+		# check if the database is open
+		if (self.connection != None) :
+			# it is
+			self.connection.close()
+			self.connection = None
+
+	# creates the database's tables, if they don't exist
+	def createTables(self) :
+		with self.connection :
+			self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+			self.connection.execute("CREATE TABLE IF NOT EXISTS files (basename TEXT PRIMARY KEY, crawl_mtime REAL, known_deps TEXT, unknown_deps TEXT, signature TEXT, signature_mtime REAL)")
+			self.connection.execute("CREATE TABLE IF NOT EXISTS known_paths (basename TEXT PRIMARY KEY, path TEXT)")
+			self.connection.execute("CREATE TABLE IF NOT EXISTS checked_mtimes (src_basename TEXT, path TEXT, mtime REAL, PRIMARY KEY (src_basename, path))")
+
+	# gets the value of an entry in the meta table
+	# returns the value, or None if the entry doesn't exist
+	def getMeta(self, key) :
+		row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+		return(None if row == None else row[0])
+
+	# discards all the stored information and sets the context it will depend on
+	# returns True if successful or False otherwise
+	def reset(self, context) :
+		try :
+			self.clearTables(context)
+		except sqlite3.Error as e :
+			# failled to write to the database
+			return(False)
+
+		return(True)
+
+	# empties the database's tables and sets the context the stored information will depend on
+	# NOTE: raises an sqlite3.Error if the database can't be written
+	def clearTables(self, context) :
+		with self.connection :
+			self.connection.execute("DELETE FROM files")
+			self.connection.execute("DELETE FROM known_paths")
+			self.connection.execute("DELETE FROM checked_mtimes")
+			self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?), ('context', ?)", (str(CrawlCache.version_), context))
+
+		self.saved_checked_mtimes.clear()
+
+	# loads the stored information into a DepListBuilder and into the dependency times checked for each source file
+	# NOTE: the information isn't validated here, since the DepListBuilder and the Application classes already
+	# 		compare it with the files' current modify times before using it
+	# returns True if successful or False otherwise
+	def load(self, dep_list_builder_obj, checked_mtimes) :
+		try :
+			# load the crawl information of each file
+			for basename, crawl_mtime, known_deps, unknown_deps, signature, signature_mtime in self.connection.execute("SELECT basename, crawl_mtime, known_deps, unknown_deps, signature, signature_mtime FROM files") :
+				if (crawl_mtime != None) :
+					dep_list_builder_obj.files_crawl_mtime[basename] = crawl_mtime
+				if (known_deps != None) :
+					dep_list_builder_obj.file_known_deps[basename] = set(json.loads(known_deps))
+				if (unknown_deps != None) :
+					dep_list_builder_obj.file_unknown_deps[basename] = set(json.loads(unknown_deps))
+				if (signature != None) :
+					dep_list_builder_obj.file_signatures[basename] = tuple(json.loads(signature))
+					dep_list_builder_obj.signature_mtimes[basename] = signature_mtime
+
+			# load the known paths
+			for basename, path in self.connection.execute("SELECT basename, path FROM known_paths") :
+				dep_list_builder_obj.known_paths[basename] = path
+
+			# load the dependency times checked for each source file
+			for src_basename, path, mtime in self.connection.execute("SELECT src_basename, path, mtime FROM checked_mtimes") :
+				if (src_basename not in checked_mtimes) :
+					checked_mtimes[src_basename] = dict()
+				checked_mtimes[src_basename][path] = mtime
+		except (sqlite3.Error, ValueError) as e :
+			# the stored information can't be used
+			return(False)
+
+		# keep a copy of what was loaded, so only the changes are saved
+		self.saved_checked_mtimes = dict([(src_basename, checked_mtimes[src_basename].copy()) for src_basename in checked_mtimes])
+
+		# at this point everything went OK
+		return(True)
+
+	# saves the crawl information that changed since the last save
+	# returns True if successful or False otherwise
+	def saveCrawls(self, dep_list_builder_obj) :
+		# check if anything changed
+		if (len(dep_list_builder_obj.dirty_files) == 0 and len(dep_list_builder_obj.dirty_known_paths) == 0) :
+			# nothing did
+			return(True)
+
+		try :
+			with self.connection :
+				# save the crawl information of each file that changed
+				for basename in dep_list_builder_obj.dirty_files :
+					# check if this file still has any crawl information
+					if (basename not in dep_list_builder_obj.files_crawl_mtime and basename not in dep_list_builder_obj.file_known_deps and basename not in dep_list_builder_obj.file_signatures) :
+						# it doesn't
+						self.connection.execute("DELETE FROM files WHERE basename = ?", (basename,))
+						continue
+
+					# build the row
+					# NOTE: the sets are sorted, so the same information is always stored the same way
+					known_deps = dep_list_builder_obj.file_known_deps.get(basename)
+					unknown_deps = dep_list_builder_obj.file_unknown_deps.get(basename)
+					signature = dep_list_builder_obj.file_signatures.get(basename)
+					self.connection.execute("INSERT OR REPLACE INTO files (basename, crawl_mtime, known_deps, unknown_deps, signature, signature_mtime) VALUES (?, ?, ?, ?, ?, ?)", (
+						basename,
+						dep_list_builder_obj.files_crawl_mtime.get(basename),
+						None if known_deps == None else json.dumps(sorted(known_deps)),
+						None if unknown_deps == None else json.dumps(sorted(unknown_deps)),
+						None if signature == None else json.dumps(list(signature)),
+						dep_list_builder_obj.signature_mtimes.get(basename)
+					))
+
+				# save the known paths that changed
+				for basename in dep_list_builder_obj.dirty_known_paths :
+					if (basename in dep_list_builder_obj.known_paths) :
+						self.connection.execute("INSERT OR REPLACE INTO known_paths (basename, path) VALUES (?, ?)", (basename, dep_list_builder_obj.known_paths[basename]))
+					else :
+						self.connection.execute("DELETE FROM known_paths WHERE basename = ?", (basename,))
+		except sqlite3.Error as e :
+			# failled to write to the database
+			return(False)
+
+		# everything was saved
+		dep_list_builder_obj.dirty_files.clear()
+		dep_list_builder_obj.dirty_known_paths.clear()
+
+		return(True)
+
+	# saves the dependency times checked for each source file that changed since the last save
+	# "dirty_basenames" should be a set() with the basenames of the source files whose checked times may have changed
+	# NOTE: "dirty_basenames" is emptied once they're saved
+	# returns True if successful or False otherwise
+	def saveCheckedMtimes(self, checked_mtimes, dirty_basenames) :
+		# find the source files whose checked times changed or that no longer have any
+		changed_basenames = [src_basename for src_basename in dirty_basenames if src_basename in checked_mtimes and checked_mtimes[src_basename] != self.saved_checked_mtimes.get(src_basename)]
+		removed_basenames = [src_basename for src_basename in dirty_basenames if src_basename not in checked_mtimes and src_basename in self.saved_checked_mtimes]
+
+		# check if anything changed
+		if (len(changed_basenames) == 0 and len(removed_basenames) == 0) :
+			# nothing did
+			dirty_basenames.clear()
+			return(True)
+
+		try :
+			with self.connection :
+				# replace the rows of each source file that changed
+				for src_basename in changed_basenames + removed_basenames :
+					self.connection.execute("DELETE FROM checked_mtimes WHERE src_basename = ?", (src_basename,))
+				for src_basename in changed_basenames :
+					self.connection.executemany("INSERT INTO checked_mtimes (src_basename, path, mtime) VALUES (?, ?, ?)", [(src_basename, path, checked_mtimes[src_basename][path]) for path in sorted(checked_mtimes[src_basename])])
+		except sqlite3.Error as e :
+			# failled to write to the database
+			return(False)
+
+		# keep a copy of what was saved
+		for src_basename in changed_basenames :
+			self.saved_checked_mtimes[src_basename] = checked_mtimes[src_basename].copy()
+		for src_basename in removed_basenames :
+			del self.saved_checked_mtimes[src_basename]
+		dirty_basenames.clear()
+
+		return(True)
@@ -11,43 +11,48 @@
 #															#
 ############################################################
 
-import os, re
-from classes import General
+import os, re, concurrent.futures
+from classes import CompileCommands, General, IncludeResolver, IncludeScanner, SearchPathIndex
 
 class DepListBuilder :
 	"""Crawler that will scan the dependent files and search for all the #include directives and get there absolute paths."""
 
-	def __init__(self, project_root, config) :
+	# class variables storing the number of workers used to scan the files in parallel and the kind of pool they run in
+	# if workers_ is 1 the files are scanned sequentially, as they are crawled
+	# NOTE: set by the Application class, based on the "crawl_workers" and "crawl_pool" configurations
+	workers_ = 1
+	pool_ = "process"
+
+	def __init__(self, project_root, config, stat_cache, file_fingerprints) :
 		# instance variable referencing the currently active configurations
 		self.config = config
 
 		# instance variable storing the absolute paths that will be used to search for files, when needed
 		self.search_paths = list([project_root])
 
-		# instance variable referencing a queue
-		# provided by the Application class when one is to be processed
-		self.queue = None
-
-		# class variable storing the dependent files processed by the crawlers
-		# provided by the Application class when a queue needs to be processed
-		self.dep_list = None
-
-		# class variable storing any files that couldn't be found
-		# provided by the Application class when a queue needs to be processed
-		self.failed_files = None
+		# instance variable storing the files that couldn't be found while obtaining the dependent files of a file
+		# format: [file abs path] = set() with the #include matches that couldn't be found
+		# 		  if the set() is empty then the file itself couldn't be found
+		# NOTE: only used internally by getNodeEdges(), the dependency lists get their own failed files
+		self.failed_files = dict()
 
 		# instance variable with data needed to build the dependency lists
-		# provided by the Application class when a queue needs to be processed
+		# provided by the Application class before the dependency lists are built
 		self.files = None
 
+		# instance variable referencing the StatCache shared with the Application class
+		# used to avoid accessing the file system again for files already checked in the current scan cycle
+		self.stat_cache = stat_cache
+
+		# instance variable referencing the FileFingerprints shared with the Application class
+		# used to get the modify times of the files, ignoring the modifications that didn't change their content
+		self.file_fingerprints = file_fingerprints
+
 		# instance variable storing the basenames for which a valid absolute path could not be built
 		# these files will need to be searched in the directories in search_paths
 		# format: [absolute path] = set(unknown basenames present in the file)
 		self.pending_search = dict()
 
-		# instance variable storing the basenames found by the crawl task
-		self.found_files = set()
-
 		# instance variable storing the absolute paths of all files found by the crawl task
 		# used to improve performance across multiple dependency list builds by not needing to search
 		# for the same file multiple times (unless the file's path changes)
@@ -72,205 +77,702 @@ class DepListBuilder :
 		# format: [file basename] = modify time
 		self.files_crawl_mtime = dict()
 
-	# main function of this class, responsible for processing a queue of files, crawling each one searching for
-	# all the "#include" directives and building the aboslute path for each one
-	# all the dependent files found are stored in self.dep_list and all basenames that couldn't be found
-	# are stored in self.failed_files
-	def run(self) :
-		# check if there is a queue
-		if (self.queue == None) :
-			# there isn't, so bail out
+		# instance variable storing the include signature of each file, which is the content of its "#include"
+		# directives, in order, at the time of its last crawl
+		# used to know if a modification to a file changed its dependent files or just the rest of its content
+		# format: [file basename] = tuple(content of each #include directive)
+		self.file_signatures = dict()
+
+		# instance variable storing the modify times of each file at the time its include signature last changed
+		# format: [file basename] = modify time
+		self.signature_mtimes = dict()
+
+		# instance variable storing the number of modified files whose include signature didn't change
+		self.signature_hits = 0
+
+		# instance variable storing the dependent files #included directly by each file visited
+		# format: [file abs path] = dict(deps = frozenset(abs paths), failed = dict() with the same format as failed_files,
+		# 		  generation = StatCache generation when obtained)
+		self.node_edges = dict()
+
+		# instance variable storing the transitive closure of each file visited, which is every file reachable from it
+		# (including itself) and every file that couldn't be found along the way
+		# the files in the same strongly connected component (that include each other in a cycle) share the same dict()
+		# format: [file abs path] = dict(reach = frozenset(abs paths), failed = dict() with the same format as failed_files,
+		# 		  generation = StatCache generation when last validated)
+		self.closures = dict()
+
+		# instance variable storing, for each file, the files whose closure reaches it
+		# used to find the closures to discard when a file changes without checking every closure
+		# format: [file abs path] = set(abs paths of the files whose closure reaches it)
+		self.closure_reachers = dict()
+
+		# instance variables storing the StatCache generation and the number of its individually invalidated files
+		# as of the last time the closures were synchronized with it
+		self.closures_generation = -1
+		self.closures_invalidated = 0
+
+		# instance variable storing the number of closures reused without being built again
+		self.closure_hits = 0
+
+		# instance variable storing the index of the files in each search path, built the first time a basename is
+		# searched in it and refreshed only if the files might have changed since then
+		# format: [search path] = tuple(SearchPathIndex, tuple(StatCache generation, number of StatCache invalidated files) when last refreshed)
+		self.search_path_indexes = dict()
+
+		# instance variable storing the basenames that couldn't be found in any search path, which won't be searched
+		# again while the search paths stay the same
+		# format: [file basename] = search state (see getSearchState()) when the search failed
+		self.unresolved_basenames = dict()
+
+		# instance variable storing the number of basename searches skipped because the basename is known to be unresolved
+		self.searches_avoided = 0
+
+		# instance variable storing the "#include" directives of the files scanned in parallel, until they are crawled
+		# format: [file abs path] = tuple(modify time when scanned, list() with the content of each directive or None)
+		self.prescanned = dict()
+
+		# instance variable storing the resolver used to find where the file of each "#include" directive should be looked for
+		self.include_resolver = IncludeResolver.IncludeResolver()
+
+		# instance variable storing the compilation database with the include directories of each translation unit
+		# or None if it isn't used
+		# NOTE: set by the Application class, based on the "compile_commands" configuration
+		self.compile_commands = None
+
+		# instance variable storing the include directories the compiler uses for the files crawled by this instance,
+		# in the format of CompileCommands.getIncludeDirs(), or an empty tuple() if they aren't known
+		self.include_dirs = tuple()
+
+		# instance variable storing the DepListBuilder used for the source files with each set of include directories
+		# in the compilation database, which share everything with this instance except the information obtained by crawling
+		# format: [include directories, as in self.include_dirs] = DepListBuilder
+		self.child_builders = dict()
+
+		# instance variables storing the basenames of the files whose crawl information changed and the basenames
+		# whose known path changed, since they were last saved to the crawl cache
+		# NOTE: used by the CrawlCache class to save only what changed
+		self.dirty_files = set()
+		self.dirty_known_paths = set()
+
+	# builds the list of all the files a file depends on, directly or through other files
+	# the list is assembled from the transitive closure of the file, which is cached and shared by every file
+	# that depends on it, so the "#include" directives of each file are only followed once
+	# returns a tuple with 2 items:
+	# 	- a list() with the absolute paths of the dependent files, sorted after the file itself
+	# 	- a dict() with the files that couldn't be found, with format: [file abs path] = set() with the #include
+	# 	  matches that couldn't be found, or an empty set() if the file itself couldn't be found
+	# NOTE: all the state of a build is local, so the lists of several files can be built in any order
+	def buildDependencyList(self, file_path) :
+		# standardize the path
+		file_path = General.General.standardizePath(file_path)
+
+		# check if this file has its own include directories in the compilation database
+		builder = self.getBuilder(file_path)
+		if (builder != self) :
+			# it has
+			return(builder.buildDependencyList(file_path))
+
+		# stores the final data
+		dep_list = list()
+		failed_files = dict()
+
+		# stores the basenames added to the dependency list, used to keep only one file with each basename
+		found_basenames = set([os.path.basename(file_path)])
+
+		# get the closure of this file
+		closure = self.getClosure(file_path)
+
+		# add any files that couldn't be found, or which #include directives couldn't be found, to the failed files
+		self.mergeFailed(failed_files, closure["failed"])
+
+		# check if this file should be added to the dependency list
+		# NOTE: the absolute path will be added at this point, regardless of the value of
+		# 		the "dependency_path" config -> that config will be used when passing the
+		# 		dependency list to the function that builds the dependency file
+		if (self.config["include_source"] and not self.isMissing(file_path, closure)) :
+			# it should
+			dep_list.append(file_path)
+
+		# loop through each dependent file, in a deterministic order
+		for dep_file_path in sorted(closure["reach"]) :
+			# check if this is the file itself, a file that couldn't be found or a file with the same
+			# basename as a file already added
+			if (dep_file_path == file_path or self.isMissing(dep_file_path, closure) or os.path.basename(dep_file_path) in found_basenames) :
+				# it is
+				continue
+
+			# add this file to the final data
+			found_basenames.add(os.path.basename(dep_file_path))
+			dep_list.append(dep_file_path)
+
+		# return the final data
+		return((dep_list, failed_files))
+
+	# builds the dependency lists of several files, scanning the files they reach in parallel first
+	# returns a dict() with format: [file abs path] = tuple returned by buildDependencyList()
+	def buildDependencyLists(self, file_paths) :
+		# scan the files that need to be crawled
+		self.prescanFiles(file_paths)
+
+		# build each list, in a deterministic order
+		return(dict([(file_path, self.buildDependencyList(file_path)) for file_path in sorted(file_paths)]))
+
+	# scans, in parallel, the files reachable from the provided files that need to be crawled, so the crawls that
+	# follow only need to resolve the paths of their "#include" directives
+	# the files are visited one level at a time and each level is resolved in sorted order, so the information
+	# obtained doesn't depend on the order in which the workers finish
+	# NOTE: does nothing if DepListBuilder.workers_ is 1
+	def prescanFiles(self, file_paths) :
+		# check if the files should be scanned in parallel
+		if (DepListBuilder.workers_ < 2) :
+			# they shouldn't
 			return
 
-		# going through a new queue
-		queue_first_iteration = True
+		# check if any of the files have their own include directories in the compilation database
+		if (self.compile_commands != None) :
+			# they might
+			# group the files by the DepListBuilder that will crawl them
+			builder_files = dict()
+			for file_path in file_paths :
+				builder = self.getBuilder(General.General.standardizePath(file_path))
+				if (builder not in builder_files) :
+					builder_files[builder] = list()
+				builder_files[builder].append(file_path)
+
+			# let the other builders scan their files
+			for builder in builder_files :
+				if (builder != self) :
+					builder.prescanFiles(builder_files[builder])
+
+			# this instance only scans the files without include directories
+			file_paths = builder_files.get(self, list())
+
+		# discard the information made outdated by changes to the files since the last call
+		self.syncClosures()
+
+		# stores the pool of workers, which is only started if a level has several files to scan
+		executor = None
+
+		try :
+			# visit the files one level at a time, starting with the provided files
+			visited = set()
+			frontier = sorted(set([General.General.standardizePath(file_path) for file_path in file_paths]))
+			while len(frontier) > 0 :
+				visited.update(frontier)
+
+				# find the files in this level that need to be scanned
+				scan_paths = [file_path for file_path in frontier if self.needsCrawl(file_path)]
+
+				# check if there are enough files to use the workers
+				if (len(scan_paths) > 1) :
+					# there are
+					if (executor == None) :
+						executor = self.startExecutor()
+
+					# get each file's modify time before it's scanned, so a change during the scan is detected
+					scan_mtimes = [self.file_fingerprints.getMtime(file_path) for file_path in scan_paths]
+
+					# scan the files
+					# NOTE: the engine is passed explicitly, since worker processes don't share the class variables
+					chunk_size = max(1, len(scan_paths) // (DepListBuilder.workers_ * 4))
+					results = executor.map(IncludeScanner.IncludeScanner.scanFileWithEngine, [IncludeScanner.IncludeScanner.engine_] * len(scan_paths), scan_paths, [self.config["builtin_libs"]] * len(scan_paths), chunksize = chunk_size)
+					for file_path, scan_mtime, include_strs in zip(scan_paths, scan_mtimes, results) :
+						self.prescanned[file_path] = (scan_mtime, include_strs)
+
+				# crawl the files in this level and find the files in the next level
+				next_frontier = set()
+				for file_path in frontier :
+					# check if this file has a valid closure, in which case every file it reaches is known
+					if (self.isClosureValid(file_path)) :
+						# it has
+						continue
 
-		# build the characters to be used in the regex below, based on the current configuration
-		if (self.config["builtin_libs"]) :
-			# the language default libraries #includes should be checked
-			regex_str = "#include\\s+[<\\\"]([^<>\\\"]+)[>\\\"]"
+					next_frontier.update(self.getNodeEdges(file_path)["deps"])
+
+				frontier = sorted(next_frontier.difference(visited))
+		except (OSError, concurrent.futures.BrokenExecutor) as e :
+			# the workers couldn't be used, so the files will be scanned sequentially as they are crawled
+			pass
+		finally :
+			# stop the workers, if any were used
+			if (executor != None) :
+				executor.shutdown()
+
+			# discard any scans that weren't used
+			self.prescanned.clear()
+
+	# gets the DepListBuilder that crawls a file, which depends on the include directories of its translation unit
+	# in the compilation database
+	# returns the DepListBuilder, which is this instance if the file's include directories aren't known
+	def getBuilder(self, file_path) :
+		# check if a compilation database is used
+		if (self.compile_commands == None) :
+			# it isn't
+			return(self)
+
+		# check if the compilation database changed
+		if (self.compile_commands.refresh()) :
+			# it did, so the include directories of each file might be different now
+			self.child_builders.clear()
+
+		# get this file's include directories
+		include_dirs = self.compile_commands.getIncludeDirs(file_path)
+		if (include_dirs == None) :
+			# it isn't in the compilation database
+			return(self)
+
+		# check if these include directories already have a DepListBuilder
+		builder = self.child_builders.get(include_dirs)
+		if (builder == None) :
+			# they don't
+			builder = DepListBuilder(self.search_paths[0], self.config, self.stat_cache, self.file_fingerprints)
+			builder.search_paths = self.search_paths
+			builder.search_path_indexes = self.search_path_indexes
+			builder.include_resolver = self.include_resolver
+			builder.include_dirs = include_dirs
+			self.child_builders[include_dirs] = builder
+
+		# share the data needed to build the dependency lists
+		builder.files = self.files
+
+		return(builder)
+
+	# sets the compilation database with the include directories of each translation unit
+	# "db_path" is the absolute path to the compile_commands.json file, or an empty string to not use one
+	# returns True if the compilation database was loaded or isn't used, False if it couldn't be loaded
+	def setCompileCommands(self, db_path) :
+		# the include directories of each file might be different now
+		self.child_builders.clear()
+
+		# check if a compilation database should be used
+		if (db_path == "") :
+			# it shouldn't
+			self.compile_commands = None
+			return(True)
+
+		self.compile_commands = CompileCommands.CompileCommands(db_path, self.stat_cache)
+		self.compile_commands.refresh()
+
+		return(self.compile_commands.valid)
+
+	# gets the sum of a counter (ex: "closure_hits") of this instance and of the instances used for the files with
+	# their own include directories
+	# returns the sum
+	def getCounter(self, counter_name) :
+		return(sum([getattr(builder, counter_name) for builder in [self] + list(self.child_builders.values())]))
+
+	# starts a pool of DepListBuilder.workers_ workers, of the kind in DepListBuilder.pool_
+	# returns the concurrent.futures executor
+	def startExecutor(self) :
+		# check if the workers should be processes
+		if (DepListBuilder.pool_ == "process") :
+			# they should
+			return(concurrent.futures.ProcessPoolExecutor(DepListBuilder.workers_))
+
+		return(concurrent.futures.ThreadPoolExecutor(DepListBuilder.workers_))
+
+	# checks if a file needs to be crawled, because it was never crawled or was modified since its last crawl
+	# returns True if it does, False otherwise
+	def needsCrawl(self, file_path) :
+		# check if the file exists
+		if (not self.stat_cache.isFile(file_path)) :
+			# it doesn't, so there is nothing to crawl
+			return(False)
+
+		# check if the file has been crawled
+		file_basename = os.path.basename(file_path)
+		if (file_basename not in self.files_crawl_mtime) :
+			# it hasn't
+			return(True)
+
+		return(self.file_fingerprints.getMtime(file_path) > self.files_crawl_mtime[file_basename])
+
+	# checks if a file in a closure couldn't be found
+	# returns True if it couldn't, False otherwise
+	def isMissing(self, file_path, closure) :
+		return(file_path in closure["failed"] and len(closure["failed"][file_path]) == 0)
+
+	# gets the transitive closure of a file, which is every file reachable from it through "#include" directives
+	# the closure is taken from the cache if it's still valid or built otherwise, together with the closures of
+	# every file reached that didn't have a valid one
+	# returns a dict() with the format described in self.closures
+	def getClosure(self, file_path) :
+		# discard the information made outdated by changes to the files since the last call
+		self.syncClosures()
+
+		# check if this file has a valid closure
+		if (self.isClosureValid(file_path)) :
+			# it has
+			self.closure_hits += 1
 		else :
-			# the language default libraries #includes should not be checked
-			regex_str = "#include\\s+[\\\"]([^<>\\\"]+)[\\\"]"
-
-		while len(self.queue) > 0 or len(self.pending_search) > 0 :
-			# check if the queue has any items
-			if (len(self.queue) > 0) :
-				# it has
-				# grab a file to check
-				file_path = General.General.standardizePath(self.queue.pop())
-
-				# check if path is valid
-				if (not os.path.isfile(file_path)) :
-					# it isn't
-					# add this file to the failed files
-					self.addToFailedFiles(file_path, None)
+			# it hasn't
+			self.buildClosures(file_path)
+
+		return(self.closures[file_path])
+
+	# builds the closure of a file and of every file reachable from it that doesn't have a valid closure
+	# uses Tarjan's algorithm to find the strongly connected components (groups of files including each other in a
+	# cycle), which share the same closure, so each component is only processed once all components it reaches are
+	# NOTE: implemented without recursion, to support long chains of "#include" directives
+	def buildClosures(self, file_path) :
+		# stores the order in which each file was visited and the lowest order reachable from each file
+		visit_order = dict()
+		low_order = dict()
+
+		# stores the files visited whose component hasn't been completed yet
+		component_stack = list()
+		component_files = set()
+
+		# stores the files being visited, with the dependent files that haven't been checked yet
+		# format: list(tuple(file abs path, iterator of the file's dependent files))
+		call_stack = list()
+
+		# visit the file
+		visit_order[file_path] = low_order[file_path] = 0
+		component_stack.append(file_path)
+		component_files.add(file_path)
+		call_stack.append((file_path, iter(sorted(self.getNodeEdges(file_path)["deps"]))))
+
+		while len(call_stack) > 0 :
+			# grab the file being visited
+			node_path, dep_paths = call_stack[-1]
+
+			# loop through its dependent files that haven't been checked yet
+			for dep_path in dep_paths :
+				# check if this dependent file was visited
+				if (dep_path not in visit_order) :
+					# it wasn't
+					# check if it has a valid closure, in which case its component is already complete
+					if (self.isClosureValid(dep_path)) :
+						# it has
+						continue
 
-					# move on to next file
-					continue
+					# visit it before continuing with this file
+					visit_order[dep_path] = low_order[dep_path] = len(visit_order)
+					component_stack.append(dep_path)
+					component_files.add(dep_path)
+					call_stack.append((dep_path, iter(sorted(self.getNodeEdges(dep_path)["deps"]))))
+					break
+				elif (dep_path in component_files) :
+					# it was and it's in the same component as this file
+					low_order[node_path] = min(low_order[node_path], visit_order[dep_path])
+			else :
+				# all this file's dependent files have been checked
+				call_stack.pop()
+				if (len(call_stack) > 0) :
+					low_order[call_stack[-1][0]] = min(low_order[call_stack[-1][0]], low_order[node_path])
 
-				# get this file's basename
-				file_path_basename = os.path.basename(file_path)
+				# check if this file is the first visited of its component
+				if (low_order[node_path] != visit_order[node_path]) :
+					# it isn't
+					continue
 
-				# get any stored data from previous crawls of this file
-				dependents_found = self.findInFileKnownDeps(file_path)
+				# grab the files of this component
+				members = set()
+				while True :
+					member_path = component_stack.pop()
+					component_files.remove(member_path)
+					members.add(member_path)
+					if (member_path == node_path) :
+						break
+
+				# build the closure shared by the files of this component
+				reach = set(members)
+				failed = dict()
+				for member_path in members :
+					node_edges = self.getNodeEdges(member_path)
+					self.mergeFailed(failed, node_edges["failed"])
+
+					# add the closures of the dependent files outside this component
+					for dep_path in node_edges["deps"] :
+						if (dep_path not in members) :
+							reach.update(self.closures[dep_path]["reach"])
+							self.mergeFailed(failed, self.closures[dep_path]["failed"])
+
+				closure = dict(reach=frozenset(reach), failed=failed, generation=self.stat_cache.generation)
+				for member_path in members :
+					self.storeClosure(member_path, closure)
+
+	# merges the failed files of a file or closure into another dict() with the same format as failed_files
+	def mergeFailed(self, failed, other_failed) :
+		for failed_path in other_failed :
+			if (failed_path not in failed) :
+				failed[failed_path] = set()
+			failed[failed_path].update(other_failed[failed_path])
+
+	# checks if a file's closure is still valid, which is the case if none of the files it reaches changed their
+	# dependent files since the closure was built
+	# returns True if the closure is valid, False otherwise
+	def isClosureValid(self, file_path) :
+		# check if this file has a closure
+		if (file_path not in self.closures) :
+			# it hasn't
+			return(False)
+
+		# check if the closure was already validated with the current information in the StatCache
+		if (self.closures[file_path]["generation"] == self.stat_cache.generation) :
+			# it was
+			return(True)
+
+		# bring the dependent files of every file reached up-to-date
+		# NOTE: any file whose dependent files changed will discard the closures that reach it
+		closure = self.closures[file_path]
+		for reach_path in closure["reach"] :
+			self.getNodeEdges(reach_path)
+
+		# check if the closure survived
+		if (self.closures.get(file_path) is not closure) :
+			# it didn't
+			return(False)
+
+		# the closure is valid, as are the closures of the other files in the same component, since they share it
+		closure["generation"] = self.stat_cache.generation
+		return(True)
+
+	# gets the dependent files #included directly by a file, crawling the file if needed
+	# the information is reused while the StatCache's generation doesn't change
+	# returns a dict() with the format described in self.node_edges
+	def getNodeEdges(self, file_path) :
+		# check if this file's information is up-to-date
+		previous_edges = self.node_edges.get(file_path)
+		if (previous_edges != None and previous_edges["generation"] == self.stat_cache.generation) :
+			# it is
+			return(previous_edges)
+
+		# collect the failed files of this file alone
+		self.failed_files = dict()
+
+		# stores the absolute paths of the dependent files
+		dependents_found = set()
+
+		# check if path is valid
+		if (not self.stat_cache.isFile(file_path)) :
+			# it isn't
+			self.addToFailedFiles(file_path, None)
+		else :
+			# get this file's basename
+			file_path_basename = os.path.basename(file_path)
+
+			# get any stored data from previous crawls of this file
+			dependents_found = self.findInFileKnownDeps(file_path)
+
+			# check if this file has already been crawled and up-to-date information is available
+			if (dependents_found != None) :
+				# this file has been crawled and the stored information is still up-to-date
+				# check if there are any stored basenames which absolute paths couldn't be found
+				if (file_path_basename in self.file_unknown_deps) :
+					# there are
+					# add them to the failed files
+					self.addToFailedFiles(file_path, self.file_unknown_deps[file_path_basename].copy())
+			else :
+				# this file hasn't been crawled, or the file was modified since the last crawl
+				dependents_found = self.crawlFile(file_path)
 
-				# check if this file has already been crawled and up-to-date information is available
-				if (dependents_found != None) :
-					# this file has been crawled and the stored information is still up-to-date
-					# check if there are any stored basenames which absolute paths couldn't be found
-					if (file_path_basename in self.file_unknown_deps) :
-						# there are
-						# add them to the failed files
-						self.addToFailedFiles(file_path, self.file_unknown_deps[file_path_basename].copy())
-				else :
-					# this file hasn't been crawled, or the file was modified since the last crawl
+				# check if the file was successfully crawled
+				if (dependents_found == None) :
+					# it wasn't
 					dependents_found = set()
 
-					# get the contents of the file in path
-					file_content = General.General.readFile(file_path)
+				# deal with any basenames that might be pending search
+				dependents_found.update(self.processPendingSearch())
 
-					# check if the file's content was successfully acquired
-					if (file_content == None) :
-						# it wasn't
-						continue
+		node_edges = dict(deps=frozenset(dependents_found), failed=self.failed_files, generation=self.stat_cache.generation)
+		self.failed_files = dict()
+
+		# check if this file's dependent files changed
+		# NOTE: if this file had no information, no closure can reach it, since closures are built from that information
+		if (previous_edges != None and (previous_edges["deps"] != node_edges["deps"] or previous_edges["failed"] != node_edges["failed"])) :
+			# they did, so the closures that reach this file are no longer valid
+			self.invalidateClosures(file_path)
+
+		# store the information
+		self.node_edges[file_path] = node_edges
+
+		return(node_edges)
+
+	# discards the closures that reach a file
+	# returns a list() with the absolute paths of the files whose closures were discarded
+	def invalidateClosures(self, file_path) :
+		# find the closures that reach this file
+		closure_paths = list(self.closure_reachers.get(file_path, set()))
+
+		# discard them
+		for closure_path in closure_paths :
+			self.discardClosure(closure_path)
+
+		return(closure_paths)
+
+	# stores the closure of a file, keeping track of the files it reaches
+	def storeClosure(self, file_path, closure) :
+		# discard any previous closure of this file
+		self.discardClosure(file_path)
+
+		self.closures[file_path] = closure
+		for reach_path in closure["reach"] :
+			if (reach_path not in self.closure_reachers) :
+				self.closure_reachers[reach_path] = set()
+			self.closure_reachers[reach_path].add(file_path)
+
+	# discards the closure of a file, if it has one
+	def discardClosure(self, file_path) :
+		closure = self.closures.pop(file_path, None)
+
+		# check if the file had a closure
+		if (closure == None) :
+			# it didn't
+			return
+
+		# this file's closure no longer reaches any file
+		for reach_path in closure["reach"] :
+			self.closure_reachers[reach_path].discard(file_path)
+			if (len(self.closure_reachers[reach_path]) == 0) :
+				del self.closure_reachers[reach_path]
+
+	# discards the closures and the direct dependent files affected by the files whose information was
+	# discarded from the StatCache since the last call
+	def syncClosures(self) :
+		# check if the StatCache was cleared since the last call
+		if (self.stat_cache.generation != self.closures_generation) :
+			# it was
+			# NOTE: all the information will be validated again, since it was obtained in a different generation
+			self.closures_generation = self.stat_cache.generation
+			self.closures_invalidated = 0
+
+		# loop through each file invalidated individually since the last call
+		for file_path in self.stat_cache.invalidated[self.closures_invalidated:] :
+			# the files that reach this file might need to find it somewhere else, so their dependent files
+			# need to be checked again, as does this file's
+			for closure_path in self.invalidateClosures(file_path) :
+				self.node_edges.pop(closure_path, None)
+			self.node_edges.pop(file_path, None)
+
+		self.closures_invalidated = len(self.stat_cache.invalidated)
+
+	# crawls a file, searching for all the "#include" directives and building the absolute path for each one
+	# any basenames which absolute paths couldn't be built are stored in self.pending_search
+	# returns a set() with the absolute paths found, or None if the file couldn't be read
+	def crawlFile(self, file_path) :
+		# get this file's basename
+		file_path_basename = os.path.basename(file_path)
+
+		# stores the absolute paths of the dependent files found
+		dependents_found = set()
+
+		# get the content of all the #include directives in the file, unless it was scanned in parallel and hasn't
+		# changed since then
+		# NOTE: the language default libraries #includes are only checked if the configuration asks for them
+		prescan = self.prescanned.pop(file_path, None)
+		if (prescan != None and prescan[0] == self.file_fingerprints.getMtime(file_path)) :
+			include_strs = prescan[1]
+		else :
+			include_strs = IncludeScanner.IncludeScanner.scanFile(file_path, self.config["builtin_libs"])
+
+		# check if the file was successfully scanned
+		if (include_strs == None) :
+			# it wasn't
+			return(None)
+
+		# get this file's directory
+		file_path_dirname = General.General.standardizePath(os.path.dirname(file_path))
+
+		# get the search paths, in the format used by the include resolver
+		search_paths = tuple(self.search_paths)
+
+		# stores all the file basenames which paths couldn't be deduced
+		# these will be searched for according to the search_paths config value
+		unknown_basenames = set()
+
+		# loop through each #include directive
+		for include_str in include_strs :
+			# stores the absolute path to the file found in this match
+			tentative_file_path = ""
+
+			# boolean to know if this match's path is already known
+			path_already_known = False
 
-					# get this file's directory
-					file_path_dirname = General.General.standardizePath(os.path.dirname(file_path))
-
-					# stores all the file basenames which paths couldn't be deduced
-					# these will be searched for according to the search_paths config value
-					unknown_basenames = set()
-
-					# scan the file's content for all the #include directives
-					for re_match in re.finditer(regex_str, file_content, re.I) :
-						# stores the absolute path to the file found in this match
-						tentative_file_path = ""
-
-						# boolean to know if this match's path is already known
-						path_already_known = False
-
-						# get the match string
-						re_match_str = General.General.standardizePath(re_match.group(1))
-
-						# get the basename of re_match_str
-						re_match_str_basename = os.path.basename(re_match_str)
-
-						try :
-							# check if the path to this match is already known
-							tentative_file_path = self.findInKnownPaths(set([re_match_str_basename]))[re_match_str_basename]
-
-							# it is
-							path_already_known = True
-						except KeyError as e :
-							# it isn't
-							tentative_file_path = ""
-
-						# if the path isn't already known, find it
-						if (not path_already_known) :
-							# check if it's a path (absolute or relative)
-							if ("\\" in re_match_str) :
-								# it is
-								# check if it's an absolute path
-								if (re.match("[a-z]:[\\\\]", re_match_str, re.I) == None) :
-									# it isn't, so it's a relative path
-									# store the current working directory
-									cwd = os.getcwd()
-
-									# change the CWD to the current file's directory
-									os.chdir(file_path_dirname)
-
-									# convert the relative path to an aboslute path
-									tentative_file_path = os.path.abspath(re_match_str)
-
-									# reset the CWD
-									os.chdir(cwd)
-								else :
-									# it is
-									# store the file's absolute path
-									tentative_file_path = re_match_str
-
-								# check if the absolute path built exists
-								if (not os.path.isfile(tentative_file_path)) :
-									# it doesn't
-									# this match will have to be searched for in the paths in self.search_paths
-									unknown_basenames.add(os.path.basename(tentative_file_path))
-									tentative_file_path = ""
-							else :
-								# it isn't, which means that the #include directive only has the basename of the file
-								# check if this file is in the same directory as the crawled file
-								tentative_file_path = file_path_dirname + "\\" + re_match_str
-								if (not os.path.isfile(tentative_file_path)) :
-									# it isn't
-									# check if this file was found while searching the project's directory
-									tentative_file_path = self.findInFiles(re_match_str)
-									if (tentative_file_path == "") :
-										# it wasn't
-										# this match will have to be searched for in the paths in self.search_paths
-										unknown_basenames.add(re_match_str)
-
-						# check if the absolute path for this match was found
+			# get the basename of this match and the order in which its file should be looked for
+			re_match_str_basename, resolution = self.include_resolver.resolve(file_path_dirname, include_str, search_paths, self.include_dirs)
+
+			# check if the include directories are unknown, in which case each basename is assumed to have only one file
+			# NOTE: otherwise the file depends on the directory of the file including it, like it does for the compiler
+			if (len(self.include_dirs) == 0) :
+				# they are
+				try :
+					# check if the path to this match is already known
+					tentative_file_path = self.findInKnownPaths(set([re_match_str_basename]))[re_match_str_basename]
+
+					# it is
+					path_already_known = True
+				except KeyError as e :
+					# it isn't
+					tentative_file_path = ""
+
+			# if the path isn't already known, find it
+			if (not path_already_known) :
+				# follow the resolution order until the file is found
+				for step_kind, step_value in resolution :
+					# check the kind of step
+					if (step_kind == IncludeResolver.IncludeResolver.path_) :
+						# the file is at this path, if it exists
+						if (self.stat_cache.isFile(step_value)) :
+							tentative_file_path = step_value
+							break
+					elif (step_kind == IncludeResolver.IncludeResolver.project_) :
+						# check if this file was found while searching the project's directory
+						tentative_file_path = self.findInFiles(step_value)
 						if (tentative_file_path != "") :
-							# it was
-							# standardize the path
-							tentative_file_path = General.General.standardizePath(tentative_file_path)
-
-							# check if the file found is the file currently being crawled
-							if (tentative_file_path == file_path) :
-								# it is, so ignore it
-								continue
-
-							# add the file to the set() of dependents
-							dependents_found.add(tentative_file_path)
-
-							# check if this path was already known
-							if (not path_already_known) :
-								# it wasn't, so add it to the known paths
-								self.addToKnownPaths(dict([(os.path.basename(tentative_file_path), tentative_file_path)]))
-
-					# get this file's modify time (the time of this crawl)
-					crawl_mtime = os.path.getmtime(file_path)
-
-					# check if there are any matches that need to be searched
-					if (len(unknown_basenames) > 0) :
-						# there are
-						# store them to be searched later
-						self.addToPendingSearch(file_path, unknown_basenames)
-
-					# now that this file's crawl task has been completed
-					# store the found abs paths as this file's known dependents
-					self.addToFileKnownDeps(file_path_basename, dependents_found)
-
-					# store the time of this file's crawl
-					self.files_crawl_mtime[file_path_basename] = crawl_mtime
-
-				# add the dependents found to the queue
-				self.addToQueue(dependents_found)
-
-				# controls if this file should be added to self.dep_list or not
-				add_file = True
-
-				# check if this is the first iteration, which means the file in question is the source file
-				if (queue_first_iteration) :
-					# reverse the boolean
-					queue_first_iteration = False
-
-					# check if the source file should be included in the dependency list
-					if (not self.config["include_source"]) :
-						# it shouldn't
-						add_file = False
-
-				# check if this file should be added to the final data
-				# NOTE: the absolute path will be added at this point, regardless of the value of
-				# 		the "dependency_path" config -> that config will be used when passing the
-				# 		dependency list to the function that builds the dependency file
-				if (add_file) :
-					# it should
-					self.dep_list.append(file_path)
-			else :
-				# it hasn't
-				# deal with any basenames that might be pending search
-				self.processPendingSearch()
+							break
+					else :
+						# this match will have to be searched for in the paths in self.search_paths
+						# NOTE: findPaths() searches all of them, in the same order, so no more steps are needed
+						unknown_basenames.add(re_match_str_basename)
+						break
+
+			# check if the absolute path for this match was found
+			if (tentative_file_path != "") :
+				# it was
+				# standardize the path
+				tentative_file_path = General.General.standardizePath(tentative_file_path)
+
+				# check if the file found is the file currently being crawled
+				if (tentative_file_path == file_path) :
+					# it is, so ignore it
+					continue
+
+				# add the file to the set() of dependents
+				dependents_found.add(tentative_file_path)
+
+				# check if this path was already known
+				if (not path_already_known) :
+					# it wasn't, so add it to the known paths
+					self.addToKnownPaths(dict([(os.path.basename(tentative_file_path), tentative_file_path)]))
+
+		# get this file's modify time (the time of this crawl)
+		crawl_mtime = self.file_fingerprints.getMtime(file_path)
+
+		# check if there are any matches that need to be searched
+		if (len(unknown_basenames) > 0) :
+			# there are
+			# store them to be searched later
+			self.addToPendingSearch(file_path, unknown_basenames)
+
+		# now that this file's crawl task has been completed
+		# store the found abs paths as this file's known dependents
+		self.addToFileKnownDeps(file_path_basename, dependents_found)
+
+		# store the time of this file's crawl
+		self.files_crawl_mtime[file_path_basename] = crawl_mtime
+		self.dirty_files.add(file_path_basename)
+
+		# store this file's include signature, keeping track of when it last changed
+		include_signature = tuple(include_strs)
+		if (self.file_signatures.get(file_path_basename) != include_signature) :
+			self.file_signatures[file_path_basename] = include_signature
+			self.signature_mtimes[file_path_basename] = crawl_mtime
+
+		# return the dependent files found
+		return(dependents_found)
 
 	# builds the list() with all the paths that will be used to search for dependent files
 	# that are being #include with just the file's basename
@@ -300,13 +802,72 @@ class DepListBuilder :
 				# there is no PATH environmental variable, so move on
 				pass
 
-		# clear the variables storing the paths of known files, the paths/basenames obtained by
-		# crawling each file and the modify times of last crawls
+		# clear the information obtained by previous crawls
 		# since any path built from the search paths might no longer be valid
+		self.clearCrawlData()
+
+	# clears the variables storing the paths of known files, the paths/basenames obtained by
+	# crawling each file and the modify times of last crawls
+	def clearCrawlData(self) :
 		self.known_paths.clear()
 		self.file_known_deps.clear()
 		self.file_unknown_deps.clear()
 		self.files_crawl_mtime.clear()
+		self.file_signatures.clear()
+		self.signature_mtimes.clear()
+		self.dirty_files.clear()
+		self.dirty_known_paths.clear()
+		self.node_edges.clear()
+		self.closures.clear()
+		self.closure_reachers.clear()
+		self.search_path_indexes.clear()
+		self.unresolved_basenames.clear()
+		self.child_builders.clear()
+
+	# gets the modify time of a file at the time its include signature last changed
+	# if the file was modified since its last crawl, only its "#include" directives are scanned again and if they
+	# didn't change the file's crawl information is brought up-to-date, so the file won't be crawled again
+	# returns the modify time, or None if the file was never crawled or its include signature changed since
+	# its last crawl (the file needs to be crawled again)
+	def getSignatureMtime(self, file_path) :
+		# get this file's basename
+		file_basename = os.path.basename(file_path)
+
+		# check if this file has been crawled
+		if (file_basename not in self.file_signatures or file_basename not in self.files_crawl_mtime) :
+			# it hasn't
+			return(None)
+
+		# check if any of this file's dependent files couldn't be found in the last crawl
+		# NOTE: saving the file is how a file included before it was created gets found, so the file needs to be
+		# 		crawled again even if its "#include" directives didn't change
+		if (len(self.file_unknown_deps.get(file_basename, set())) > 0) :
+			# some couldn't
+			return(None)
+
+		try :
+			# get this file's modify time
+			file_mtime = self.file_fingerprints.getMtime(file_path)
+		except OSError as e :
+			# the file is no longer available
+			return(None)
+
+		# check if this file has been modified since the time of last crawl
+		if (file_mtime > self.files_crawl_mtime[file_basename]) :
+			# it has
+			# check if its "#include" directives are the same as in the last crawl
+			include_strs = IncludeScanner.IncludeScanner.scanFile(file_path, self.config["builtin_libs"])
+			if (include_strs == None or tuple(include_strs) != self.file_signatures[file_basename]) :
+				# they aren't, so the file needs to be crawled again
+				return(None)
+
+			# they are, so the dependent files found in the last crawl are still valid
+			self.files_crawl_mtime[file_basename] = file_mtime
+			self.dirty_files.add(file_basename)
+			self.signature_hits += 1
+
+		# return the modify time
+		return(self.signature_mtimes[file_basename])
 
 	# searches for the provided basenames in the paths set in search_paths
 	# returns a dict() with the found paths in the format: [file basename] = file absolute path
@@ -315,10 +876,21 @@ class DepListBuilder :
 		# format: [file basename] = file abs path
 		found_paths = dict()
 
+		# check if any of these basenames couldn't be found by previous searches
+		unresolved = [file_basename for file_basename in file_basenames if file_basename in self.unresolved_basenames]
+		if (len(unresolved) > 0) :
+			# there are
+			# skip the ones for which none of the search paths changed since then, since they still can't be found
+			search_state = self.getSearchState()
+			for file_basename in unresolved :
+				if (self.unresolved_basenames[file_basename] == search_state) :
+					file_basenames.remove(file_basename)
+					self.searches_avoided += 1
+
 		# loop through the various search paths
 		for search_path in self.search_paths :
 			# try to find these files
-			aux = General.General.findFiles(file_basenames.copy(), search_path)
+			aux = self.getSearchPathIndex(General.General.standardizePath(search_path)).findFiles(file_basenames)
 
 			# loop through each found file
 			for aux_basename in aux :
@@ -334,32 +906,46 @@ class DepListBuilder :
 				# exit loop
 				break
 
+		# check if any basenames couldn't be found
+		if (len(file_basenames) > 0) :
+			# there are, so they won't be searched again until a search path changes
+			search_state = self.getSearchState()
+			for file_basename in file_basenames :
+				self.unresolved_basenames[file_basename] = search_state
+
+		# any basenames found are no longer unresolved
+		for found_basename in found_paths :
+			self.unresolved_basenames.pop(found_basename, None)
+
 		# add these paths to the known paths
 		self.addToKnownPaths(found_paths)
 
 		# return the paths that were found
 		return(found_paths)
 
-	# checks if the provided paths hasn't been found already and adds new files to the queue
-	# receives a set() of absolute paths
-	def addToQueue(self, file_paths) :
-		# loop through each received abs path
-		for file_path in file_paths.copy() :
-			# get this file's basename
-			file_basename = os.path.basename(file_path)
+	# gets the state of the search paths, which changes whenever a file is added to or removed from any of them
+	# returns a tuple() with the version of each search path's index
+	def getSearchState(self) :
+		return(tuple([self.getSearchPathIndex(General.General.standardizePath(search_path)).version for search_path in self.search_paths]))
 
-			# check if this file has been found already
-			if (file_basename in self.found_files) :
-				# it has
-				# remove it from the set()
-				file_paths.remove(file_path)
-			else :
-				# it hasn't
-				# add this file's basename to the found files
-				self.found_files.add(file_basename)
+	# gets the index of the files in a search path, building it or bringing it up-to-date if needed
+	# returns the SearchPathIndex
+	def getSearchPathIndex(self, search_path) :
+		# check if this search path has an index
+		if (search_path not in self.search_path_indexes) :
+			# it hasn't
+			self.search_path_indexes[search_path] = (SearchPathIndex.SearchPathIndex(search_path), None)
+
+		# check if the index was refreshed since the files last changed, according to the StatCache
+		# NOTE: the StatCache's generation changes when the changes are unknown and its invalidated files grow when
+		# 		the watcher reports changes
+		search_path_index, stat_cache_state = self.search_path_indexes[search_path]
+		if (stat_cache_state != (self.stat_cache.generation, len(self.stat_cache.invalidated))) :
+			# it wasn't, so the search path's directory tree might have changed since then
+			search_path_index.refresh()
+			self.search_path_indexes[search_path] = (search_path_index, (self.stat_cache.generation, len(self.stat_cache.invalidated)))
 
-		# add the new files to the queue
-		self.queue.update(file_paths)
+		return(search_path_index)
 
 	# adds the provided basenames to pending_search
 	def addToPendingSearch(self, file_path, unknown_basenames) :
@@ -386,6 +972,7 @@ class DepListBuilder :
 				# it isn't
 				# add the path
 				self.known_paths[file_basename] = file_paths[file_basename]
+				self.dirty_known_paths.add(file_basename)
 
 	# searches the provided set() of basenames in known_paths
 	# returns the corresponding absolute paths for the basenames that are already known
@@ -400,7 +987,7 @@ class DepListBuilder :
 			if (file_basename in self.known_paths) :
 				# it is
 				# check if the path is still valid
-				if (os.path.isfile(self.known_paths[file_basename])) :
+				if (self.stat_cache.isFile(self.known_paths[file_basename])) :
 					# it is
 					# add the path to the final data
 					found_paths[file_basename] = self.known_paths[file_basename]
@@ -409,6 +996,7 @@ class DepListBuilder :
 					# remove it from the known paths, which will cause the path
 					# to this file to be searched for again
 					del self.known_paths[file_basename]
+					self.dirty_known_paths.add(file_basename)
 
 		# return the paths found
 		return(found_paths)
@@ -422,6 +1010,7 @@ class DepListBuilder :
 
 		# update file_known_deps_
 		self.file_known_deps[file_basename].update(dependent_paths)
+		self.dirty_files.add(file_basename)
 
 	# searches file_known_deps for the provided file
 	# returns the respective set() of absolute paths if the information is available
@@ -450,7 +1039,7 @@ class DepListBuilder :
 				return(None)
 
 		# check if this file has been modified since the time of last crawl
-		if (os.path.getmtime(file_path) > self.files_crawl_mtime[file_basename]) :
+		if (self.file_fingerprints.getMtime(file_path) > self.files_crawl_mtime[file_basename]) :
 			# it has
 			# remove this file's entry from file_known_deps, file_unknown_deps
 			# and files_crawl_mtime
@@ -459,6 +1048,7 @@ class DepListBuilder :
 			if (file_basename in self.file_unknown_deps) :
 				del self.file_unknown_deps[file_basename]
 			del self.files_crawl_mtime[file_basename]
+			self.dirty_files.add(file_basename)
 
 			# return None to signal the file to be crawled again
 			return(None)
@@ -469,7 +1059,7 @@ class DepListBuilder :
 		# loop through each path in the set()
 		for path in found_paths.copy() :
 			# check if this path is valid
-			if (not os.path.isfile(path)) :
+			if (not self.stat_cache.isFile(path)) :
 				# it isn't
 				# add this path's basename to be searched later
 				unknown_basenames.add(os.path.basename(path))
@@ -541,12 +1131,13 @@ class DepListBuilder :
 			self.failed_files[file_path].update(failed_matches)
 
 	# calls for the search of any basenames pending search
+	# returns a set() with the absolute paths of the files found
 	def processPendingSearch(self) :
 		# check if there are any basenames pending search
 		if (len(self.pending_search) == 0) :
 			# there aren't
 			# nothing needs to be done
-			return
+			return(set())
 
 		# build the set with basenames to search
 		unknown_basenames = set()
@@ -559,9 +1150,6 @@ class DepListBuilder :
 		# check if any file was found
 		if (len(aux) > 0) :
 			# yes
-			# add the files found to the queue
-			self.addToQueue(set(aux.values()).copy())
-
 			# get a set() with the basenames found
 			found_basenames = set(aux.keys())
 
@@ -604,11 +1192,15 @@ class DepListBuilder :
 
 				# store the found basenames as this file's unknown dependents
 				self.file_unknown_deps[os.path.basename(file_path)] = self.pending_search[file_path].copy()
+				self.dirty_files.add(os.path.basename(file_path))
 
 			# clear the pending_search variable, since the program has found the files that could be found
 			# and has processed the files that couldn't be found
 			self.pending_search.clear()
 
+		# return the files found
+		return(set(aux.values()))
+
 	# searches the provided basename in self.files (only in the relevant keys of files)
 	# returns the corresponding absolute path, if found, or an empty string otherwise
 	def findInFiles(self, file_basename) :
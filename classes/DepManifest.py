@@ -0,0 +1,118 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+import json
+from classes import General
+
+class DepManifest :
+	"""Record of the dependency files generated for the project, stored in a single JSON file.
+	Each source file's entry has the dependency list written to its dependency file and what that file was written with,
+	so a restart reads one file instead of parsing every dependency file."""
+
+	# class variable storing the version of the file's layout
+	# a file with a different version is discarded
+	version_ = 2
+
+	def __init__(self, file_path) :
+		# instance variable storing the absolute path to the manifest file
+		self.file_path = file_path
+
+		# instance variable storing the entry of each source file
+		# format: [src_file_basename] = dict() with format:
+		# 	- dependents: list() with the dependent files' abs paths, in the order they were written
+		# 	- config: dict() with the values of the configurations the dependency file was written with, with format: [config key] = value
+		# 	- template_digest: digest of the rule template the dependency file was written with
+		# 	- mtimes: dict() with format: [dependent file abs path] = modify time when the list was validated
+		# 	- dep_file_stat: list(modify time, size) of the dependency file after it was written
+		self.entries = dict()
+
+		# instance variable storing whether the entries changed since the file was last loaded or saved
+		self.changed = False
+
+	# reads the manifest file, replacing any entries in memory
+	# a missing, invalid or outdated file leaves no entries
+	def load(self) :
+		self.entries.clear()
+		self.changed = False
+
+		# get the file's content
+		file_content = General.General.parseJSON(self.file_path)
+
+		# check if the file is valid for this version
+		if (not isinstance(file_content, dict) or file_content.get("version") != DepManifest.version_ or not isinstance(file_content.get("entries"), dict)) :
+			# it isn't
+			return
+
+		self.entries.update(file_content["entries"])
+
+	# writes the entries to the manifest file, if they changed since it was last loaded or saved
+	# returns True if successful or False otherwise
+	def save(self) :
+		# check if the entries changed
+		if (not self.changed) :
+			# they didn't
+			return(True)
+
+		# NOTE: if the file can't be written, it's only written again once the entries change again
+		self.changed = False
+
+		# write the file atomically, so a crash never leaves it partially written
+		if (not General.General.writeFileAtomic(self.file_path, json.dumps(dict(version=DepManifest.version_, entries=self.entries)))) :
+			# failed to write the file
+			return(False)
+
+		return(True)
+
+	# gets a source file's entry, if it describes the dependency file as it currently is
+	# "dep_file_stat" should be the tuple(modify time, size) of the source file's dependency file
+	# returns the entry's dict() or None if there isn't a valid one
+	def getEntry(self, src_file_basename, dep_file_stat) :
+		entry = self.entries.get(src_file_basename)
+
+		# check if the entry exists and the dependency file wasn't changed since it was recorded
+		try :
+			if (entry == None or dep_file_stat == None or tuple(entry["dep_file_stat"]) != tuple(dep_file_stat)) :
+				# it doesn't or it was
+				return(None)
+
+			# check if the entry has a list and the modify times
+			if (not isinstance(entry["dependents"], list) or len(entry["dependents"]) == 0 or not isinstance(entry["config"], dict) or not isinstance(entry["mtimes"], dict)) :
+				# it hasn't, so it isn't valid
+				return(None)
+		except (KeyError, TypeError) as e :
+			# the entry isn't valid
+			return(None)
+
+		return(entry)
+
+	# records a source file's entry
+	# the arguments have the format of the entry's values in self.entries
+	def setEntry(self, src_file_basename, dependents, config, template_digest, mtimes, dep_file_stat) :
+		entry = dict(dependents=list(dependents), config=config, template_digest=template_digest, mtimes=mtimes, dep_file_stat=list(dep_file_stat))
+
+		# check if the entry changed
+		if (self.entries.get(src_file_basename) != entry) :
+			# it did
+			self.entries[src_file_basename] = entry
+			self.changed = True
+
+	# removes a source file's entry, if it exists
+	def removeEntry(self, src_file_basename) :
+		if (self.entries.pop(src_file_basename, None) != None) :
+			self.changed = True
+
+	# removes the entries of the source files that are no longer in "src_basenames"
+	def prune(self, src_basenames) :
+		for src_file_basename in list(self.entries) :
+			if (src_file_basename not in src_basenames) :
+				self.removeEntry(src_file_basename)
@@ -0,0 +1,106 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+import hashlib
+
+class FileFingerprints :
+	"""Fingerprints of the content of files, used to only consider a file modified when its content changes.
+	A file is only hashed when its modify time or size differ from the ones stored with its fingerprint."""
+
+	# class variable storing the number of bytes read at a time when hashing a file
+	chunk_size_ = 1048576
+
+	def __init__(self, stat_cache) :
+		# instance variable referencing the StatCache used to get the modify time and size of the files
+		self.stat_cache = stat_cache
+
+		# controls whether the fingerprints are used
+		# if False, the modify times are taken directly from the StatCache
+		# NOTE: set by the Application class, based on the "content_hash" configuration
+		self.enabled = False
+
+		# instance variable storing the fingerprint of each file checked
+		# format: [file absolute path] = dict(mtime = modify time when last checked, size = size when last checked,
+		# 		  hash = hash of the content when last checked or None if it couldn't be read,
+		# 		  content_mtime = modify time when the content last changed)
+		self.entries = dict()
+
+		# instance variables storing the number of files hashed and the number of modifications that
+		# were ignored because the content didn't change
+		self.hashes = 0
+		self.unchanged = 0
+
+	# discards all the fingerprints
+	def clear(self) :
+		self.entries.clear()
+
+	# gets the modify time of a file, as of the last time its content changed
+	# if the fingerprints aren't enabled, the file's actual modify time is returned
+	# returns the modify time
+	# NOTE: like StatCache.getMtime(), raises an OSError if the path isn't a file
+	def getMtime(self, file_path) :
+		# check if the fingerprints are enabled
+		if (not self.enabled) :
+			# they aren't
+			return(self.stat_cache.getMtime(file_path))
+
+		# get the file's modify time and size
+		file_info = self.stat_cache.lookup(file_path)
+
+		# check if the path is a file
+		if (file_info == None) :
+			# it isn't, so its fingerprint is no longer needed
+			self.entries.pop(file_path, None)
+			raise FileNotFoundError("The file \"" + file_path + "\" doesn't exist.")
+
+		# grab this file's fingerprint, if it has one
+		entry = self.entries.get(file_path)
+
+		# check if the file's modify time and size are the same as when it was last checked
+		if (entry != None and entry["mtime"] == file_info[0] and entry["size"] == file_info[1]) :
+			# they are, so assume the content didn't change
+			return(entry["content_mtime"])
+
+		# hash the file's content
+		# NOTE: even if the size changed the hash is needed, to compare with the content in future checks
+		file_hash = self.hashFile(file_path)
+
+		# check if the content is the same as when the file was last checked
+		if (entry != None and entry["size"] == file_info[1] and file_hash != None and entry["hash"] == file_hash) :
+			# it is, so the file was only touched
+			self.unchanged += 1
+			entry["mtime"] = file_info[0]
+			return(entry["content_mtime"])
+
+		# the content changed or this is the first check of this file
+		self.entries[file_path] = dict(mtime=file_info[0], size=file_info[1], hash=file_hash, content_mtime=file_info[0])
+
+		return(file_info[0])
+
+	# hashes the content of a file
+	# returns the hash as bytes, or None if the file couldn't be read
+	def hashFile(self, file_path) :
+		# keep count of the files hashed
+		self.hashes += 1
+
+		try :
+			# feed the file's content to the hash, a chunk at a time
+			file_hash = hashlib.blake2b(digest_size = 16)
+			with open(file_path, "rb") as file_object :
+				for chunk in iter(lambda : file_object.read(FileFingerprints.chunk_size_), b"") :
+					file_hash.update(chunk)
+
+			return(file_hash.digest())
+		except OSError as e :
+			# failled to read the file
+			return(None)
@@ -0,0 +1,28 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+class FileRecord :
+	"""Stores the information about a file obtained when its directory was listed."""
+
+	# NOTE: large project trees create one instance per relevant file, so no per instance dict() is used
+	__slots__ = ("path", "mtime", "size")
+
+	def __init__(self, path, mtime, size) :
+		# instance variable storing the file's absolute path
+		self.path = path
+
+		# instance variable storing the file's modify time
+		self.mtime = mtime
+
+		# instance variable storing the file's size, in bytes
+		self.size = size
@@ -11,7 +11,8 @@
 #															#
 ############################################################
 
-import os
+import os, re, stat, tempfile
+from classes import TreeWalker
 
 class General :
 	"""Contains static functions usefull in other classes.
@@ -20,6 +21,12 @@ class General :
 	# class variable storing
 	json_decoder_ = None
 
+	# class variable storing the process' umask, used to give new files the default permissions
+	# NOTE: the umask can only be read by setting it, which changes it for every thread, so it's read once
+	# 		when this module is imported, before any other threads are started
+	umask_ = os.umask(0)
+	os.umask(umask_)
+
 	def __init__(self) :
 		pass
 
@@ -28,104 +35,48 @@ class General :
 	# those basenames can be of the form "*.extension" to search for all files with that extension
 	# returns a dict() with format: [file basename] = file absolute paths
 	# NOTE: this method expects path to point to a directory, not a file
-	# NOTE: will be called recursively
+	# NOTE: the search is done by TreeWalker.findFiles(), use it directly to also get the files' modify time and size
 	@staticmethod
 	def findFiles(basenames, path) :
-		# stores the final data
-		files = dict()
-
-		# standardize "path"
-		path = General.standardizePath(path)
-
-		# check if the path is a directory
-		if (not os.path.isdir(path)) :
-			# it isn't, so bail out
-			return(files)
-
-		# grab the contents of the directory pointed by path
-		dir_contents = os.listdir(path)
-
-		# stores the names of the directories found
-		dir_names = set()
-
-		# loop through each item in the directory, checking all the files in the current directory
-		# ends when all files have been checked or all basenames found
-		# NOTE: any folders in this directory will be checked after the files, if necessary
-		while len(basenames) > 0 and len(dir_contents) > 0 :
-			# grab the last item in the list
-			cur_item_basename = dir_contents.pop()
-			cur_item_path = path + "\\" + cur_item_basename
-
-			# check if the item is a file
-			if (os.path.isfile(cur_item_path)) :
-				# it is a file
-				# get this file's extension
-				aux_pos = cur_item_basename.rfind(".")
-				if (aux_pos == -1) :
-					# this file doesn't have an explicit extension
-					cur_item_extension = ""
-				else :
-					cur_item_extension = cur_item_basename[aux_pos + 1:]
-
-				# check if this file's basename is one of the relevant files
-				if (cur_item_basename in basenames) :
-					# this file is relevant and it's a specific file
-					# add the file to the final data
-					files[cur_item_basename] = cur_item_path
-
-					# remove this file from the basenames left to find
-					basenames.remove(cur_item_basename)
-				elif ("*." + cur_item_extension in basenames) :
-					# this file is relevant, but it's not a specific file
-					# add the file to the final data
-					files[cur_item_basename] = cur_item_path
-			else :
-				# it isn't a file
-				# store this directory's name to be checked later, if necessary
-				dir_names.add(cur_item_path)
-
-			# if there are still basenames to be found and the current directory has
-			# folders, go through them
-			# ends when all folders have been checked or all basenames found
-			while len(basenames) > 0 and len(dir_names) > 0 :
-				# grab a path to a folder
-				cur_item_path = dir_names.pop()
-
-				# call this method recursively to process this item
-				found_files = General.findFiles(basenames, cur_item_path)
-
-				# check if any files were found
-				if (len(found_files) > 0) :
-					# they were
-					# loop through each file found
-					for found_file_basename in found_files :
-						# add this file to this function call's final data
-						files[found_file_basename] = found_files[found_file_basename]
+		# search for the files
+		found_files = TreeWalker.TreeWalker.findFiles(basenames, General.standardizePath(path))
 
 		# return the final data
-		return(files)
+		return(dict([(file_basename, found_files[file_basename].path) for file_basename in found_files]))
 
 	# executes the necessary adjustments to a path to make it standardized for the program
 	# can receive both relative and absolute paths
+	# the standardized paths use the platform's directory separator ("\" on Windows and "/" on other platforms)
 	# returns the processed path
 	@staticmethod
 	def standardizePath(path) :
-		# change all "/" to "\"
-		path = path.replace("/", "\\")
+		# change all "/" and "\" to the platform's directory separator
+		path = path.replace("/", os.sep).replace("\\", os.sep)
 
 		# check if the path starts with a "\"
-		if (path.startswith("\\")) :
+		# NOTE: on other platforms the leading "/" is what makes a path absolute, so it's kept
+		if (os.sep == "\\" and path.startswith("\\")) :
 			# it does, so remove it
 			path = path[1:]
 
-		# check if the path ends with a "\"
-		if (path.endswith("\\")) :
+		# check if the path ends with a directory separator, other than the one of the file system's root
+		if (path.endswith(os.sep) and len(path) > 1) :
 			# it does, so remove it
 			path = path[:-1]
 
 		# return the processed path
 		return(path)
 
+	# checks if a standardized path is an absolute path
+	# on Windows an absolute path starts with a drive (ex: "C:\") and on other platforms with "/"
+	# returns True if it is, False otherwise
+	@staticmethod
+	def isAbsolutePath(path) :
+		if (os.sep == "\\") :
+			return(re.match("[a-z]:[\\\\]", path, re.I) != None)
+
+		return(path.startswith("/"))
+
 	# opens and reads the contents of a file
 	# returns a string with the file's contents or an empty string if it failled
 	@staticmethod
@@ -137,8 +88,8 @@ class General :
 			file_object.close()
 
 			return(file_content)
-		except OSError as e:
-			# failled to open file
+		except (OSError, UnicodeDecodeError) as e:
+			# failled to open file or its content isn't valid UTF-8
 			return(None)
 
 	# opens/creates and writes a string to a file
@@ -156,6 +107,63 @@ class General :
 			# failled to open/write file
 			return(False)
 
+	# writes a string to a file atomically, by writing it to a temporary file in the same directory and then
+	# replacing the file with it, so the file is never seen partially written
+	# returns True if successful or False otherwise
+	@staticmethod
+	def writeFileAtomic(file_path, contents) :
+		# stores the temporary file's path
+		temp_path = None
+
+		try :
+			# create the temporary file, in the same directory so it can replace the file
+			file_dirname, file_basename = os.path.split(file_path)
+			temp_fd, temp_path = tempfile.mkstemp(prefix = "." + file_basename + ".", suffix = ".tmp", dir = file_dirname)
+
+			# write the content to the temporary file
+			with os.fdopen(temp_fd, "w", encoding = "utf-8") as file_object :
+				file_object.write(contents)
+
+			# give the temporary file the permissions of the file or, if it's a new file, the default permissions
+			try :
+				file_mode = stat.S_IMODE(os.stat(file_path).st_mode)
+			except OSError as e :
+				file_mode = 0o666 & ~General.umask_
+			os.chmod(temp_path, file_mode)
+
+			# replace the file with the temporary file
+			os.replace(temp_path, file_path)
+
+			return(True)
+		except OSError as e :
+			# failled to write the file
+			# remove the temporary file, if it was created
+			if (temp_path != None) :
+				try :
+					os.remove(temp_path)
+				except OSError as e :
+					pass
+
+			return(False)
+
+	# writes a string to a file, atomically, unless the file already has that exact content
+	# used to avoid changing the file's modify time when its content wouldn't change
+	# returns 1 if the file was written, 0 if it already had the content or -1 if it failled
+	@staticmethod
+	def writeFileIfChanged(file_path, contents) :
+		# check if the file already has this content
+		# NOTE: if the file's content isn't valid text it can't be read, so it will be replaced
+		if (General.readFile(file_path) == contents) :
+			# it has
+			return(0)
+
+		# write the file
+		if (not General.writeFileAtomic(file_path, contents)) :
+			# failled to write the file
+			return(-1)
+
+		return(1)
+
 	# "moves" a file from 1 location to another
 	# returns True if successful or False otherwise
 	@staticmethod
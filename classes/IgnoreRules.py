@@ -0,0 +1,153 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+import os, re
+
+class IgnoreRules :
+	"""Gitignore style rules used to exclude files and directories from the searches of directory trees."""
+
+	def __init__(self) :
+		# instance variable storing the compiled rules, in the order they were added
+		# format: list(dict(regex = compiled regex, negate = bool, dir_only = bool, anchored = bool))
+		self.rules = list()
+
+	# adds rules from a list() of gitignore style patterns
+	# NOTE: empty patterns and patterns starting with "#" are ignored
+	def addPatterns(self, patterns) :
+		# loop through each pattern
+		for pattern in patterns :
+			# remove any trailing whitespace and line breaks
+			pattern = pattern.rstrip()
+
+			# check if this pattern is empty or a comment
+			if (pattern == "" or pattern.startswith("#")) :
+				# it is, so move on
+				continue
+
+			# check if this pattern re-includes what previous patterns excluded
+			negate = False
+			if (pattern.startswith("!")) :
+				# it does
+				negate = True
+				pattern = pattern[1:]
+			elif (pattern.startswith("\\!") or pattern.startswith("\\#")) :
+				# the first character is escaped
+				pattern = pattern[1:]
+
+			# check if this pattern only matches directories
+			dir_only = False
+			if (pattern.endswith("/")) :
+				# it does
+				dir_only = True
+				pattern = pattern.rstrip("/")
+
+			# check if this pattern is anchored to the root of the tree
+			# NOTE: patterns without a "/" match files and directories at any level of the tree
+			anchored = "/" in pattern
+			pattern = pattern.lstrip("/")
+
+			# check if anything is left of the pattern
+			if (pattern == "") :
+				# there isn't, so move on
+				continue
+
+			# store the rule
+			self.rules.append(dict(regex=re.compile(IgnoreRules.translatePattern(pattern), re.I if os.name == "nt" else 0), negate=negate, dir_only=dir_only, anchored=anchored))
+
+	# checks if a file or directory is excluded by the rules
+	# "rel_path" should be the item's path relative to the root of the tree, using "\" or "/" as directory separator
+	# returns True if the item is excluded, False otherwise
+	# NOTE: the last rule matching the item decides if it's excluded or not
+	def isIgnored(self, rel_path, is_dir) :
+		# the rules use "/" as the directory separator
+		rel_path = rel_path.replace("\\", "/")
+
+		# get the item's basename
+		basename = rel_path[rel_path.rfind("/") + 1:]
+
+		# loop through the rules, from the last to the first
+		for rule in reversed(self.rules) :
+			# check if this rule only applies to directories
+			if (rule["dir_only"] and not is_dir) :
+				# it does
+				continue
+
+			# check if this rule matches the item
+			if (rule["regex"].fullmatch(rel_path if rule["anchored"] else basename) != None) :
+				# it does
+				return(not rule["negate"])
+
+		# at this point no rule matched the item
+		return(False)
+
+	# converts a gitignore style pattern into a regex string
+	# returns the regex string
+	@staticmethod
+	def translatePattern(pattern) :
+		# stores the final data
+		regex_str = ""
+
+		# loop through each character of the pattern
+		i = 0
+		while i < len(pattern) :
+			char = pattern[i]
+
+			if (char == "*") :
+				# check if this is a "**"
+				if (pattern[i:i + 2] == "**") :
+					# it is
+					if (i + 2 == len(pattern)) :
+						# a trailing "**" matches everything inside
+						regex_str += ".*"
+						i += 2
+					elif (pattern[i + 2] == "/") :
+						# a "**/" matches zero or more directories
+						regex_str += "(?:.*/)?"
+						i += 3
+					else :
+						# any other "**" is the same as a "*"
+						regex_str += "[^/]*"
+						i += 2
+				else :
+					# a "*" matches anything except a "/"
+					regex_str += "[^/]*"
+					i += 1
+			elif (char == "?") :
+				# a "?" matches any character except a "/"
+				regex_str += "[^/]"
+				i += 1
+			elif (char == "[") :
+				# check if this character class is closed
+				end_pos = pattern.find("]", i + 2)
+				if (end_pos == -1) :
+					# it isn't, so it's a literal "["
+					regex_str += re.escape(char)
+					i += 1
+				else :
+					# it is
+					char_class = pattern[i + 1:end_pos].replace("\\", "\\\\")
+					if (char_class.startswith("!")) :
+						char_class = "^" + char_class[1:]
+					regex_str += "[" + char_class + "]"
+					i = end_pos + 1
+			elif (char == "\\" and i + 1 < len(pattern)) :
+				# an escaped character
+				regex_str += re.escape(pattern[i + 1])
+				i += 2
+			else :
+				# a literal character
+				regex_str += re.escape(char)
+				i += 1
+
+		# return the final data
+		return(regex_str)
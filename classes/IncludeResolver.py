@@ -0,0 +1,106 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+import os
+from classes import General
+
+class IncludeResolver :
+	"""Turns the content of an #include directive into the ordered list of places where its file should be looked for.
+	Only joins and normalizes strings, so it never touches the file system or the current working directory
+	and is safe to use from several threads."""
+
+	# class variables with the kinds of step in a resolution order
+	# 	- path: an absolute path that is the file if it exists
+	# 	- project: a basename that is the file if it's one of the project's files
+	# 	- search: a search path whose directory tree should be searched for the basename
+	path_ = "path"
+	project_ = "project"
+	search_ = "search"
+
+	def __init__(self) :
+		# instance variable storing the resolutions already built
+		# format: [tuple(including directory, include string, tuple(search paths), include directories)] = value returned by resolve()
+		self.resolutions = dict()
+
+	# builds the resolution order of an #include directive, found in a file in "including_dir"
+	# "include_str" should be the directive's content, with its delimiters (ex: "file.h" or <file.h>)
+	# "search_paths" should be a tuple() with the search paths, in the order they are searched
+	# "include_dirs" should be a tuple(tuple() with the directories only searched by directives using quotes,
+	# tuple() with the directories searched by every directive), with the include directories the compiler uses
+	# for this file's translation unit, in the order they are searched, or an empty tuple() if they aren't known
+	# the resolution order is:
+	# 	- if the directive has an absolute path, that path
+	# 	- if the include directories are known and the directive uses quotes, the path relative to "including_dir"
+	# 	  followed by the path relative to each include directory, like the compiler does
+	# 	- if the include directories are known and the directive uses "<>", the path relative to each include directory
+	# 	  searched by every directive, like the compiler does
+	# 	- if they aren't and the directive has a path, the path relative to "including_dir"
+	# 	- if they aren't and the directive only has a basename, the file with that basename in "including_dir" followed
+	# 	  by the project's file with that basename
+	# 	- the search paths, to be searched for the file's basename
+	# returns a tuple(file basename, tuple() with each step as tuple(kind of step, absolute path or basename))
+	def resolve(self, including_dir, include_str, search_paths, include_dirs = ()) :
+		key = (including_dir, include_str, search_paths, include_dirs)
+
+		# check if this directive was already resolved
+		resolution = self.resolutions.get(key)
+		if (resolution == None) :
+			# it wasn't
+			resolution = self.buildResolution(including_dir, include_str, search_paths, include_dirs)
+			self.resolutions[key] = resolution
+
+		return(resolution)
+
+	# builds the resolution order of an #include directive, without using the stored resolutions
+	# returns the same data as resolve()
+	def buildResolution(self, including_dir, include_str, search_paths, include_dirs) :
+		# get the directive's path, without its delimiters
+		include_path = General.General.standardizePath(include_str[1:-1])
+
+		# stores the steps of the resolution order
+		steps = list()
+
+		# check if it's an absolute path
+		if (General.General.isAbsolutePath(include_path)) :
+			# it is
+			include_path = IncludeResolver.joinPath("", include_path)
+			steps.append((IncludeResolver.path_, include_path))
+		elif (len(include_dirs) > 0) :
+			# it isn't, but it's relative to the include directories
+			# NOTE: like for the compiler, only the directives using quotes are relative to the including file's directory
+			# 		and to the directories only searched by them
+			base_dirs = include_dirs[1]
+			if (not include_str.startswith("<")) :
+				base_dirs = (including_dir,) + include_dirs[0] + include_dirs[1]
+
+			for base_dir in base_dirs :
+				steps.append((IncludeResolver.path_, IncludeResolver.joinPath(base_dir, include_path)))
+		elif (os.sep in include_path) :
+			# it isn't, but it's relative to the including file's directory
+			steps.append((IncludeResolver.path_, IncludeResolver.joinPath(including_dir, include_path)))
+		else :
+			# it isn't, which means that the #include directive only has the basename of the file
+			steps.append((IncludeResolver.path_, including_dir + os.sep + include_path))
+			steps.append((IncludeResolver.project_, include_path))
+
+		# the last resort is to search for the file's basename in the search paths
+		for search_path in search_paths :
+			steps.append((IncludeResolver.search_, search_path))
+
+		return((os.path.basename(include_path), tuple(steps)))
+
+	# joins a relative path to a directory, resolving any "." and ".." in it
+	# returns the standardized path
+	@staticmethod
+	def joinPath(base_dir, path) :
+		return(General.General.standardizePath(os.path.normpath(os.path.join(base_dir, path))))
@@ -0,0 +1,284 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+import mmap, re
+from classes import General
+
+class IncludeScanner :
+	"""Finds the #include directives in a file, using one of several interchangeable engines.
+	This class is not ment to be instantiated directly."""
+
+	# class variable storing the engine used to scan the files
+	# each engine is a static method named "scan" followed by the capitalized engine name
+	# NOTE: set by the Application class, based on the "scanner_engine" configuration
+	engine_ = "mmap"
+
+	# class variables with the regex strings matching an #include directive and capturing its content, with its delimiters
+	# one matches all the directives and the other only the ones using quotes (excludes the language default libraries)
+	regex_all_ = "#include\\s+([<\\\"][^<>\\\"]+[>\\\"])"
+	regex_quoted_ = "#include\\s+([\\\"][^<>\\\"]+[\\\"])"
+
+	# class variables with the same regexes compiled to work on bytes, used by the "mmap" engine
+	bytes_regex_all_ = re.compile(regex_all_.encode("utf-8"), re.I)
+	bytes_regex_quoted_ = re.compile(regex_quoted_.encode("utf-8"), re.I)
+
+	# class variable with the regex used by the "lexer" engine to split a file into tokens
+	# the tokens are, in order of priority:
+	# 	- a directive: a "#" at the start of a line, followed by the directive's name and its arguments
+	# 	  until the end of the line, including any line continuations and comments spanning several lines
+	# 	- a comment: "//" until the end of the line or "/*" until the next "*/"
+	# 	- a string literal: a raw string, a "" string or a '' character (not preceded by a digit,
+	# 	  to avoid the digit separators of C++14)
+	# NOTE: the lookahead at the start quickly skips the positions where no token can start
+	lexer_regex_ = re.compile(
+		b"(?=^|[/\"'RuUL])(?:(?P<directive>^[ \\t]*#[ \\t]*(?P<name>[A-Za-z_][A-Za-z0-9_]*)?"
+		b"(?P<args>(?:\\\\\\r?\\n|/\\*.*?\\*/|//[^\\n]*|\"(?:\\\\.|[^\"\\\\\\n])*\"|[^\\n])*))"
+		b"|(?P<comment>//(?:\\\\\\r?\\n|[^\\n])*|/\\*.*?\\*/|/\\*.*)"
+		b"|(?P<string>(?<![A-Za-z0-9_])(?:u8|u|U|L)?R\"(?P<delim>[^()\\\\ \\t\\r\\n]{0,16})\\(.*?\\)(?P=delim)\""
+		b"|\"(?:\\\\.|[^\"\\\\\\n])*\"|(?<![0-9])'(?:\\\\.|[^'\\\\\\n])*'))",
+		re.M | re.S)
+
+	# class variable with the regex used by the "lexer" engine to remove the comments and line continuations
+	# from a directive's arguments, while keeping any "" strings intact (captured in group 1)
+	lexer_cleanup_regex_ = re.compile(b"(\"(?:\\\\.|[^\"\\\\\\n])*\")|/\\*.*?\\*/|//[^\\n]*|\\\\\\r?\\n", re.S)
+
+	# class variable with the regex used by the "lexer" engine to extract the content of an "#include" directive, with its delimiters
+	# group 1 has the content of a directive using quotes and group 2 of one using "<>"
+	lexer_include_regex_ = re.compile(b"\\s*(?:(\"[^<>\"\\r\\n]+\")|(<[^<>\"\\r\\n]+>))")
+
+	def __init__(self) :
+		pass
+
+	# finds the #include directives in a file, using the engine in IncludeScanner.engine_
+	# if "builtin_libs" is False, the directives using "<>" will be ignored
+	# returns a list() with the content of each directive, with its delimiters (ex: "file.h" or <file.h>),
+	# in the order they appear in the file, or None if the file couldn't be read
+	@staticmethod
+	def scanFile(file_path, builtin_libs) :
+		return(IncludeScanner.scanFileWithEngine(IncludeScanner.engine_, file_path, builtin_libs))
+
+	# finds the #include directives in a file, using the provided engine instead of IncludeScanner.engine_
+	# used by the worker processes of the DepListBuilder class, which don't share the class variables of the main process
+	# returns the same data as scanFile()
+	@staticmethod
+	def scanFileWithEngine(engine, file_path, builtin_libs) :
+		return(getattr(IncludeScanner, "scan" + engine.capitalize())(file_path, builtin_libs))
+
+	# "regex" engine: decodes the entire file as UTF-8 and runs the regex over it
+	# returns the same data as scanFile()
+	@staticmethod
+	def scanRegex(file_path, builtin_libs) :
+		# get the contents of the file
+		file_content = General.General.readFile(file_path)
+
+		# check if the file's content was successfully acquired
+		if (file_content == None) :
+			# it wasn't
+			return(None)
+
+		# select the regex, based on whether the language default libraries are relevant
+		if (builtin_libs) :
+			regex_str = IncludeScanner.regex_all_
+		else :
+			regex_str = IncludeScanner.regex_quoted_
+
+		# return the content of each directive
+		return([re_match.group(1) for re_match in re.finditer(regex_str, file_content, re.I)])
+
+	# "mmap" engine: maps the file into memory and works directly on its bytes, jumping from one "#" to the next
+	# and only trying the regex at those positions
+	# only the content of each directive is decoded, so the file's encoding doesn't need to be valid UTF-8
+	# returns the same data as scanFile()
+	# NOTE: the matches are the same as the "regex" engine's, except for exotic whitespace between "#include"
+	# 		and its content (ex: non-breaking spaces), which is only recognised when working on text
+	@staticmethod
+	def scanMmap(file_path, builtin_libs) :
+		# select the regex, based on whether the language default libraries are relevant
+		if (builtin_libs) :
+			regex = IncludeScanner.bytes_regex_all_
+		else :
+			regex = IncludeScanner.bytes_regex_quoted_
+
+		# map the file into memory
+		file_map = IncludeScanner.mapFile(file_path)
+
+		# check if the file was successfully mapped
+		if (file_map == None) :
+			# it wasn't
+			return(None)
+
+		# stores the final data
+		includes = list()
+
+		# loop through each "#" in the file
+		pos = file_map.find(b"#")
+		while pos != -1 :
+			# check if an #include directive starts here
+			re_match = regex.match(file_map, pos)
+			if (re_match == None) :
+				# it doesn't, so move on to the next "#"
+				pos = file_map.find(b"#", pos + 1)
+				continue
+
+			# add the directive's content to the final data
+			includes.append(re_match.group(1).decode("utf-8", "surrogateescape"))
+
+			# continue after this directive
+			pos = file_map.find(b"#", re_match.end())
+
+		# release the file
+		IncludeScanner.unmapFile(file_map)
+
+		# return the final data
+		return(includes)
+
+	# "lexer" engine: splits the file into comments, string literals and preprocessor directives, in the same way
+	# the compiler's preprocessor does, and only returns the #include directives the compiler will actually see
+	# directives inside comments, string literals or code disabled by "#if 0" (or the "#else" of an "#if 1")
+	# are ignored, as are the directives in "#elif" and "#else" branches following a branch that is always taken
+	# any other conditions can't be evaluated without the project's macros, so both branches are considered active
+	# returns the same data as scanFile()
+	# NOTE: unlike the other engines, "#include" is case sensitive and doesn't need whitespace before its content,
+	# 		like in the compiler's preprocessor
+	@staticmethod
+	def scanLexer(file_path, builtin_libs) :
+		# map the file into memory
+		file_map = IncludeScanner.mapFile(file_path)
+
+		# check if the file was successfully mapped
+		if (file_map == None) :
+			# it wasn't
+			return(None)
+
+		# stores the final data
+		includes = list()
+
+		# stores the conditional groups ("#if" ... "#endif") the current position is inside of, from the outermost
+		# format: list(dict(parent_active = bool, taken = True if a previous branch is always taken,
+		# 		  False if all previous branches are never taken or None if unknown))
+		groups = list()
+
+		# controls whether the code at the current position will be seen by the compiler
+		active = True
+
+		# loop through each token in the file
+		# NOTE: only the directives are relevant, the comments and string literals are matched to skip over them
+		for token in IncludeScanner.lexer_regex_.finditer(file_map) :
+			# check if this token is a directive
+			if (token.group("directive") == None) :
+				# it isn't
+				continue
+
+			# get the directive's name and its arguments, without comments and line continuations
+			name = token.group("name")
+			args = IncludeScanner.lexer_cleanup_regex_.sub(lambda re_match : re_match.group(1) or b" ", token.group("args"))
+
+			if (name in (b"if", b"ifdef", b"ifndef")) :
+				# a new conditional group starts
+				# NOTE: only the "#if" conditions can be evaluated
+				value = IncludeScanner.evaluateCondition(args) if name == b"if" else None
+				groups.append(dict(parent_active=active, taken=value))
+				active = active and value != False
+			elif (name in (b"elif", b"elifdef", b"elifndef")) :
+				# check if there is a group to continue
+				if (len(groups) == 0) :
+					# there isn't, so ignore this directive
+					continue
+
+				# check if a previous branch of this group is always taken
+				if (groups[-1]["taken"] == True) :
+					# it is, so this branch is never taken
+					active = False
+				else :
+					# it isn't
+					value = IncludeScanner.evaluateCondition(args) if name == b"elif" else None
+					active = groups[-1]["parent_active"] and value != False
+					if (value != False) :
+						groups[-1]["taken"] = value
+			elif (name == b"else") :
+				# check if there is a group to continue
+				if (len(groups) == 0) :
+					# there isn't, so ignore this directive
+					continue
+
+				# this branch is taken unless a previous branch is always taken
+				active = groups[-1]["parent_active"] and groups[-1]["taken"] != True
+				groups[-1]["taken"] = True
+			elif (name == b"endif") :
+				# check if there is a group to end
+				if (len(groups) == 0) :
+					# there isn't, so ignore this directive
+					continue
+
+				# the group ends
+				active = groups.pop()["parent_active"]
+			elif (name == b"include" and active) :
+				# check if the directive's content is a file
+				# NOTE: "#include MACRO" can't be resolved without the project's macros
+				re_match = IncludeScanner.lexer_include_regex_.match(args)
+				if (re_match == None) :
+					# it isn't
+					continue
+
+				# add the directive's content to the final data
+				if (re_match.group(1) != None) :
+					includes.append(re_match.group(1).decode("utf-8", "surrogateescape"))
+				elif (builtin_libs) :
+					includes.append(re_match.group(2).decode("utf-8", "surrogateescape"))
+
+		# release the file
+		IncludeScanner.unmapFile(file_map)
+
+		# return the final data
+		return(includes)
+
+	# evaluates the condition of an "#if" or "#elif" directive, if it's a plain number (ex: "0", "1" or "(0)")
+	# returns True if the condition is always true, False if it's always false or None if it's unknown
+	@staticmethod
+	def evaluateCondition(condition) :
+		# remove any whitespace and surrounding parenthesis
+		condition = condition.strip()
+		while condition.startswith(b"(") and condition.endswith(b")") :
+			condition = condition[1:-1].strip()
+
+		# check if the condition is a number
+		re_match = re.fullmatch(b"(0[xX])?([0-9a-fA-F]+)[uUlL]*", condition)
+		if (re_match == None or (re_match.group(1) == None and not re_match.group(2).isdigit())) :
+			# it isn't
+			return(None)
+
+		return(int(re_match.group(2), 16 if re_match.group(1) != None else 10) != 0)
+
+	# maps a file into memory, for read only access
+	# returns the mmap object, an empty bytes object if the file is empty (it can't be mapped)
+	# or None if the file couldn't be read
+	@staticmethod
+	def mapFile(file_path) :
+		try :
+			with open(file_path, "rb") as file_object :
+				try :
+					return(mmap.mmap(file_object.fileno(), 0, access = mmap.ACCESS_READ))
+				except ValueError as e :
+					# the file is empty
+					return(bytes())
+		except OSError as e :
+			# failled to open or map the file
+			return(None)
+
+	# releases a file mapped by mapFile()
+	@staticmethod
+	def unmapFile(file_map) :
+		# check if the file was mapped
+		if (isinstance(file_map, mmap.mmap)) :
+			# it was
+			file_map.close()
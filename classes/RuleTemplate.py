@@ -0,0 +1,166 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+import hashlib, re
+from classes import General
+
+class RuleTemplate :
+	"""The Makefile rule template used to build the dependency files, compiled into a list of segments.
+	The template file is only read and compiled again when its modify time or size change, and the same segments
+	are used to find the dependent files in an existing dependency file."""
+
+	# class variable with the regex matching a valid keyword in the rule template and capturing its name
+	keyword_regex_ = re.compile("\\|!(dependents|src_file_basename|src_file_name|src_file_ext)!\\|")
+
+	# class variable with the keyword replaced by the dependent files
+	dependents_keyword_ = "|!dependents!|"
+
+	def __init__(self, stat_cache) :
+		# instance variable referencing the StatCache used to know if the template file changed
+		self.stat_cache = stat_cache
+
+		# instance variables storing the absolute path to the template file and its modify time and size when it was
+		# compiled, or None if it hasn't been compiled
+		self.file_path = None
+		self.file_stat = None
+
+		# instance variable storing the digest of the template file's content when it was compiled, or None if it
+		# hasn't been compiled
+		# used to know if a dependency file was written with the current template, even if the file was touched
+		self.digest = None
+
+		# instance variable storing the compiled template
+		# format: list() with each segment as tuple(True, keyword name) or tuple(False, text)
+		self.segments = list()
+
+		# instance variable storing the segments before and after the dependents keyword, in the last line of the
+		# template with that keyword, or None if there is no such line
+		# format: tuple(list() with the segments before the keyword, list() with the segments after it)
+		self.dependents_line = None
+
+	# brings the compiled template up-to-date with the template file
+	# returns True if successful, False if the file couldn't be read
+	def load(self, file_path) :
+		# get the file's modify time and size
+		file_stat = self.stat_cache.lookup(file_path)
+
+		# check if the file exists
+		if (file_stat == None) :
+			# it doesn't
+			self.file_path = self.file_stat = self.digest = None
+			return(False)
+
+		# check if the file changed since it was compiled
+		if (file_path == self.file_path and file_stat == self.file_stat) :
+			# it didn't
+			return(True)
+
+		# get the file's content
+		file_content = General.General.readFile(file_path)
+		if (file_content == None) :
+			# it couldn't be read
+			self.file_path = self.file_stat = self.digest = None
+			return(False)
+
+		# compile the template
+		self.segments = RuleTemplate.compileSegments(file_content)
+
+		# find the last line with the dependents keyword and compile the parts before and after it
+		self.dependents_line = None
+		for line in file_content.split("\n") :
+			if (RuleTemplate.dependents_keyword_ in line) :
+				line_parts = line.split(RuleTemplate.dependents_keyword_, 1)
+				self.dependents_line = (RuleTemplate.compileSegments(line_parts[0]), RuleTemplate.compileSegments(line_parts[1]))
+
+		self.file_path = file_path
+		self.file_stat = file_stat
+		self.digest = hashlib.blake2b(file_content.encode("utf-8"), digest_size = 16).hexdigest()
+
+		return(True)
+
+	# replaces the keywords in the compiled template by the respective data of a source file
+	# returns a string with the rule
+	def render(self, src_file_basename, dependency_str) :
+		return(RuleTemplate.renderSegments(self.segments, RuleTemplate.buildKeywordValues(src_file_basename, dependency_str)))
+
+	# finds the dependent files in the content of a source file's existing dependency file, which is the text matching
+	# the dependents keyword in the first line matching the template's line with that keyword
+	# NOTE: the lines are compared ignoring the case and any other dependents keyword in that line is compared as text
+	# returns a string with the dependent files, or None if no line matches
+	def parseDependents(self, src_file_basename, file_content) :
+		# check if the template has the dependents keyword
+		if (self.dependents_line == None) :
+			# it doesn't
+			return(None)
+
+		# build the text before and after the dependent files, for this source file
+		keyword_values = RuleTemplate.buildKeywordValues(src_file_basename, RuleTemplate.dependents_keyword_)
+		prefix = RuleTemplate.renderSegments(self.dependents_line[0], keyword_values).lower()
+		suffix = RuleTemplate.renderSegments(self.dependents_line[1], keyword_values).lower()
+
+		# loop through each line of the content
+		for line in file_content.split("\n") :
+			# check if this line has the text before and after the dependent files, with some text in between
+			line_lower = line.lower()
+			if (len(line) > len(prefix) + len(suffix) and line_lower.startswith(prefix) and line_lower.endswith(suffix)) :
+				# it has
+				return(line[len(prefix):len(line) - len(suffix)])
+
+		# at this point no line matched
+		return(None)
+
+	# splits a text into segments of text and keywords
+	# returns a list() with the format of self.segments
+	@staticmethod
+	def compileSegments(text) :
+		segments = list()
+
+		# loop through each keyword
+		position = 0
+		for re_match in RuleTemplate.keyword_regex_.finditer(text) :
+			# add the text before this keyword, if any
+			if (re_match.start() > position) :
+				segments.append((False, text[position:re_match.start()]))
+
+			segments.append((True, re_match.group(1)))
+			position = re_match.end()
+
+		# add the text after the last keyword, if any
+		if (position < len(text)) :
+			segments.append((False, text[position:]))
+
+		return(segments)
+
+	# joins a list of segments, replacing the keywords by their values
+	# returns the string
+	@staticmethod
+	def renderSegments(segments, keyword_values) :
+		return("".join([keyword_values[segment_value] if is_keyword else segment_value for is_keyword, segment_value in segments]))
+
+	# builds the values of the keywords for a source file
+	# returns a dict() with format: [keyword name] = value
+	@staticmethod
+	def buildKeywordValues(src_file_basename, dependency_str) :
+		# find the src file's name and extension
+		# check if the source file has an explicit extension
+		aux_pos = src_file_basename.rfind(".")
+		if (aux_pos != -1) :
+			# it has
+			src_file_name = src_file_basename[:aux_pos]
+			src_file_ext = src_file_basename[aux_pos + 1:]
+		else :
+			# it doesn't
+			src_file_name = src_file_basename
+			src_file_ext = ""
+
+		return(dict(dependents=dependency_str, src_file_basename=src_file_basename, src_file_name=src_file_name, src_file_ext=src_file_ext))
@@ -0,0 +1,87 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+import os
+from classes import TreeSnapshot
+
+class SearchPathIndex :
+	"""Index of all the files in a search path's directory tree, by basename.
+	Kept up-to-date with a TreeSnapshot, so only the directories whose modify time changed are listed again."""
+
+	def __init__(self, root_path) :
+		# instance variable storing the absolute path to the search path's root directory
+		self.root_path = root_path
+
+		# instance variable storing the snapshot of the search path's directory tree, with all its files
+		self.tree_snapshot = TreeSnapshot.TreeSnapshot(root_path, None)
+
+		# instance variable storing the absolute paths of the files with each basename
+		# format: [file basename] = set(file abs paths)
+		self.entries = dict()
+
+		# instance variable storing a number that changes every time a file is added to or removed from the index
+		# used to know if a basename that wasn't found might be found now
+		self.version = 0
+
+	# brings the index up-to-date with the search path's directory tree
+	def refresh(self) :
+		# bring the snapshot up-to-date
+		changes = self.tree_snapshot.refresh()
+
+		# check if any files were added or removed
+		if (len(changes["added"]) > 0 or len(changes["removed"]) > 0) :
+			# they were
+			self.version += 1
+
+		# remove the files that are no longer in the tree
+		for file_path in changes["removed"] :
+			file_basename = os.path.basename(file_path)
+			if (file_basename in self.entries) :
+				self.entries[file_basename].discard(file_path)
+				if (len(self.entries[file_basename]) == 0) :
+					del self.entries[file_basename]
+
+		# add the new files
+		for file_path in changes["added"] :
+			file_basename = os.path.basename(file_path)
+			if (file_basename not in self.entries) :
+				self.entries[file_basename] = set()
+			self.entries[file_basename].add(file_path)
+
+	# searches the index for the provided basenames
+	# returns a dict() with format: [file basename] = file absolute path, for the basenames found
+	# NOTE: like TreeWalker.findFiles(), if several files have the same basename the first one found by a walk
+	# 		of the tree is returned
+	def findFiles(self, file_basenames) :
+		# stores the final data
+		files = dict()
+
+		# loop through each basename
+		for file_basename in file_basenames :
+			# check if any file has this basename
+			if (file_basename in self.entries) :
+				# at least one has
+				files[file_basename] = min(self.entries[file_basename], key = self.getWalkKey)
+
+		# return the final data
+		return(files)
+
+	# builds a key that sorts the files in the same order a walk of the tree finds them, which is depth first with
+	# the entries of each directory sorted by name and each directory's files before its sub-directories
+	# returns a list() of tuples, one for each path component below the root directory
+	def getWalkKey(self, file_path) :
+		# split the path into the components below the root directory
+		path_parts = file_path[len(self.root_path) + 1:].split(os.sep)
+
+		# the directories sort after the files at the same level
+		return([(1, path_part) for path_part in path_parts[:-1]] + [(0, path_parts[-1])])
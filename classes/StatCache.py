@@ -0,0 +1,114 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+import os, stat
+
+class StatCache :
+	"""Cache of the modify time and size of files, shared by every class that needs to check files.
+	It's cleared at the start of each scan cycle, or invalidated path by path when the changes are known."""
+
+	def __init__(self) :
+		# instance variable storing the information about each file checked
+		# format: [file absolute path] = tuple(modify time, size) or None if the path isn't a file
+		self.entries = dict()
+
+		# instance variables storing the number of checks answered by the cache and by the file system
+		self.hits = 0
+		self.misses = 0
+
+		# instance variable storing a number that changes every time all the information in the cache is discarded
+		# used by other classes to know if information they derived from the cache might be outdated
+		self.generation = 0
+
+		# instance variable storing the paths whose information was discarded individually since the cache was last
+		# cleared, in the order they were discarded
+		# used by other classes, together with generation, to know exactly which information might be outdated
+		self.invalidated = list()
+
+	# discards all the information in the cache
+	def clear(self) :
+		self.entries.clear()
+		self.invalidated.clear()
+		self.generation += 1
+
+	# discards the information about a file
+	# NOTE: the path is recorded even if the cache has no information about it, since a file that was never looked up
+	# (ex: a newly created file) might still be the one a previous search failed to find
+	def invalidate(self, file_path) :
+		self.entries.pop(file_path, None)
+		self.invalidated.append(file_path)
+
+	# stores the information about a file obtained when listing its directory
+	# receives a FileRecord
+	def seed(self, file_record) :
+		self.entries[file_record.path] = (file_record.mtime, file_record.size)
+
+	# gets the information about a file, from the cache or from the file system
+	# returns a tuple(modify time, size) or None if the path isn't a file
+	def lookup(self, file_path) :
+		# check if the information is in the cache
+		if (file_path in self.entries) :
+			# it is
+			self.hits += 1
+			return(self.entries[file_path])
+
+		# get the information from the file system
+		self.misses += 1
+		try :
+			file_stat = os.stat(file_path)
+
+			# check if the path is a file
+			if (stat.S_ISREG(file_stat.st_mode)) :
+				# it is
+				self.entries[file_path] = (file_stat.st_mtime, file_stat.st_size)
+			else :
+				# it isn't
+				self.entries[file_path] = None
+		except OSError as e :
+			# the path doesn't exist
+			self.entries[file_path] = None
+
+		return(self.entries[file_path])
+
+	# checks if a path points to a file
+	# returns True if it does, False otherwise
+	def isFile(self, file_path) :
+		return(self.lookup(file_path) != None)
+
+	# gets the modify time of a file
+	# returns the modify time
+	# NOTE: like os.path.getmtime(), raises an OSError if the path isn't a file
+	def getMtime(self, file_path) :
+		# get the information about the file
+		file_info = self.lookup(file_path)
+
+		# check if the path is a file
+		if (file_info == None) :
+			# it isn't
+			raise FileNotFoundError("The file \"" + file_path + "\" doesn't exist.")
+
+		return(file_info[0])
+
+	# gets the size of a file
+	# returns the size in bytes
+	# NOTE: raises an OSError if the path isn't a file
+	def getSize(self, file_path) :
+		# get the information about the file
+		file_info = self.lookup(file_path)
+
+		# check if the path is a file
+		if (file_info == None) :
+			# it isn't
+			raise FileNotFoundError("The file \"" + file_path + "\" doesn't exist.")
+
+		return(file_info[1])
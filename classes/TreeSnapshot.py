@@ -0,0 +1,176 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+import os, time, concurrent.futures
+from classes import TreeWalker
+
+class TreeSnapshot :
+	"""Persistent snapshot of the relevant files in a directory tree.
+	Each refresh only lists again the directories whose modify time changed since the previous one."""
+
+	# class variable storing the number of nanoseconds during which a directory's modify time is considered unreliable
+	# a directory modified this recently might still change within the same modify time tick, so it will be listed
+	# again on the next refresh
+	racy_window_ns_ = 2000000000
+
+	def __init__(self, root_path, basenames) :
+		# instance variable storing the absolute path to the tree's root directory
+		self.root_path = root_path
+
+		# instance variables storing the basenames of the relevant files
+		# see TreeWalker.findFiles() for the format of the basenames
+		# NOTE: if "basenames" is None every file is relevant
+		self.specific_basenames = set()
+		self.wildcard_extensions = None
+		if (basenames != None) :
+			self.wildcard_extensions = set()
+			for basename in basenames :
+				if (basename.startswith("*.")) :
+					self.wildcard_extensions.add(basename[2:])
+				else :
+					self.specific_basenames.add(basename)
+
+		# instance variable storing the snapshot of each directory in the tree
+		# format: [directory absolute path] = dict(mtime = modify time in ns or None if it must be listed again,
+		# 		  files = set(relevant files' absolute paths), subdirs = list(sub-directories' absolute paths))
+		self.dirs = dict()
+
+	# discards the snapshot, causing the entire tree to be listed on the next refresh
+	def clear(self) :
+		self.dirs.clear()
+
+	# gets the absolute paths of all the relevant files in the snapshot
+	# returns a sorted list() with the paths
+	def getFilePaths(self) :
+		# stores the final data
+		file_paths = list()
+
+		# loop through each directory
+		for dir_path in self.dirs :
+			file_paths.extend(self.dirs[dir_path]["files"])
+
+		# return the final data
+		return(sorted(file_paths))
+
+	# brings the snapshot up-to-date with the directory tree
+	# each known directory is stat'ed and only the ones whose modify time changed are listed again
+	# returns a dict() with format:
+	# 	listed = dict() with format: [file absolute path] = FileRecord, with the relevant files in the directories listed
+	# 	added = set() with the absolute paths of the relevant files that are new to the snapshot
+	# 	removed = set() with the absolute paths of the relevant files that are no longer in the tree
+	def refresh(self) :
+		# stores the final data
+		changes = dict(listed=dict(), added=set(), removed=set())
+
+		# stores the directories found in the tree during this refresh
+		seen_dirs = set()
+
+		# check if the directories should be checked in parallel
+		executor = None
+		if (TreeWalker.TreeWalker.workers_ > 1) :
+			# they should
+			executor = concurrent.futures.ThreadPoolExecutor(TreeWalker.TreeWalker.workers_)
+
+		try :
+			# walk the tree one level at a time, starting with the root directory
+			frontier = list([self.root_path])
+			while len(frontier) > 0 :
+				# check each directory in this level
+				# NOTE: checkDirectory() doesn't change the snapshot, so it's safe to call it from several threads
+				if (executor == None) :
+					results = [self.checkDirectory(dir_path) for dir_path in frontier]
+				else :
+					results = list(executor.map(self.checkDirectory, frontier))
+
+				# process the results, in the same order as the directories in this level
+				frontier = list()
+				for dir_path, dir_mtime, dir_files, dir_subdirs in results :
+					# check if the directory is still available
+					if (dir_mtime == None) :
+						# it isn't, so its files will be removed below
+						continue
+
+					# flag this directory as found
+					seen_dirs.add(dir_path)
+
+					# check if the directory's modify time changed
+					if (dir_files == None) :
+						# it didn't, so the stored snapshot is still valid
+						frontier.extend(self.dirs[dir_path]["subdirs"])
+						continue
+
+					# get the files previously stored for this directory
+					if (dir_path in self.dirs) :
+						old_files = self.dirs[dir_path]["files"]
+					else :
+						old_files = set()
+
+					# compare the files in this directory with the stored ones
+					new_files = set()
+					for file_record in dir_files :
+						new_files.add(file_record.path)
+						changes["listed"][file_record.path] = file_record
+						if (file_record.path not in old_files) :
+							changes["added"].add(file_record.path)
+					changes["removed"].update(old_files.difference(new_files))
+
+					# check if this directory was modified too recently to trust its modify time
+					if (time.time_ns() - dir_mtime < TreeSnapshot.racy_window_ns_) :
+						# it was, so make sure it's listed again on the next refresh
+						dir_mtime = None
+
+					# update the snapshot of this directory
+					self.dirs[dir_path] = dict(mtime=dir_mtime, files=new_files, subdirs=dir_subdirs)
+
+					# move on to its sub-directories
+					frontier.extend(dir_subdirs)
+		finally :
+			# stop the threads, if any were used
+			if (executor != None) :
+				executor.shutdown()
+
+		# remove any directories that are no longer in the tree
+		for dir_path in set(self.dirs.keys()).difference(seen_dirs) :
+			changes["removed"].update(self.dirs[dir_path]["files"])
+			del self.dirs[dir_path]
+
+		# a file can't be added and removed (ex: it moved between directories with the same path in both)
+		changes["removed"].difference_update(changes["added"])
+
+		# return the final data
+		return(changes)
+
+	# checks if a directory changed since it was last stored in the snapshot and if so lists it again
+	# returns a tuple with 4 items:
+	# 	- the directory's absolute path
+	# 	- the directory's modify time in ns, or None if the directory is no longer available
+	# 	- a list() with the FileRecord of each relevant file, or None if the directory didn't change
+	# 	- a list() with the absolute paths of the sub-directories, or None if the directory didn't change
+	def checkDirectory(self, dir_path) :
+		try :
+			# get the directory's modify time
+			dir_mtime = os.stat(dir_path).st_mtime_ns
+		except OSError as e :
+			# the directory is no longer available
+			return(dir_path, None, None, None)
+
+		# check if the directory's modify time matches the stored one
+		if (dir_path in self.dirs and self.dirs[dir_path]["mtime"] == dir_mtime) :
+			# it does, so there is no need to list it again
+			return(dir_path, dir_mtime, None, None)
+
+		# list the directory
+		dir_files, dir_subdirs = TreeWalker.TreeWalker.listDirectory(dir_path, self.root_path, self.specific_basenames, self.wildcard_extensions)
+
+		# return the final data
+		return(dir_path, dir_mtime, dir_files, dir_subdirs)
@@ -0,0 +1,300 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+import os, queue, threading
+from classes import FileRecord
+
+class TreeWalker :
+	"""Iterative walker of directory trees, built on top of os.scandir().
+	This class is not ment to be instantiated directly."""
+
+	# class variable storing the number of threads used to walk a directory tree
+	# if 1, the tree is walked sequentially in the calling thread
+	# NOTE: set by the Application class, based on the "walker_threads" configuration
+	workers_ = 1
+
+	# class variable storing the maximum number of directories waiting in the work queue of a parallel walk
+	# when the queue is full, a thread walks the directories it found itself instead of queuing them
+	queue_size_ = 256
+
+	# class variable storing the IgnoreRules used to exclude files and directories from the walks, or None if there are none
+	# excluded directories are pruned, so their contents are never listed
+	# NOTE: set by the Application class, based on the "ignore_patterns" configuration and the project's ignore file
+	ignore_rules_ = None
+
+	# class variable storing the number of files and directories excluded by the ignore rules since the program started
+	skipped_ = 0
+
+	# class variable storing the lock that protects skipped_ when several threads are walking a tree
+	skipped_lock_ = threading.Lock()
+
+	def __init__(self) :
+		pass
+
+	# searches the directory "path" and all sub-directories for all relevant files
+	# "basenames" should be a set() with the basenames of the files to search for
+	# those basenames can be of the form "*.extension" to search for all files with that extension
+	# returns a dict() with format: [file basename] = FileRecord with the file's absolute path, modify time and size
+	# NOTE: this method expects path to be a standardized path pointing to a directory, not a file
+	# NOTE: the directories are walked depth first, with each directory's files checked before its sub-directories
+	# 		and the entries of each directory sorted by name, so the same tree always produces the same results
+	# NOTE: if several files match the same basename, the first one found is kept
+	# NOTE: if TreeWalker.workers_ is above 1 the tree is walked in parallel, with the same results
+	@staticmethod
+	def findFiles(basenames, path) :
+		# split the basenames into the specific ones and the "*.extension" ones
+		specific_basenames = set()
+		wildcard_extensions = set()
+		for basename in basenames :
+			if (basename.startswith("*.")) :
+				wildcard_extensions.add(basename[2:])
+			else :
+				specific_basenames.add(basename)
+
+		# check if the tree should be walked in parallel
+		if (TreeWalker.workers_ > 1) :
+			# it should
+			return(TreeWalker.findFilesParallel(specific_basenames, wildcard_extensions, path))
+
+		# stores the final data
+		files = dict()
+
+		# stores the directories left to walk
+		# NOTE: used as a stack, so the last directory added is the next one walked
+		dir_paths = list([path])
+
+		# loop through each directory
+		# ends when all directories have been walked or all specific basenames found, if there are no "*.extension" ones
+		while len(dir_paths) > 0 and (len(specific_basenames) > 0 or len(wildcard_extensions) > 0) :
+			# grab a directory
+			dir_path = dir_paths.pop()
+
+			# grab the relevant files and the sub-directories of this directory
+			dir_files, dir_subdirs = TreeWalker.listDirectory(dir_path, path, specific_basenames, wildcard_extensions)
+
+			# loop through each relevant file found
+			for file_record in dir_files :
+				# get this file's basename
+				file_basename = file_record.path[len(dir_path) + 1:]
+
+				# check if a file with this basename was already found
+				if (file_basename in files) :
+					# it was, so keep the first one
+					continue
+
+				# add the file to the final data
+				files[file_basename] = file_record
+
+				# remove this file from the specific basenames left to find, if it's one of them
+				specific_basenames.discard(file_basename)
+
+			# add the sub-directories to the stack, in reverse order so they are walked in sorted order
+			dir_paths.extend(reversed(dir_subdirs))
+
+		# return the final data
+		return(files)
+
+	# parallel version of findFiles(), where several threads list directories at the same time
+	# receives the specific basenames and "*.extension" extensions to search for, already split
+	# returns the same data as findFiles()
+	# NOTE: each directory receives a key with the position of each of its ancestors among their siblings, which makes
+	# 		the order of the keys the same as the order in which findFiles() walks the directories
+	# 		if several files match the same basename, the one with the lowest key is kept, so the results are the same
+	@staticmethod
+	def findFilesParallel(specific_basenames, wildcard_extensions, path) :
+		# stores the best match for each basename
+		# format: [file basename] = tuple(directory key, file position in the directory, FileRecord)
+		matches = dict()
+
+		# lock protecting "matches" and the search progress
+		lock = threading.Lock()
+
+		# stores the search progress
+		# "missing" is the number of specific basenames without a match
+		# "max_key" is the highest directory key among the matches of the specific basenames, once all have one
+		progress = dict(missing=len(specific_basenames), max_key=None)
+
+		# bounded work queue with the directories left to walk
+		# format: tuple(directory key, directory absolute path) or None to signal the threads to stop
+		work_queue = queue.Queue(TreeWalker.queue_size_)
+
+		# walks a directory and any sub-directories that don't fit in the work queue
+		def walkDirectory(dir_key, dir_path) :
+			# stores the directories this thread will walk itself
+			local_dirs = list([(dir_key, dir_path)])
+
+			while len(local_dirs) > 0 :
+				dir_key, dir_path = local_dirs.pop()
+
+				# check if all the specific basenames already have a match found before this directory
+				# NOTE: only possible to stop early if there are no "*.extension" basenames, like in findFiles()
+				with lock :
+					if (len(wildcard_extensions) == 0 and progress["max_key"] != None and dir_key > progress["max_key"]) :
+						# they do, so this directory and its sub-directories can be skipped
+						continue
+
+				# grab the relevant files and the sub-directories of this directory
+				dir_files, dir_subdirs = TreeWalker.listDirectory(dir_path, path, specific_basenames, wildcard_extensions)
+
+				# store the files found, keeping the one with the lowest key for each basename
+				with lock :
+					for file_pos in range(len(dir_files)) :
+						file_basename = dir_files[file_pos].path[len(dir_path) + 1:]
+
+						# check if this basename already has a match with a lower key
+						if (file_basename in matches and matches[file_basename][:2] < (dir_key, file_pos)) :
+							# it does
+							continue
+
+						# check if this is the first match for a specific basename
+						if (file_basename not in matches and file_basename in specific_basenames) :
+							# it is
+							progress["missing"] -= 1
+
+						# store the match
+						matches[file_basename] = (dir_key, file_pos, dir_files[file_pos])
+
+					# check if all the specific basenames have a match
+					if (len(specific_basenames) > 0 and progress["missing"] == 0) :
+						# they do
+						progress["max_key"] = max([matches[file_basename][0] for file_basename in specific_basenames])
+
+				# queue the sub-directories, keeping the ones that don't fit to be walked by this thread
+				for subdir_pos in range(len(dir_subdirs)) :
+					try :
+						work_queue.put_nowait((dir_key + (subdir_pos,), dir_subdirs[subdir_pos]))
+					except queue.Full as e :
+						local_dirs.append((dir_key + (subdir_pos,), dir_subdirs[subdir_pos]))
+
+		# main function of each thread
+		def worker() :
+			while True :
+				# grab a directory to walk
+				item = work_queue.get()
+
+				# check if the thread should stop
+				if (item == None) :
+					# it should
+					work_queue.task_done()
+					break
+
+				try :
+					walkDirectory(item[0], item[1])
+				finally :
+					# flag this directory as walked, even if something went wrong
+					work_queue.task_done()
+
+		# check if there is anything to search for
+		if (len(specific_basenames) == 0 and len(wildcard_extensions) == 0) :
+			# there isn't
+			return(dict())
+
+		# start the threads
+		threads = list()
+		for i in range(TreeWalker.workers_) :
+			threads.append(threading.Thread(target = worker, daemon = True))
+			threads[-1].start()
+
+		# queue the root directory and wait for the entire tree to be walked
+		work_queue.put(((), path))
+		work_queue.join()
+
+		# signal the threads to stop
+		for thread in threads :
+			work_queue.put(None)
+		for thread in threads :
+			thread.join()
+
+		# return the final data
+		return(dict([(file_basename, matches[file_basename][2]) for file_basename in matches]))
+
+	# lists the contents of a single directory
+	# "root_path" should be the absolute path to the root of the tree being walked, used to apply the ignore rules
+	# "specific_basenames" should be a set() with the basenames of the relevant files
+	# "wildcard_extensions" should be a set() with the extensions of the relevant files, or None if all files are relevant
+	# returns a tuple with 2 items:
+	# 	- a list() with a FileRecord for each relevant file, sorted by basename
+	# 	- a list() with the absolute paths of the sub-directories, sorted by basename
+	# NOTE: the type of each entry is taken from the directory listing, so only the relevant files are stat'ed
+	# 		and on Windows not even those, since the listing already has their modify time and size
+	@staticmethod
+	def listDirectory(dir_path, root_path, specific_basenames, wildcard_extensions) :
+		# stores the final data
+		dir_files = list()
+		dir_subdirs = list()
+
+		# stores the number of entries excluded by the ignore rules
+		skipped = 0
+
+		try :
+			# grab the contents of the directory, sorted by basename
+			with os.scandir(dir_path) as dir_iterator :
+				dir_entries = sorted(dir_iterator, key = lambda entry : entry.name)
+		except OSError as e :
+			# the directory can't be listed (ex: it was deleted or access was denied), so move on
+			return(dir_files, dir_subdirs)
+
+		# loop through each entry
+		for dir_entry in dir_entries :
+			try :
+				# check if the entry is a file
+				entry_is_file = dir_entry.is_file()
+
+				# check if the entry is excluded by the ignore rules
+				if (TreeWalker.isIgnored(dir_path + os.sep + dir_entry.name, root_path, not entry_is_file)) :
+					# it is, so move on
+					skipped += 1
+					continue
+
+				if (entry_is_file) :
+					# it is
+					# check if this file is relevant
+					if (wildcard_extensions != None and dir_entry.name not in specific_basenames) :
+						# it's not a specific file, so check its extension
+						aux_pos = dir_entry.name.rfind(".")
+						if (aux_pos == -1 or dir_entry.name[aux_pos + 1:] not in wildcard_extensions) :
+							# this file isn't relevant
+							continue
+
+					# grab this file's modify time and size
+					entry_stat = dir_entry.stat()
+
+					# add the file to the final data
+					dir_files.append(FileRecord.FileRecord(dir_path + os.sep + dir_entry.name, entry_stat.st_mtime, entry_stat.st_size))
+				elif (dir_entry.is_dir()) :
+					# it's a directory
+					dir_subdirs.append(dir_path + os.sep + dir_entry.name)
+			except OSError as e :
+				# the entry is no longer available, so move on
+				continue
+
+		# keep count of the entries excluded by the ignore rules
+		if (skipped > 0) :
+			with TreeWalker.skipped_lock_ :
+				TreeWalker.skipped_ += skipped
+
+		# return the final data
+		return(dir_files, dir_subdirs)
+
+	# checks if a file or directory is excluded by the ignore rules in TreeWalker.ignore_rules_
+	# "root_path" should be the absolute path to the root of the tree where the item was found
+	# returns True if the item is excluded, False otherwise
+	@staticmethod
+	def isIgnored(item_path, root_path, is_dir) :
+		# check if there are any ignore rules
+		if (TreeWalker.ignore_rules_ == None) :
+			# there aren't
+			return(False)
+
+		# check the item's path relative to the root of the tree
+		return(TreeWalker.ignore_rules_.isIgnored(item_path[len(root_path) + 1:], is_dir))
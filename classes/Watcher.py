@@ -0,0 +1,336 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+import os, sys, errno, select, struct, time, ctypes, ctypes.util
+from classes import TreeWalker
+
+class Watcher :
+	"""Event driven watcher of a directory tree, built on top of the Linux inotify API."""
+
+	# class variables with the inotify flags and event masks used by this class
+	# NOTE: values taken from <sys/inotify.h>
+	in_nonblock_ = 0x00000800
+	in_cloexec_ = 0x00080000
+	in_modify_ = 0x00000002
+	in_attrib_ = 0x00000004
+	in_close_write_ = 0x00000008
+	in_moved_from_ = 0x00000040
+	in_moved_to_ = 0x00000080
+	in_create_ = 0x00000100
+	in_delete_ = 0x00000200
+	in_delete_self_ = 0x00000400
+	in_move_self_ = 0x00000800
+	in_q_overflow_ = 0x00004000
+	in_ignored_ = 0x00008000
+	in_onlydir_ = 0x01000000
+	in_isdir_ = 0x40000000
+
+	# class variable with the mask of events requested for each watched directory
+	watch_mask_ = in_modify_ | in_attrib_ | in_close_write_ | in_moved_from_ | in_moved_to_ | in_create_ | in_delete_ | in_delete_self_ | in_move_self_ | in_onlydir_
+
+	# class variable with the format of the fixed size part of an inotify event
+	# format: int wd, uint32 mask, uint32 cookie, uint32 len
+	event_struct_ = struct.Struct("iIII")
+
+	def __init__(self) :
+		# instance variable storing the absolute path to the root of the watched tree
+		self.root_path = ""
+
+		# instance variable storing the libc handle used to call the inotify API
+		self.libc = None
+
+		# instance variable storing the inotify file descriptor
+		self.fd = -1
+
+		# instance variable storing the watched directories
+		# format: [watch descriptor] = directory's absolute path
+		self.wd_paths = dict()
+
+		# instance variable storing the watch descriptor of each watched directory
+		# format: [directory's absolute path] = watch descriptor
+		self.path_wds = dict()
+
+		# controls whether the system's limit of watches was reached
+		self.limit_reached = False
+
+	# checks if the inotify API is available in the current platform
+	# returns True if it is, False otherwise
+	@staticmethod
+	def isSupported() :
+		# check if this is a Linux system
+		if (not sys.platform.startswith("linux")) :
+			# it isn't
+			return(False)
+
+		try :
+			# check if libc exposes the inotify API
+			libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno = True)
+			return(hasattr(libc, "inotify_init1") and hasattr(libc, "inotify_add_watch"))
+		except OSError as e :
+			# libc couldn't be loaded
+			return(False)
+
+	# creates the inotify instance and adds a watch to "root_path" and all its sub-directories
+	# returns True if successful or False otherwise (ex: the system's limit of watches was reached or the root
+	# directory can't be watched)
+	def start(self, root_path) :
+		# store the root of the watched tree
+		self.root_path = root_path
+
+		try :
+			# load libc and create the inotify instance
+			self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno = True)
+			self.fd = self.libc.inotify_init1(Watcher.in_nonblock_ | Watcher.in_cloexec_)
+		except (OSError, AttributeError) as e :
+			# the inotify API isn't available
+			self.fd = -1
+
+		# check if the inotify instance was created
+		if (self.fd < 0) :
+			# it wasn't
+			return(False)
+
+		# add the watches to the directory tree
+		if (not self.watchTree(root_path, None)) :
+			# failed to watch the entire tree
+			self.stop()
+			return(False)
+
+		# check if the root of the tree is being watched
+		# NOTE: watchTree() moves on from a directory that can't be watched (ex: it doesn't exist or can't be read),
+		# 		which for the root would leave nothing to wait for events on
+		if (root_path not in self.path_wds) :
+			# it isn't
+			self.stop()
+			return(False)
+
+		# at this point everything went OK
+		return(True)
+
+	# closes the inotify instance, which removes all the watches
+	def stop(self) :
+		# check if the inotify instance is open
+		if (self.fd >= 0) :
+			# it is
+			os.close(self.fd)
+
+		# reset the instance variables
+		self.fd = -1
+		self.wd_paths.clear()
+		self.path_wds.clear()
+
+	# adds a watch to a single directory (non recursive)
+	# returns 1 if the directory is being watched, 0 if it couldn't be watched (ex: it was deleted)
+	# or -1 if the system's limit of watches was reached
+	def watchDirectory(self, dir_path) :
+		# check if this directory is already being watched
+		if (dir_path in self.path_wds) :
+			# it is
+			return(1)
+
+		# add the watch
+		wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dir_path), ctypes.c_uint32(Watcher.watch_mask_))
+
+		# check if the watch was added
+		if (wd < 0) :
+			# it wasn't
+			# check if the system's limit of watches was reached
+			if (ctypes.get_errno() == errno.ENOSPC) :
+				# it was
+				self.limit_reached = True
+				return(-1)
+
+			# the directory can't be watched, so move on
+			return(0)
+
+		# store the watch
+		self.wd_paths[wd] = dir_path
+		self.path_wds[dir_path] = wd
+
+		return(1)
+
+	# adds a watch to "root_path" and all its sub-directories
+	# if "found_files" is a set(), the absolute paths of the files in the tree will be added to it
+	# returns True if successful or False if the system's limit of watches was reached
+	def watchTree(self, root_path, found_files) :
+		# stores the directories left to watch
+		dir_paths = list([root_path])
+
+		# loop until all directories have been watched
+		while len(dir_paths) > 0 :
+			# grab a directory
+			dir_path = dir_paths.pop()
+
+			# add the watch to this directory
+			result = self.watchDirectory(dir_path)
+			if (result == -1) :
+				# the system's limit of watches was reached
+				return(False)
+			elif (result == 0) :
+				# this directory couldn't be watched, so move on
+				continue
+
+			try :
+				# grab the contents of this directory
+				dir_contents = os.listdir(dir_path)
+			except OSError as e :
+				# the directory is no longer available, so move on
+				continue
+
+			# loop through each item
+			for item_basename in dir_contents :
+				item_path = dir_path + os.sep + item_basename
+
+				# check if this item is a directory
+				# NOTE: symbolic links are not followed, to avoid watching the same directory in a loop
+				item_is_dir = os.path.isdir(item_path) and not os.path.islink(item_path)
+
+				# check if this item is excluded by the ignore rules
+				if (self.isIgnored(item_path, item_is_dir)) :
+					# it is, so it won't be watched or reported
+					continue
+
+				if (item_is_dir) :
+					# it is
+					dir_paths.append(item_path)
+				elif (found_files != None) :
+					# it's a file
+					found_files.add(item_path)
+
+		# at this point the entire tree is being watched
+		return(True)
+
+	# waits for events in the watched directories and collects them until no new events arrive
+	# for "debounce" seconds, or until "max_wait" seconds have passed since the first event
+	# returns a dict() with the format:
+	# 	changed = set() with the absolute paths of the files created or modified
+	# 	deleted = set() with the absolute paths of the files deleted or moved away
+	# 	deleted_dirs = set() with the absolute paths of the directories deleted or moved away
+	# 	overflow = True if events were lost and a full scan of the tree is needed
+	def waitForEvents(self, debounce, max_wait) :
+		# stores the final data
+		events = dict(changed=set(), deleted=set(), deleted_dirs=set(), overflow=False)
+
+		# block until the first event arrives
+		# NOTE: CTRL-C will interrupt this call with a KeyboardInterrupt
+		select.select([self.fd], [], [], None)
+
+		# the time at which the first event arrived
+		first_event_time = time.time()
+
+		# keep reading events until the burst ends
+		while True :
+			# process all the events currently available
+			self.readEvents(events)
+
+			# check if the burst has been going on for too long
+			time_left = max_wait - (time.time() - first_event_time)
+			if (time_left <= 0) :
+				# it has, so stop here and let the caller process what was collected so far
+				break
+
+			# wait for more events, at most "debounce" seconds
+			if (len(select.select([self.fd], [], [], min(debounce, time_left))[0]) == 0) :
+				# no new events arrived, so the burst has ended
+				break
+
+		# return the final data
+		return(events)
+
+	# reads and decodes all the pending events, adding them to the "events" dict()
+	# NOTE: see waitForEvents() for the format of "events"
+	def readEvents(self, events) :
+		try :
+			# grab the raw events
+			buffer = os.read(self.fd, 65536)
+		except BlockingIOError as e :
+			# there are no events to read
+			return
+
+		# loop through each event in the buffer
+		offset = 0
+		while offset + Watcher.event_struct_.size <= len(buffer) :
+			# decode the fixed size part of the event
+			wd, mask, cookie, name_len = Watcher.event_struct_.unpack_from(buffer, offset)
+			offset += Watcher.event_struct_.size
+
+			# decode the name of the file or directory the event refers to
+			name = os.fsdecode(buffer[offset:offset + name_len].rstrip(b"\0"))
+			offset += name_len
+
+			# check if events were lost
+			if (mask & Watcher.in_q_overflow_) :
+				# they were
+				events["overflow"] = True
+				continue
+
+			# check if this watch was removed (ex: the directory was deleted)
+			if (mask & Watcher.in_ignored_) :
+				# it was
+				if (wd in self.wd_paths) :
+					del self.path_wds[self.wd_paths[wd]]
+					del self.wd_paths[wd]
+				continue
+
+			# check if this event is from a known directory
+			if (wd not in self.wd_paths) :
+				# it isn't, so ignore it
+				continue
+
+			# check if the watched directory itself was deleted or moved
+			if (mask & (Watcher.in_delete_self_ | Watcher.in_move_self_)) :
+				# it was
+				events["deleted_dirs"].add(self.wd_paths[wd])
+				continue
+
+			# build the absolute path to the item
+			item_path = self.wd_paths[wd] + os.sep + name
+
+			# check if this item is excluded by the ignore rules
+			if (self.isIgnored(item_path, mask & Watcher.in_isdir_ != 0)) :
+				# it is, so ignore it
+				continue
+
+			# check if the item is a directory
+			if (mask & Watcher.in_isdir_) :
+				# it is
+				if (mask & (Watcher.in_create_ | Watcher.in_moved_to_)) :
+					# a new directory, so watch it and report any files already inside it
+					events["deleted_dirs"].discard(item_path)
+					if (not self.watchTree(item_path, events["changed"])) :
+						# the system's limit of watches was reached
+						events["overflow"] = True
+				elif (mask & (Watcher.in_delete_ | Watcher.in_moved_from_)) :
+					# the directory is gone
+					events["deleted_dirs"].add(item_path)
+			else :
+				# it's a file
+				if (mask & (Watcher.in_delete_ | Watcher.in_moved_from_)) :
+					# the file is gone
+					events["deleted"].add(item_path)
+					events["changed"].discard(item_path)
+				else :
+					# the file was created or modified
+					events["changed"].add(item_path)
+					events["deleted"].discard(item_path)
+
+	# checks if a file or directory inside the watched tree is excluded by the ignore rules
+	# returns True if it is, False otherwise
+	# NOTE: directories watched individually, outside the watched tree, are never excluded
+	def isIgnored(self, item_path, is_dir) :
+		# check if the item is inside the watched tree
+		if (not item_path.startswith(self.root_path + os.sep)) :
+			# it isn't
+			return(False)
+
+		return(TreeWalker.TreeWalker.isIgnored(item_path, self.root_path, is_dir))
@@ -27,7 +27,7 @@ for item in dir_contents :
 		continue
 
 	# check if this item is a file
-	if (not os.path.isfile(dir_path + "\\" + item)) :
+	if (not os.path.isfile(dir_path + os.sep + item)) :
 		# it's not a file, so ignore
 		continue
 
@@ -11,21 +11,50 @@
 #															#
 ############################################################
 
-import traceback
+import argparse, sys, traceback
 from classes import Application, Cli
 
 # code that starts the entire application
-try :
-	# instantiate the application's main class
-	app = Application.Application()
-
-	# start the program's core task
-	app.run()
-except (KeyboardInterrupt, SystemExit) :
-	# the user pressed CTRL-C so terminate the program
-	# print the outro message
-	app.outroMsg()
-except Exception as e :
-	print("\n")
-	traceback.print_exc()
-	print("\n")
+# NOTE: guarded, since the worker processes used to scan files in parallel import this module on some platforms
+if (__name__ == "__main__") :
+	# parse the command line arguments
+	arg_parser = argparse.ArgumentParser(description = "Generates the dependency files of a C/C++ project, for use in Makefiles.")
+	arg_parser.add_argument("--once", nargs = "*", metavar = "source", help = "run a single scan of all the source files, or only the ones provided, and exit instead of starting the interactive prompt")
+	args = arg_parser.parse_args()
+
+	# check if a single scan was requested
+	if (args.once != None) :
+		# it was
+		# stores the program's exit status
+		exit_status = 2
+
+		try :
+			# instantiate the application's main class, without the interactive prompt
+			app = Application.Application(False)
+
+			# run the single scan
+			exit_status = app.runOnce(args.once)
+		except KeyboardInterrupt :
+			# the program couldn't start or the user pressed CTRL-C
+			pass
+		except Exception as e :
+			print("\n")
+			traceback.print_exc()
+			print("\n")
+
+		sys.exit(exit_status)
+
+	try :
+		# instantiate the application's main class
+		app = Application.Application()
+
+		# start the program's core task
+		app.run()
+	except (KeyboardInterrupt, SystemExit) :
+		# the user pressed CTRL-C so terminate the program
+		# print the outro message
+		app.outroMsg()
+	except Exception as e :
+		print("\n")
+		traceback.print_exc()
+		print("\n")
@@ -0,0 +1,10 @@
+#include "real1.h"
+// #include "line_comment.h"
+/* #include "block_comment.h" */
+/*
+#include "multiline_comment.h"
+*/
+#include "real2.h" // #include "after_directive.h"
+#include /* inner comment */ "real3.h"
+int a; /* a comment that doesn't end on this line
+#include "unterminated_line.h" */
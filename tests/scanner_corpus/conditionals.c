@@ -0,0 +1,27 @@
+#include "real1.h"
+#if 0
+#include "if0.h"
+#if 1
+#include "nested_in_if0.h"
+#endif
+#else
+#include "else_of_if0.h"
+#endif
+#if 1
+#include "if1.h"
+#else
+#include "else_of_if1.h"
+#endif
+#if (0)
+#include "if_parenthesized0.h"
+#elif 1
+#include "elif1.h"
+#else
+#include "else_after_elif1.h"
+#endif
+#ifdef SOME_MACRO
+#include "ifdef.h"
+#else
+#include "else_of_ifdef.h"
+#endif
+#include <builtin.h>
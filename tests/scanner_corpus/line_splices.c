@@ -0,0 +1,8 @@
+#include "real1.h"
+// a comment continued on the next line \
+#include "spliced_comment.h"
+#include \
+	"spliced_content.h"
+#define INCLUDE_NOTHING \
+#include "in_define.h"
+#include "real2.h"
@@ -0,0 +1,9 @@
+#include "real1.h"
+const char *a = R"(
+#include "in_raw_string.h"
+)";
+const char *b = u8R"delim(
+)"
+#include "in_delimited_raw_string.h"
+)delim";
+#include "real2.h"
@@ -0,0 +1,7 @@
+#include "real1.h"
+const char *a = "#include <in_string.h>";
+const char *b = "a \" quote # include <in_escaped_string.h>";
+char c = '"';
+#include "real2.h"
+int d = 1'000'000;
+#include "real3.h"
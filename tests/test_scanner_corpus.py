@@ -0,0 +1,90 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+# checks the #include directives found by each IncludeScanner engine in the files of the scanner_corpus directory
+# can be run directly (python tests/test_scanner_corpus.py) or by pytest
+
+import os, sys
+
+# make the program's classes importable, regardless of the current working directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from classes import IncludeScanner
+
+# absolute path to the directory with the files to scan
+corpus_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scanner_corpus")
+
+# the content of the #include directives each engine should find in each file, with the "builtin_libs" configuration on
+# the "regex" and "mmap" engines find every directive in the file, while the "lexer" engine only finds the ones the
+# compiler's preprocessor will see
+# format: [file basename] = dict() with format: [engine] = list() with the content of each directive, with its delimiters, in order
+expected_includes = {
+	"comments.c" : {
+		"regex" : ['"real1.h"', '"line_comment.h"', '"block_comment.h"', '"multiline_comment.h"', '"real2.h"', '"after_directive.h"', '"unterminated_line.h"'],
+		"lexer" : ['"real1.h"', '"real2.h"', '"real3.h"']
+	},
+	"strings.c" : {
+		"regex" : ['"real1.h"', '<in_string.h>', '"real2.h"', '"real3.h"'],
+		"lexer" : ['"real1.h"', '"real2.h"', '"real3.h"']
+	},
+	"raw_strings.c" : {
+		"regex" : ['"real1.h"', '"in_raw_string.h"', '"in_delimited_raw_string.h"', '"real2.h"'],
+		"lexer" : ['"real1.h"', '"real2.h"']
+	},
+	"line_splices.c" : {
+		"regex" : ['"real1.h"', '"spliced_comment.h"', '"in_define.h"', '"real2.h"'],
+		"lexer" : ['"real1.h"', '"spliced_content.h"', '"real2.h"']
+	},
+	"conditionals.c" : {
+		"regex" : ['"real1.h"', '"if0.h"', '"nested_in_if0.h"', '"else_of_if0.h"', '"if1.h"', '"else_of_if1.h"', '"if_parenthesized0.h"', '"elif1.h"', '"else_after_elif1.h"', '"ifdef.h"', '"else_of_ifdef.h"', '<builtin.h>'],
+		"lexer" : ['"real1.h"', '"else_of_if0.h"', '"if1.h"', '"elif1.h"', '"ifdef.h"', '"else_of_ifdef.h"', '<builtin.h>']
+	}
+}
+
+# the "mmap" engine finds the same directives as the "regex" engine
+for file_basename in expected_includes :
+	expected_includes[file_basename]["mmap"] = expected_includes[file_basename]["regex"]
+
+# scans every file in the corpus with every engine and compares the directives found with the expected ones
+# returns a list() with a message for each mismatch
+def findMismatches() :
+	# stores the final data
+	mismatches = list()
+
+	# loop through each file and engine
+	for file_basename in sorted(expected_includes) :
+		for engine in sorted(expected_includes[file_basename]) :
+			found_includes = IncludeScanner.IncludeScanner.scanFileWithEngine(engine, os.path.join(corpus_dir, file_basename), True)
+
+			# check if the directives found are the expected ones
+			if (found_includes != expected_includes[file_basename][engine]) :
+				# they aren't
+				mismatches.append(file_basename + " (" + engine + "): expected " + str(expected_includes[file_basename][engine]) + ", found " + str(found_includes))
+
+	# return the final data
+	return(mismatches)
+
+def test_scanner_corpus() :
+	assert findMismatches() == []
+
+if (__name__ == "__main__") :
+	mismatches = findMismatches()
+	for mismatch in mismatches :
+		print(mismatch)
+
+	# check if all the files were scanned as expected
+	if (len(mismatches) > 0) :
+		# they weren't
+		sys.exit(1)
+
+	print("All the files in the scanner corpus were scanned as expected.")
@@ -0,0 +1,165 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+# benchmark of the scan of the source files, run by the program itself on a synthetic project
+# for each crawl configuration the project's dependency files are generated from scratch and the scan reports:
+# 	- the time of the first (cold) cycle, where every dependency list is built
+# 	- the time and the stat cache lookups of an idle cycle, where no file changed, like a poll of the project's tree
+# 	- the time of the first cycle after a restart of the program, where the existing dependency files are checked
+# 	- whether the dependency files generated are the same as the ones of the first configuration
+# usage: python tools/bench_scan.py [--headers N] [--sources N] [--workers 1,4] [--pools thread,process] [--persistent-cache]
+
+import argparse, contextlib, io, json, os, random, shutil, sys, tempfile, time
+
+# make the program's classes importable, regardless of the current working directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from classes import Application
+
+# creates a synthetic project with "header_count" headers and "source_count" source files
+# each header includes up to 2 of the previous headers and some include a later one, which creates include cycles,
+# or a header that doesn't exist, and each source file includes 3 headers
+def buildTree(root_path, header_count, source_count) :
+	# always create the same project
+	generator = random.Random(7)
+
+	os.makedirs(os.path.join(root_path, "inc"))
+	os.makedirs(os.path.join(root_path, "src"))
+
+	with open(os.path.join(root_path, "dependency_template.txt"), "w") as file_object :
+		file_object.write("$(OBJ)/|!src_file_name!|.o: |!dependents!|\n\t$(CC) $< -o $@\n")
+
+	# create the headers
+	for header_index in range(header_count) :
+		include_names = ["h" + str(include_index) + ".h" for include_index in sorted(generator.sample(range(header_index), min(header_index, 2)))]
+		if (generator.random() < 0.05) :
+			include_names.append("missing.h")
+		if (generator.random() < 0.05 and header_index + 1 < header_count) :
+			include_names.append("h" + str(generator.randrange(header_index + 1, header_count)) + ".h")
+
+		with open(os.path.join(root_path, "inc", "h" + str(header_index) + ".h"), "w") as file_object :
+			file_object.write("".join(["#include \"" + include_name + "\"\n" for include_name in include_names]) + "int x" + str(header_index) + ";\n")
+
+	# create the source files
+	for source_index in range(source_count) :
+		with open(os.path.join(root_path, "src", "s" + str(source_index) + ".c"), "w") as file_object :
+			file_object.write("".join(["#include \"h" + str(include_index) + ".h\"\n" for include_index in generator.sample(range(header_count), min(header_count, 3))]))
+
+# removes the files generated by the program, so the next scan starts from scratch
+def cleanTree(root_path) :
+	for file_basename in os.listdir(os.path.join(root_path, "src")) :
+		if (file_basename.endswith(".d")) :
+			os.remove(os.path.join(root_path, "src", file_basename))
+
+	for file_basename in ("dependency_manifest.json", "dependency_cache.db") :
+		if (os.path.isfile(os.path.join(root_path, file_basename))) :
+			os.remove(os.path.join(root_path, file_basename))
+
+# reads the dependency files generated by the program
+# returns a dict() with format: [dependency file basename] = content
+def readDepFiles(root_path) :
+	dep_files = dict()
+
+	for file_basename in os.listdir(os.path.join(root_path, "src")) :
+		if (file_basename.endswith(".d")) :
+			with open(os.path.join(root_path, "src", file_basename), "r") as file_object :
+				dep_files[file_basename] = file_object.read()
+
+	return(dep_files)
+
+# runs the scan of the source files in the project in the current working directory, with the program's output hidden,
+# until "cycle_count" cycles are done
+# returns a list() with, for each cycle, a tuple(time in seconds, stat cache lookups)
+def runScan(cycle_count) :
+	# stores the final data
+	cycles = list()
+
+	with contextlib.redirect_stdout(io.StringIO()) :
+		app = Application.Application(False)
+
+		# stores the time and the stat cache lookups at the start of the current cycle
+		cycle_start = [time.perf_counter(), 0]
+
+		# the program sleeps at the end of each cycle, so that is where each cycle is measured
+		# NOTE: without the watcher every cycle after the first searches the project's tree, like a poll
+		def endCycle(seconds) :
+			lookups = app.stat_cache.hits + app.stat_cache.misses
+			cycles.append((time.perf_counter() - cycle_start[0], lookups - cycle_start[1]))
+
+			# check if all the cycles are done
+			if (len(cycles) == cycle_count) :
+				# they are, so stop the scan like the user pressing CTRL-C
+				raise KeyboardInterrupt
+
+			cycle_start[0] = time.perf_counter()
+			cycle_start[1] = app.stat_cache.hits + app.stat_cache.misses
+
+		app.startSleep = endCycle
+		app.scanSrcFiles()
+
+	return(cycles)
+
+if (__name__ == "__main__") :
+	# parse the command line arguments
+	arg_parser = argparse.ArgumentParser(description = "Times the scan of the source files of a synthetic project, with several crawl configurations.")
+	arg_parser.add_argument("--headers", type = int, default = 300, help = "number of headers in the synthetic project (default 300)")
+	arg_parser.add_argument("--sources", type = int, default = 400, help = "number of source files in the synthetic project (default 400)")
+	arg_parser.add_argument("--workers", default = "1,4", help = "comma separated values of the \"crawl_workers\" configuration (default 1,4)")
+	arg_parser.add_argument("--pools", default = "thread,process", help = "comma separated values of the \"crawl_pool\" configuration, used with more than 1 worker (default thread,process)")
+	arg_parser.add_argument("--persistent-cache", action = "store_true", help = "turn on the \"persistent_cache\" configuration, so a restart uses the stored crawl information")
+	args = arg_parser.parse_args()
+
+	# build the crawl configurations to run, sequentially first
+	configs = list()
+	for worker_count in [int(worker_count) for worker_count in args.workers.split(",")] :
+		for pool in (["thread"] if worker_count == 1 else args.pools.split(",")) :
+			configs.append((worker_count, pool))
+
+	# create the synthetic project
+	temp_dir = tempfile.mkdtemp(prefix = "bench_scan_")
+	print("Creating a project with " + str(args.headers) + " headers and " + str(args.sources) + " source files in " + temp_dir + "...")
+	buildTree(temp_dir, args.headers, args.sources)
+
+	prev_cwd = os.getcwd()
+	try :
+		os.chdir(temp_dir)
+
+		# stores the dependency files generated with the first configuration
+		ref_dep_files = None
+
+		# loop through each crawl configuration
+		for worker_count, pool in configs :
+			# NOTE: the incomplete lists are used, so the source files reaching the missing header get a dependency file
+			with open("dependency_config.json", "w") as file_object :
+				json.dump(dict(crawl_workers = worker_count, crawl_pool = pool, persistent_cache = args.persistent_cache, use_incomplete_list = True), file_object)
+			cleanTree(temp_dir)
+
+			# scan the project from scratch: a cold cycle followed by idle ones
+			# NOTE: the cycle after the cold one still finds the dependency files written by it as changed files,
+			# 		so the idle cycle measured is the third
+			cold_cycle, next_cycle, idle_cycle = runScan(3)
+
+			# check if the dependency files are the same as the ones of the first configuration
+			dep_files = readDepFiles(temp_dir)
+			if (ref_dep_files == None) :
+				ref_dep_files = dep_files
+			same_files = "yes" if dep_files == ref_dep_files else "NO"
+
+			# restart the program and scan the project again, with the dependency files already generated
+			restart_cycle = runScan(1)[0]
+
+			label = "crawl_workers {0:>2}, {1:<12}".format(worker_count, pool + " pool" if worker_count > 1 else "sequential")
+			print("{0}   cold cycle: {1:>7.2f} s   idle cycle: {2:>6.2f} s, {3:>6} stat cache lookups   restart: {4:>6.2f} s   dependency files: {5}, same as the first configuration: {6}".format(label, cold_cycle[0], idle_cycle[0], idle_cycle[1], restart_cycle[0], len(dep_files), same_files))
+	finally :
+		os.chdir(prev_cwd)
+		shutil.rmtree(temp_dir, ignore_errors = True)
@@ -0,0 +1,182 @@
+############################################################
+#															#
+# C_Cpp_Dependency_Gen v1.0.1								#
+#															#
+# Copyright 2017, PedroHenriques							#
+# http://www.pedrojhenriques.com							#
+# https://github.com/PedroHenriques							#
+#															#
+# Free to use under the MIT license.						#
+# http://www.opensource.org/licenses/mit-license.php		#
+#															#
+############################################################
+
+# benchmark of the directory tree walkers: the recursive General.findFiles() the program used before
+# TreeWalker existed, and TreeWalker.findFiles() walking sequentially and with several threads
+# by default a synthetic tree of 100k files is created in a temporary directory, or an existing tree can be provided
+# usage: python tools/bench_walker.py [--path directory] [--dirs N] [--files N] [--threads 1,2,8] [--repeat N]
+
+import argparse, os, shutil, sys, tempfile, time
+
+# make the program's classes importable, regardless of the current working directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from classes import General, TreeWalker
+
+# copy of the recursive General.findFiles() replaced by TreeWalker, kept to compare the two walkers
+# the only change is that the paths are joined with os.path.join(), so it also runs outside Windows
+# returns a dict() with format: [file basename] = file absolute path
+# NOTE: "basenames" is changed, like in the original
+def oldFindFiles(basenames, path) :
+	# stores the final data
+	files = dict()
+
+	# check if the path is a directory
+	if (not os.path.isdir(path)) :
+		# it isn't, so bail out
+		return(files)
+
+	# grab the contents of the directory pointed by path
+	dir_contents = os.listdir(path)
+
+	# stores the names of the directories found
+	dir_names = set()
+
+	# loop through each item in the directory, checking all the files in the current directory
+	# ends when all files have been checked or all basenames found
+	while len(basenames) > 0 and len(dir_contents) > 0 :
+		# grab the last item in the list
+		cur_item_basename = dir_contents.pop()
+		cur_item_path = os.path.join(path, cur_item_basename)
+
+		# check if the item is a file
+		if (os.path.isfile(cur_item_path)) :
+			# it is a file
+			# get this file's extension
+			aux_pos = cur_item_basename.rfind(".")
+			if (aux_pos == -1) :
+				# this file doesn't have an explicit extension
+				cur_item_extension = ""
+			else :
+				cur_item_extension = cur_item_basename[aux_pos + 1:]
+
+			# check if this file's basename is one of the relevant files
+			if (cur_item_basename in basenames) :
+				# this file is relevant and it's a specific file
+				files[cur_item_basename] = cur_item_path
+
+				# remove this file from the basenames left to find
+				basenames.remove(cur_item_basename)
+			elif ("*." + cur_item_extension in basenames) :
+				# this file is relevant, but it's not a specific file
+				files[cur_item_basename] = cur_item_path
+		else :
+			# it isn't a file
+			# store this directory's name to be checked later, if necessary
+			dir_names.add(cur_item_path)
+
+		# if there are still basenames to be found and the current directory has folders, go through them
+		while len(basenames) > 0 and len(dir_names) > 0 :
+			# grab a path to a folder and call this function recursively to process it
+			files.update(oldFindFiles(basenames, dir_names.pop()))
+
+	# return the final data
+	return(files)
+
+# creates a synthetic tree with "dir_count" directories, nested up to 3 levels deep, each with "file_count" files
+# half of the files are C/C++ files searched for by the benchmark and the other half aren't
+def buildTree(root_path, dir_count, file_count) :
+	for dir_index in range(dir_count) :
+		# spread the directories over 3 levels, so the tree has both wide and deep parts
+		dir_path = os.path.join(root_path, "d" + str(dir_index % 10), "d" + str(dir_index % 7), "d" + str(dir_index))
+		os.makedirs(dir_path, exist_ok = True)
+
+		# create the files
+		for file_index in range(file_count) :
+			if (file_index % 2 == 0) :
+				file_basename = "f" + str(dir_index) + "_" + str(file_index) + (".h" if file_index % 4 == 0 else ".c")
+			else :
+				file_basename = "f" + str(dir_index) + "_" + str(file_index) + ".txt"
+			with open(os.path.join(dir_path, file_basename), "w") as file_object :
+				file_object.write("\n")
+
+# walks the tree with the old walker, getting the modify time and size of each file found, which TreeWalker's
+# records already have and the program had to get with one extra stat per file
+# returns a dict() with format: [file basename] = tuple(file absolute path, modify time, size)
+def walkOld(basenames, root_path) :
+	# stores the final data
+	files = dict()
+
+	found_files = oldFindFiles(set(basenames), root_path)
+	for file_basename in found_files :
+		file_stat = os.stat(found_files[file_basename])
+		files[file_basename] = (found_files[file_basename], file_stat.st_mtime, file_stat.st_size)
+
+	# return the final data
+	return(files)
+
+# walks the tree with TreeWalker, using the current TreeWalker.workers_
+# returns the same data as walkOld()
+def walkNew(basenames, root_path) :
+	found_files = TreeWalker.TreeWalker.findFiles(set(basenames), root_path)
+
+	return(dict([(file_basename, (found_files[file_basename].path, found_files[file_basename].mtime, found_files[file_basename].size)) for file_basename in found_files]))
+
+# walks the tree "repeat" times with a walker
+# returns a tuple(best time in seconds, data returned by the walker)
+def timeWalk(walker, basenames, root_path, repeat) :
+	best_time = None
+	files = None
+	for _ in range(repeat) :
+		start_time = time.perf_counter()
+		files = walker(basenames, root_path)
+		elapsed_time = time.perf_counter() - start_time
+
+		if (best_time == None or elapsed_time < best_time) :
+			best_time = elapsed_time
+
+	return(best_time, files)
+
+if (__name__ == "__main__") :
+	# parse the command line arguments
+	arg_parser = argparse.ArgumentParser(description = "Times the walks of a directory tree by the old recursive walker and by TreeWalker, sequentially and with several threads.")
+	arg_parser.add_argument("--path", help = "directory tree to walk, instead of a synthetic one")
+	arg_parser.add_argument("--dirs", type = int, default = 500, help = "number of directories in the synthetic tree (default 500)")
+	arg_parser.add_argument("--files", type = int, default = 200, help = "number of files in each directory of the synthetic tree (default 200)")
+	arg_parser.add_argument("--threads", default = "1,2,4,8", help = "comma separated numbers of threads TreeWalker walks the tree with (default 1,2,4,8)")
+	arg_parser.add_argument("--repeat", type = int, default = 3, help = "number of walks with each walker, of which the fastest is reported (default 3)")
+	args = arg_parser.parse_args()
+
+	# the basenames searched for, like the program's search for the project's relevant files
+	basenames = set(["*.h", "*.c", "*.cpp"])
+
+	# create the synthetic tree, unless an existing tree was provided
+	temp_dir = None
+	if (args.path == None) :
+		temp_dir = tempfile.mkdtemp(prefix = "bench_walker_")
+		print("Creating a tree with " + str(args.dirs) + " directories of " + str(args.files) + " files in " + temp_dir + "...")
+		buildTree(temp_dir, args.dirs, args.files)
+		root_path = temp_dir
+	else :
+		root_path = args.path
+
+	try :
+		# the walkers expect absolute paths, standardized like the rest of the program does
+		root_path = General.General.standardizePath(os.path.abspath(root_path))
+
+		# walk the tree with the old walker
+		# NOTE: with duplicate basenames each walker keeps a different file, so only the basenames found are compared
+		old_time, old_files = timeWalk(walkOld, basenames, root_path, args.repeat)
+		print("old recursive walker (+ 1 stat per file found)  threads:   1   files found: {0:>7}   best of {1}: {2:>9.1f} ms".format(len(old_files), args.repeat, old_time * 1000))
+
+		# walk the tree with TreeWalker, with each number of threads
+		for worker_count in [int(thread_count) for thread_count in args.threads.split(",")] :
+			TreeWalker.TreeWalker.workers_ = worker_count
+			new_time, new_files = timeWalk(walkNew, basenames, root_path, args.repeat)
+
+			same_files = "yes" if set(new_files) == set(old_files) else "NO"
+			print("TreeWalker                                      threads: {0:>3}   files found: {1:>7}   best of {2}: {3:>9.1f} ms   same files as the old walker: {4}".format(worker_count, len(new_files), args.repeat, new_time * 1000, same_files))
+	finally :
+		# remove the synthetic tree, if it was created
+		if (temp_dir != None) :
+			shutil.rmtree(temp_dir, ignore_errors = True)